@@ -1,7 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.routing import APIRoute
-from .routers import auth, dashboard, entries, history, metadata_schemas, users
+from .routers import auth, dashboard, entries, events, history, metadata_schemas, saved_queries, users
+from .services.events import start_entry_events, stop_entry_events
+from .services.outbox import start_outbox_dispatcher, stop_outbox_dispatcher
+from .services.relation_index import start_relation_index, stop_relation_index
 from .services.users import ensure_default_admin
 
 app = FastAPI(title="DB Manager API")
@@ -22,6 +25,8 @@ app.include_router(metadata_schemas.router)
 app.include_router(entries.router)
 app.include_router(dashboard.router)
 app.include_router(history.router)
+app.include_router(saved_queries.router)
+app.include_router(events.router)
 
 @app.get("/")
 def root():
@@ -32,6 +37,36 @@ def root():
 def bootstrap_admin_user():
     ensure_default_admin()
 
+
+@app.on_event("startup")
+def load_relation_index():
+    start_relation_index()
+
+
+@app.on_event("startup")
+def load_entry_events():
+    start_entry_events()
+
+
+@app.on_event("startup")
+def run_outbox_dispatcher():
+    start_outbox_dispatcher()
+
+
+@app.on_event("shutdown")
+def unload_relation_index():
+    stop_relation_index()
+
+
+@app.on_event("shutdown")
+def unload_entry_events():
+    stop_entry_events()
+
+
+@app.on_event("shutdown")
+def halt_outbox_dispatcher():
+    stop_outbox_dispatcher()
+
 @app.get("/__routes")
 def list_routes():
     routes = []
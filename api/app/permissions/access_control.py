@@ -34,17 +34,37 @@ class AccessControlService:
             group_ids=[str(group_id) for group_id in group_ids],
         )
 
+    def build_query_scope(self, user: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        context = self.build_context(user)
+        return {
+            "is_admin": context.role == ROLE_HEAD_ADMIN,
+            "user_id": context.user_id,
+            "role": context.role,
+        }
+
     def can_access(self, entry: Dict[str, Any], user: Optional[Dict[str, Any]], permission: EntryPermission) -> bool:
         return permission in self.get_effective_permissions(entry, user)
 
-    def get_access_map(self, entry: Dict[str, Any], user: Optional[Dict[str, Any]]) -> Dict[str, bool]:
-        effective_permissions = self.get_effective_permissions(entry, user)
+    def get_access_map(
+        self,
+        entry: Dict[str, Any],
+        user: Optional[Dict[str, Any]],
+        *,
+        grants: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, bool]:
+        effective_permissions = self.get_effective_permissions(entry, user, grants=grants)
         return {
             permission.value: permission in effective_permissions
             for permission in EntryPermission
         }
 
-    def get_effective_permissions(self, entry: Dict[str, Any], user: Optional[Dict[str, Any]]) -> Set[EntryPermission]:
+    def get_effective_permissions(
+        self,
+        entry: Dict[str, Any],
+        user: Optional[Dict[str, Any]],
+        *,
+        grants: Optional[List[Dict[str, Any]]] = None,
+    ) -> Set[EntryPermission]:
         context = self.build_context(user)
         if context.role == ROLE_HEAD_ADMIN:
             return set(EntryPermission)
@@ -57,7 +77,8 @@ class AccessControlService:
         if self._is_visible(entry, context):
             effective_permissions.add(EntryPermission.READ)
 
-        grants = self.permission_repository.list_permissions(entry["id"])
+        if grants is None:
+            grants = self.permission_repository.list_permissions(entry["id"])
         effective_permissions.update(self._collect_matching_grants(grants, context))
         return effective_permissions
 
@@ -6,5 +6,6 @@ from .metadata import (
     PermissionRepository,
     RelationRepository,
     SchemaRepository,
+    SchemaStatsRepository,
 )
 
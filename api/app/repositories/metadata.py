@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from psycopg.errors import UniqueViolation
+from psycopg.sql import SQL, Identifier, Literal
 from psycopg.types.json import Jsonb
 
 from ..core.errors import ConflictError, NotFoundError
@@ -15,6 +17,277 @@ def _jsonb(value: Any):
     return Jsonb(value)
 
 
+def _visible_levels(*, is_admin: bool, user_id: Optional[int]) -> List[str]:
+    if is_admin:
+        return ["private", "internal", "restricted", "public"]
+    if user_id is None:
+        return ["public"]
+    return ["internal", "public"]
+
+
+def _grant_subjects_clause(alias: str, params: Dict[str, Any], *, user_id: int, role: Optional[str]) -> str:
+    params["access_user_id_text"] = str(user_id)
+    subjects = [f"({alias}.subject_type = 'user' AND {alias}.subject_id = %(access_user_id_text)s)"]
+    if role is not None:
+        params["access_role"] = role
+        subjects.append(f"({alias}.subject_type = 'role' AND {alias}.subject_id = %(access_role)s)")
+    return " OR ".join(subjects)
+
+
+def _readable_entries_clause(
+    alias: str,
+    params: Dict[str, Any],
+    *,
+    is_admin: bool,
+    user_id: Optional[int],
+    role: Optional[str],
+) -> str:
+    if is_admin:
+        return "TRUE"
+    if user_id is None:
+        return f"{alias}.visibility_level = 'public'"
+    params["access_user_id"] = user_id
+    grant_subjects = _grant_subjects_clause("ep", params, user_id=user_id, role=role)
+    return f"""(
+        {alias}.owner_id = %(access_user_id)s
+        OR {alias}.visibility_level IN ('public', 'internal')
+        OR (
+            {alias}.visibility_level != 'private'
+            AND EXISTS (
+                SELECT 1
+                FROM entry_permissions ep
+                WHERE ep.entry_id = {alias}.id
+                  AND ({grant_subjects})
+            )
+        )
+    )"""
+
+
+def _once_readable_entries_clause(
+    alias: str,
+    params: Dict[str, Any],
+    *,
+    is_admin: bool,
+    user_id: Optional[int],
+    role: Optional[str],
+) -> str:
+    if is_admin:
+        return "TRUE"
+    if user_id is None:
+        return f"{alias}.widest_visibility = 'public'"
+    params["access_user_id"] = user_id
+    grant_subjects = _grant_subjects_clause("ep", params, user_id=user_id, role=role)
+    former_subjects = _grant_subjects_clause("fr", params, user_id=user_id, role=role)
+    return f"""(
+        {alias}.owner_id = %(access_user_id)s
+        OR {alias}.widest_visibility IN ('public', 'internal')
+        OR EXISTS (SELECT 1 FROM entry_permissions ep WHERE ep.entry_id = {alias}.id AND ({grant_subjects}))
+        OR EXISTS (SELECT 1 FROM entry_former_readers fr WHERE fr.entry_id = {alias}.id AND ({former_subjects}))
+    )"""
+
+
+def _once_readable_tombstones_clause(
+    alias: str,
+    params: Dict[str, Any],
+    *,
+    is_admin: bool,
+    user_id: Optional[int],
+    role: Optional[str],
+) -> str:
+    if is_admin:
+        return "TRUE"
+    if user_id is None:
+        return f"{alias}.widest_visibility = 'public'"
+    params["access_user_id"] = user_id
+    reader_subjects = _grant_subjects_clause("tr", params, user_id=user_id, role=role)
+    return f"""(
+        {alias}.owner_id = %(access_user_id)s
+        OR {alias}.widest_visibility IN ('public', 'internal')
+        OR EXISTS (SELECT 1 FROM entry_tombstone_readers tr WHERE tr.entry_id = {alias}.entry_id AND ({reader_subjects}))
+    )"""
+
+
+def _relation_counts_column(alias: str) -> str:
+    return f"""COALESCE(
+        (SELECT to_jsonb(rc) - 'entry_id' FROM entry_relation_counts rc WHERE rc.entry_id = {alias}.id),
+        jsonb_build_object('total', 0, 'outgoing', '{{}}'::jsonb, 'incoming', '{{}}'::jsonb)
+    ) AS relation_counts"""
+
+
+_RANGE_SQL_OPERATORS = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+
+def _entry_document(alias: str, reference: Dict[str, Any]) -> str:
+    if reference.get("external"):
+        return f"entry_full_data({alias}.id, {alias}.data_json)"
+    return f"{alias}.data_json"
+
+
+def _entry_data_expression(document: str, kind: str, key_param: str) -> str:
+    if kind == "numeric":
+        return f"entry_data_numeric({document}, %({key_param})s)"
+    if kind == "timestamp":
+        return f"entry_data_timestamp({document}, %({key_param})s)"
+    return f"({document} ->> %({key_param})s)"
+
+
+def _promoted_filter_clause(alias: str, condition: Dict[str, Any], params: Dict[str, Any], name: str) -> str:
+    params[f"{name}_field_id"] = condition["field_id"]
+    lookup = f"SELECT 1 FROM entry_field_values v WHERE v.entry_id = {alias}.id AND v.field_id = %({name}_field_id)s"
+    operator = condition["op"]
+    if operator == "null":
+        return f"NOT EXISTS ({lookup})"
+    if operator == "notnull":
+        return f"EXISTS ({lookup})"
+    column = f"v.{condition['value_column']}"
+    if operator in _RANGE_SQL_OPERATORS:
+        params[name] = condition["values"][0]
+        return f"EXISTS ({lookup} AND {column} {_RANGE_SQL_OPERATORS[operator]} %({name})s)"
+    params[name] = condition["values"]
+    return f"EXISTS ({lookup} AND {column} = ANY(%({name})s))"
+
+
+def _entry_filter_clause(alias: str, condition: Dict[str, Any], params: Dict[str, Any], name: str) -> str:
+    if "value_column" in condition:
+        return _promoted_filter_clause(alias, condition, params, name)
+    key_param = f"{name}_key"
+    params[key_param] = condition["key"]
+    operator = condition["op"]
+    document = _entry_document(alias, condition)
+    if operator == "null":
+        return f"COALESCE(jsonb_typeof({document} -> %({key_param})s), 'null') = 'null'"
+    if operator == "notnull":
+        return f"jsonb_typeof({document} -> %({key_param})s) <> 'null'"
+    if operator == "contains":
+        params[name] = Jsonb({condition["key"]: condition["values"]})
+        return f"{document} @> %({name})s"
+    if condition["kind"] == "json":
+        # One containment test per value keeps every branch answerable from the data_json GIN index.
+        tests = []
+        for index, value in enumerate(condition["values"]):
+            params[f"{name}_{index}"] = Jsonb({condition["key"]: value})
+            tests.append(f"{document} @> %({name}_{index})s")
+        return f"({' OR '.join(tests)})"
+    expression = _entry_data_expression(document, condition["kind"], key_param)
+    if operator in _RANGE_SQL_OPERATORS:
+        params[name] = condition["values"][0]
+        return f"{expression} {_RANGE_SQL_OPERATORS[operator]} %({name})s"
+    params[name] = condition["values"]
+    return f"{expression} = ANY(%({name})s)"
+
+
+def _attach_entry_blobs(cur, rows: List[Dict[str, Any]], keys: Optional[List[str]] = None) -> None:
+    if not rows or keys == []:
+        return
+    params: Dict[str, Any] = {"entry_ids": [row["id"] for row in rows]}
+    key_clause = ""
+    if keys is not None:
+        params["keys"] = keys
+        key_clause = "AND field_key = ANY(%(keys)s)"
+    cur.execute(
+        f"SELECT entry_id, field_key, value FROM entry_blobs WHERE entry_id = ANY(%(entry_ids)s) {key_clause};",
+        params,
+    )
+    blobs: Dict[int, Dict[str, Any]] = {}
+    for blob in cur.fetchall():
+        blobs.setdefault(blob["entry_id"], {})[blob["field_key"]] = blob["value"]
+    for row in rows:
+        if row["id"] in blobs:
+            row["data_json"] = {**(row.get("data_json") or {}), **blobs[row["id"]]}
+
+
+def _projected_blob_keys(projection: Optional[Dict[str, Any]]) -> Optional[List[str]]:
+    if projection is None or "data_json" not in projection["columns"]:
+        return []
+    return projection["data_keys"]
+
+
+_ENTRY_ACCESS_COLUMNS = ("id", "owner_id", "visibility_level")
+
+
+def _entry_data_projection(alias: str, data_keys: Optional[List[str]], params: Dict[str, Any]) -> str:
+    if data_keys is None:
+        return f"{alias}.data_json"
+    params["projection_keys"] = data_keys
+    return f"""COALESCE(
+        (
+            SELECT jsonb_object_agg(k.key, {alias}.data_json -> k.key)
+            FROM unnest(%(projection_keys)s::text[]) AS k(key)
+            WHERE {alias}.data_json ? k.key
+        ),
+        '{{}}'::jsonb
+    ) AS data_json"""
+
+
+def _entry_select_list(alias: str, projection: Optional[Dict[str, Any]], params: Dict[str, Any]) -> str:
+    if projection is None:
+        return f"{alias}.*"
+    # Access checks run on the projected rows, so their columns are always fetched.
+    parts: List[str] = []
+    for column in dict.fromkeys([*_ENTRY_ACCESS_COLUMNS, *projection["columns"]]):
+        if column == "relation_counts":
+            parts.append(_relation_counts_column(alias))
+        elif column == "data_json":
+            parts.append(_entry_data_projection(alias, projection["data_keys"], params))
+        else:
+            parts.append(f"{alias}.{column}")
+    return ", ".join(parts)
+
+
+def _entry_list_query(
+    params: Dict[str, Any],
+    *,
+    schema_id: Optional[int],
+    owner_id: Optional[int] = None,
+    filters: Optional[List[Dict[str, Any]]] = None,
+    sort: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[str], str]:
+    clauses = ["e.deleted_at IS NULL"]
+    if schema_id is not None:
+        clauses.append("e.schema_id = %(schema_id)s")
+        params["schema_id"] = schema_id
+    if owner_id is not None:
+        clauses.append("e.owner_id = %(owner_id)s")
+        params["owner_id"] = owner_id
+    for index, condition in enumerate(filters or []):
+        clauses.append(_entry_filter_clause("e", condition, params, f"filter_{index}"))
+    order_by = "e.updated_at DESC NULLS LAST, e.id DESC"
+    if sort is not None:
+        # NULLs sort as the largest value and id follows the sort direction, so a forward or backward scan of the
+        # (expression, id) field index returns rows already in order.
+        expression = _entry_sort_expression("e", sort, params)
+        if sort["descending"]:
+            order_by = f"{expression} DESC NULLS FIRST, e.id DESC"
+        else:
+            order_by = f"{expression} ASC NULLS LAST, e.id ASC"
+    return clauses, order_by
+
+
+def _field_index_name(field_id: int) -> str:
+    return f"idx_entries_field_{field_id}"
+
+
+def _field_index_expression(kind: str, key: str) -> SQL:
+    if kind == "numeric":
+        return SQL("entry_data_numeric(data_json, {})").format(Literal(key))
+    if kind == "timestamp":
+        return SQL("entry_data_timestamp(data_json, {})").format(Literal(key))
+    return SQL("(data_json ->> {})").format(Literal(key))
+
+
+def _entry_sort_expression(alias: str, sort: Dict[str, Any], params: Dict[str, Any]) -> str:
+    if "column" in sort:
+        return f"{alias}.{sort['column']}"
+    if "value_column" in sort:
+        params["sort_field_id"] = sort["field_id"]
+        return (
+            f"(SELECT sv.{sort['value_column']} FROM entry_field_values sv "
+            f"WHERE sv.entry_id = {alias}.id AND sv.field_id = %(sort_field_id)s)"
+        )
+    params["sort_key"] = sort["key"]
+    return _entry_data_expression(_entry_document(alias, sort), sort["kind"], "sort_key")
+
+
 class SchemaRepository:
     def list_schemas(self, *, include_inactive: bool = False) -> List[Dict[str, Any]]:
         sql = "SELECT * FROM schemas"
@@ -162,6 +435,141 @@ class FieldRepository:
             raise NotFoundError("Field not found")
         return row
 
+    def count_long_field_values(self, schema_id: int, key: str, max_length: int) -> int:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT count(*) AS total FROM entries WHERE schema_id=%s AND char_length(data_json ->> %s) > %s;",
+                (schema_id, key, max_length),
+            )
+            return cur.fetchone()["total"]
+
+    def list_field_promotions(self, schema_id: int) -> List[Dict[str, Any]]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT * FROM field_promotions WHERE schema_id=%s ORDER BY field_id;", (schema_id,))
+            return cur.fetchall()
+
+    def list_promoted_field_ids(self, schema_id: int) -> Set[int]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT field_id FROM field_promotions WHERE schema_id=%s AND status='ready';", (schema_id,))
+            return {row["field_id"] for row in cur.fetchall()}
+
+    def mark_field_promotion(self, schema_id: int, field_id: int, status: str) -> None:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO field_promotions (field_id, schema_id, status)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (field_id) DO UPDATE SET status = EXCLUDED.status, updated_at = NOW();
+                """,
+                (field_id, schema_id, status),
+            )
+            conn.commit()
+
+    def remove_field_promotion(self, field_id: int) -> None:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("DELETE FROM field_promotions WHERE field_id=%s;", (field_id,))
+            cur.execute("DELETE FROM entry_field_values WHERE field_id=%s;", (field_id,))
+            conn.commit()
+
+    def backfill_field_values(self, schema_id: int, field_id: int, *, batch_size: int = 500) -> None:
+        last_id = 0
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT updated_at FROM field_promotions WHERE field_id = %s;", (field_id,))
+            promotion = cur.fetchone()
+            if promotion is None:
+                return
+            while True:
+                cur.execute(
+                    """
+                    WITH batch AS (
+                        SELECT id, schema_id, data_json
+                        FROM entries
+                        WHERE schema_id = %(schema_id)s AND id > %(last_id)s
+                        ORDER BY id
+                        LIMIT %(batch_size)s
+                    )
+                    SELECT id, entry_field_values_refresh(id, schema_id, entry_full_data(id, data_json), %(field_id)s)
+                    FROM batch
+                    ORDER BY id;
+                    """,
+                    {"schema_id": schema_id, "field_id": field_id, "last_id": last_id, "batch_size": batch_size},
+                )
+                rows = cur.fetchall()
+                conn.commit()
+                if not rows:
+                    break
+                last_id = rows[-1]["id"]
+            # Writes during the backfill were kept current by the trigger; a newer change has queued its own backfill.
+            cur.execute(
+                """
+                UPDATE field_promotions SET status = 'ready', updated_at = NOW()
+                WHERE field_id = %s AND updated_at = %s;
+                """,
+                (field_id, promotion["updated_at"]),
+            )
+            conn.commit()
+
+    def list_field_indexes(self, schema_id: int) -> List[Dict[str, Any]]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT * FROM field_indexes WHERE schema_id=%s ORDER BY field_id;", (schema_id,))
+            return cur.fetchall()
+
+    def mark_field_index(self, schema_id: int, field_id: int, status: str, error: Optional[str] = None) -> None:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO field_indexes (field_id, schema_id, index_name, status, error)
+                VALUES (%(field_id)s, %(schema_id)s, %(index_name)s, %(status)s, %(error)s)
+                ON CONFLICT (field_id) DO UPDATE SET
+                    status = EXCLUDED.status,
+                    error = EXCLUDED.error,
+                    updated_at = NOW();
+                """,
+                {
+                    "field_id": field_id,
+                    "schema_id": schema_id,
+                    "index_name": _field_index_name(field_id),
+                    "status": status,
+                    "error": error,
+                },
+            )
+            conn.commit()
+
+    def build_field_index(self, schema_id: int, field_id: int, *, key: str, kind: str) -> None:
+        index_name = Identifier(_field_index_name(field_id))
+        # CONCURRENTLY cannot run inside a transaction block; the advisory lock serializes rebuilds of one field.
+        with get_connection() as conn:
+            conn.autocommit = True
+            conn.execute("SELECT pg_advisory_lock(hashtext('field_indexes'), %s::int);", (field_id,))
+            try:
+                self.mark_field_index(schema_id, field_id, "building")
+                conn.execute(SQL("DROP INDEX CONCURRENTLY IF EXISTS {};").format(index_name))
+                try:
+                    conn.execute(
+                        SQL(
+                            "CREATE INDEX CONCURRENTLY {} ON entries (({}), id) "
+                            "WHERE schema_id = {} AND deleted_at IS NULL;"
+                        ).format(index_name, _field_index_expression(kind, key), Literal(schema_id))
+                    )
+                except Exception as exc:
+                    # A failed concurrent build leaves an invalid index behind.
+                    conn.execute(SQL("DROP INDEX CONCURRENTLY IF EXISTS {};").format(index_name))
+                    self.mark_field_index(schema_id, field_id, "failed", str(exc))
+                    return
+                self.mark_field_index(schema_id, field_id, "ready")
+            finally:
+                conn.execute("SELECT pg_advisory_unlock(hashtext('field_indexes'), %s::int);", (field_id,))
+
+    def drop_field_index(self, field_id: int) -> None:
+        with get_connection() as conn:
+            conn.autocommit = True
+            conn.execute("SELECT pg_advisory_lock(hashtext('field_indexes'), %s::int);", (field_id,))
+            try:
+                conn.execute(SQL("DROP INDEX CONCURRENTLY IF EXISTS {};").format(Identifier(_field_index_name(field_id))))
+                conn.execute("DELETE FROM field_indexes WHERE field_id=%s;", (field_id,))
+            finally:
+                conn.execute("SELECT pg_advisory_unlock(hashtext('field_indexes'), %s::int);", (field_id,))
+
 
 class EntryRepository:
     def create_entry(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -181,55 +589,823 @@ class EntryRepository:
                 record,
             )
             row = cur.fetchone()
+            _attach_entry_blobs(cur, [row])
             conn.commit()
         row["data_json"] = row.get("data_json") or {}
         return row
 
     def get_entry(self, entry_id: int) -> Dict[str, Any]:
         with get_connection() as conn, conn.cursor() as cur:
-            cur.execute("SELECT * FROM entries WHERE id=%s;", (entry_id,))
-            row = cur.fetchone()
-        if not row:
-            raise NotFoundError("Entry not found")
-        row["data_json"] = row.get("data_json") or {}
-        return row
+            cur.execute("SELECT * FROM entries WHERE id=%s;", (entry_id,))
+            row = cur.fetchone()
+            if row:
+                _attach_entry_blobs(cur, [row])
+        if not row:
+            raise NotFoundError("Entry not found")
+        row["data_json"] = row.get("data_json") or {}
+        return row
+
+    def get_entry_bundle(self, entry_id: int) -> Dict[str, Any]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                WITH related AS (
+                    SELECT r.*
+                    FROM entry_relations r
+                    WHERE r.from_entry_id = %(entry_id)s OR r.to_entry_id = %(entry_id)s
+                )
+                SELECT
+                    e.*,
+                    {_relation_counts_column("e")},
+                    (SELECT to_jsonb(s) FROM schemas s WHERE s.id = e.schema_id) AS bundle_schema,
+                    (
+                        SELECT COALESCE(jsonb_agg(to_jsonb(f) ORDER BY f.sort_order, f.id), '[]'::jsonb)
+                        FROM fields f
+                        WHERE f.schema_id = e.schema_id
+                    ) AS bundle_fields,
+                    (
+                        SELECT COALESCE(jsonb_agg(to_jsonb(r) ORDER BY r.sort_order, r.id), '[]'::jsonb)
+                        FROM related r
+                    ) AS bundle_relations,
+                    (
+                        SELECT COALESCE(
+                            jsonb_agg(
+                                jsonb_build_object(
+                                    'id', t.id,
+                                    'title', t.title,
+                                    'schema_id', ts.id,
+                                    'schema_key', ts.key,
+                                    'schema_name', ts.name
+                                )
+                                ORDER BY t.title, t.id
+                            ),
+                            '[]'::jsonb
+                        )
+                        FROM entries t
+                        JOIN schemas ts ON ts.id = t.schema_id
+                        WHERE t.id IN (
+                            SELECT CASE WHEN r.from_entry_id = e.id THEN r.to_entry_id ELSE r.from_entry_id END
+                            FROM related r
+                        )
+                    ) AS bundle_relation_targets,
+                    (
+                        SELECT COALESCE(jsonb_agg(to_jsonb(a) ORDER BY a.uploaded_at DESC, a.id DESC), '[]'::jsonb)
+                        FROM attachments a
+                        WHERE a.entry_id = e.id
+                    ) AS bundle_attachments,
+                    (
+                        SELECT COALESCE(jsonb_agg(to_jsonb(p) ORDER BY p.id), '[]'::jsonb)
+                        FROM entry_permissions p
+                        WHERE p.entry_id = e.id
+                    ) AS bundle_permissions,
+                    (
+                        SELECT COALESCE(jsonb_agg(to_jsonb(h) ORDER BY h.changed_at DESC, h.id DESC), '[]'::jsonb)
+                        FROM entry_history h
+                        WHERE h.entry_id = e.id
+                    ) AS bundle_history
+                FROM entries e
+                WHERE e.id = %(entry_id)s;
+                """,
+                {"entry_id": entry_id},
+            )
+            row = cur.fetchone()
+            if row:
+                _attach_entry_blobs(cur, [row])
+        if not row:
+            raise NotFoundError("Entry not found")
+
+        schema = row.pop("bundle_schema")
+        schema["fields"] = row.pop("bundle_fields")
+        relations = row.pop("bundle_relations")
+        for relation in relations:
+            relation["metadata_json"] = relation.get("metadata_json") or {}
+        history = row.pop("bundle_history")
+        for item in history:
+            item["old_data_json"] = item.get("old_data_json") or {}
+            item["new_data_json"] = item.get("new_data_json") or {}
+        bundle = {
+            "schema": schema,
+            "relations": relations,
+            "relation_targets": row.pop("bundle_relation_targets"),
+            "attachments": row.pop("bundle_attachments"),
+            "permissions": row.pop("bundle_permissions"),
+            "history": history,
+        }
+        row["data_json"] = row.get("data_json") or {}
+        bundle["entry"] = row
+        return bundle
+
+    def list_entries_with_grants(self, entry_ids: List[int]) -> List[Dict[str, Any]]:
+        if not entry_ids:
+            return []
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    e.*,
+                    {_relation_counts_column("e")},
+                    (
+                        SELECT COALESCE(jsonb_agg(to_jsonb(p) ORDER BY p.id), '[]'::jsonb)
+                        FROM entry_permissions p
+                        WHERE p.entry_id = e.id
+                    ) AS grants
+                FROM entries e
+                WHERE e.id = ANY(%s);
+                """,
+                (entry_ids,),
+            )
+            rows = cur.fetchall()
+            _attach_entry_blobs(cur, rows)
+        for row in rows:
+            row["data_json"] = row.get("data_json") or {}
+        return rows
+
+    def list_entry_access(self, entry_ids: List[int]) -> List[Dict[str, Any]]:
+        if not entry_ids:
+            return []
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT
+                    e.id,
+                    e.schema_id,
+                    e.owner_id,
+                    e.visibility_level,
+                    (
+                        SELECT COALESCE(jsonb_agg(to_jsonb(p) ORDER BY p.id), '[]'::jsonb)
+                        FROM entry_permissions p
+                        WHERE p.entry_id = e.id
+                    ) AS grants
+                FROM entries e
+                WHERE e.id = ANY(%s);
+                """,
+                (entry_ids,),
+            )
+            return cur.fetchall()
+
+    def list_bundle_sections(self, entry_ids: List[int], *, history_entry_ids: List[int]) -> Dict[str, List[Dict[str, Any]]]:
+        queries = {
+            "schemas": (
+                "SELECT * FROM schemas WHERE id IN (SELECT schema_id FROM entries WHERE id = ANY(%(ids)s)) ORDER BY id;",
+                {"ids": entry_ids},
+            ),
+            "fields": (
+                """
+                SELECT * FROM fields
+                WHERE schema_id IN (SELECT schema_id FROM entries WHERE id = ANY(%(ids)s))
+                ORDER BY schema_id, sort_order, id;
+                """,
+                {"ids": entry_ids},
+            ),
+            "relations": (
+                """
+                SELECT * FROM entry_relations
+                WHERE from_entry_id = ANY(%(ids)s) OR to_entry_id = ANY(%(ids)s)
+                ORDER BY sort_order, id;
+                """,
+                {"ids": entry_ids},
+            ),
+            "relation_targets": (
+                """
+                SELECT
+                    e.id,
+                    e.title,
+                    s.id AS schema_id,
+                    s.key AS schema_key,
+                    s.name AS schema_name
+                FROM entries e
+                JOIN schemas s ON s.id = e.schema_id
+                WHERE e.id IN (
+                    SELECT to_entry_id FROM entry_relations WHERE from_entry_id = ANY(%(ids)s)
+                    UNION
+                    SELECT from_entry_id FROM entry_relations WHERE to_entry_id = ANY(%(ids)s)
+                )
+                ORDER BY e.title, e.id;
+                """,
+                {"ids": entry_ids},
+            ),
+            "attachments": (
+                "SELECT * FROM attachments WHERE entry_id = ANY(%(ids)s) ORDER BY uploaded_at DESC, id DESC;",
+                {"ids": entry_ids},
+            ),
+            "history": (
+                "SELECT * FROM entry_history WHERE entry_id = ANY(%(ids)s) ORDER BY changed_at DESC, id DESC;",
+                {"ids": history_entry_ids},
+            ),
+        }
+        with get_connection() as conn:
+            cursors = {}
+            with conn.pipeline():
+                for name, (sql, params) in queries.items():
+                    cursors[name] = conn.cursor()
+                    cursors[name].execute(sql, params)
+            sections = {name: cur.fetchall() for name, cur in cursors.items()}
+        for relation in sections["relations"]:
+            relation["metadata_json"] = relation.get("metadata_json") or {}
+        for item in sections["history"]:
+            item["old_data_json"] = item.get("old_data_json") or {}
+            item["new_data_json"] = item.get("new_data_json") or {}
+        return sections
+
+    def list_entries(
+        self,
+        *,
+        schema_id: Optional[int] = None,
+        owner_id: Optional[int] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {}
+        clauses, order_by = _entry_list_query(params, schema_id=schema_id, owner_id=owner_id, filters=filters, sort=sort)
+        sql = (
+            f"SELECT {_entry_select_list('e', projection, params)} FROM entries e "
+            f"WHERE {' AND '.join(clauses)} ORDER BY {order_by}"
+        )
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+            _attach_entry_blobs(cur, rows, _projected_blob_keys(projection))
+        for row in rows:
+            if "data_json" in row:
+                row["data_json"] = row["data_json"] or {}
+        return rows
+
+    def list_entries_by_ids(
+        self,
+        entry_ids: List[int],
+        *,
+        limit: int,
+        offset: int,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        if not entry_ids:
+            return {"items": [], "total": 0}
+        params: Dict[str, Any] = {"entry_ids": entry_ids, "limit": limit, "offset": offset}
+        base_from_sql = f"""
+            FROM unnest(%(entry_ids)s::bigint[]) WITH ORDINALITY AS ids(id, position)
+            JOIN entries e ON e.id = ids.id
+            WHERE e.deleted_at IS NULL
+              AND {_readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role)}
+        """
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(f"SELECT COUNT(*) AS total {base_from_sql};", params)
+            total = cur.fetchone()["total"]
+            cur.execute(
+                f"""
+                SELECT {_entry_select_list("e", projection, params)}
+                {base_from_sql}
+                ORDER BY ids.position
+                LIMIT %(limit)s OFFSET %(offset)s;
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+            _attach_entry_blobs(cur, rows, _projected_blob_keys(projection))
+        for row in rows:
+            if "data_json" in row:
+                row["data_json"] = row["data_json"] or {}
+        return {"items": rows, "total": total}
+
+    def list_entry_changes(
+        self,
+        *,
+        after_seq: int,
+        after_id: int,
+        limit: int,
+        schema_id: Optional[int] = None,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"after_seq": after_seq, "after_id": after_id, "limit": limit}
+        readable_clause = _readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role)
+        once_readable_clause = _once_readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role)
+        # Rows written by transactions that may still be running are left for the next call.
+        clauses = [
+            "e.change_seq < pg_snapshot_xmin(pg_current_snapshot())::text::bigint",
+            "(e.change_seq, e.id) > (%(after_seq)s, %(after_id)s)",
+        ]
+        if schema_id is not None:
+            params["schema_id"] = schema_id
+            clauses.append("e.schema_id = %(schema_id)s")
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    e.*,
+                    e.deleted_at IS NULL AND {readable_clause} AS readable,
+                    -- An unreadable row is only a removal if its access changed since the cursor and the caller
+                    -- could have read it at some point; anything else was never in the caller's copy.
+                    e.access_changed_seq >= %(after_seq)s AND {once_readable_clause} AS removed
+                FROM entries e
+                WHERE {" AND ".join(clauses)}
+                ORDER BY e.change_seq, e.id
+                LIMIT %(limit)s;
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+            _attach_entry_blobs(cur, [row for row in rows if row["readable"]])
+            # Hard-deleted entries only survive as tombstones; they share the (change_seq, id) order.
+            tombstone_clauses = [
+                "t.change_seq < pg_snapshot_xmin(pg_current_snapshot())::text::bigint",
+                "(t.change_seq, t.entry_id) > (%(after_seq)s, %(after_id)s)",
+            ]
+            if schema_id is not None:
+                tombstone_clauses.append("t.schema_id = %(schema_id)s")
+            tombstone_readable = _once_readable_tombstones_clause(
+                "t", params, is_admin=is_admin, user_id=user_id, role=role
+            )
+            cur.execute(
+                f"""
+                SELECT t.entry_id AS id, t.schema_id, t.change_seq, FALSE AS readable, {tombstone_readable} AS removed
+                FROM entry_tombstones t
+                WHERE {" AND ".join(tombstone_clauses)}
+                ORDER BY t.change_seq, t.entry_id
+                LIMIT %(limit)s;
+                """,
+                params,
+            )
+            tombstones = cur.fetchall()
+        for row in rows:
+            row["data_json"] = row.get("data_json") or {}
+        if tombstones:
+            rows = sorted(rows + tombstones, key=lambda row: (row["change_seq"], row["id"]))[:limit]
+        return rows
+
+    def list_entry_ids(
+        self,
+        *,
+        schema_id: int,
+        filters: List[Dict[str, Any]],
+        sort: Optional[Dict[str, Any]],
+        candidate_ids: Optional[List[int]] = None,
+        changed_since: Optional[datetime] = None,
+    ) -> List[int]:
+        params: Dict[str, Any] = {}
+        clauses, order_by = _entry_list_query(params, schema_id=schema_id, filters=filters, sort=sort)
+        if candidate_ids is not None:
+            # Incremental refresh: only the previous result and entries changed since the watermark can qualify.
+            params["candidate_ids"] = candidate_ids
+            params["changed_since"] = changed_since
+            clauses.append(
+                """
+                e.id IN (
+                    SELECT unnest(%(candidate_ids)s::bigint[])
+                    UNION
+                    SELECT c.id FROM entries c
+                    WHERE c.schema_id = %(schema_id)s AND COALESCE(c.updated_at, c.created_at) >= %(changed_since)s
+                )
+                """
+            )
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(f"SELECT e.id FROM entries e WHERE {' AND '.join(clauses)} ORDER BY {order_by};", params)
+            return [row["id"] for row in cur.fetchall()]
+
+    def get_schema_watermark(self, schema_id: int) -> Optional[datetime]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT MAX(COALESCE(updated_at, created_at)) AS watermark FROM entries WHERE schema_id=%s;",
+                (schema_id,),
+            )
+            return cur.fetchone()["watermark"]
+
+    def list_entry_lookup_by_ids(self, entry_ids: List[int]) -> List[Dict[str, Any]]:
+        if not entry_ids:
+            return []
+
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT
+                    e.id,
+                    e.title,
+                    s.id AS schema_id,
+                    s.key AS schema_key,
+                    s.name AS schema_name
+                FROM entries e
+                JOIN schemas s ON s.id = e.schema_id
+                WHERE e.id = ANY(%s)
+                ORDER BY e.title, e.id;
+                """,
+                (entry_ids,),
+            )
+            return cur.fetchall()
+
+    def search_entry_lookup(
+        self,
+        *,
+        search: Optional[str],
+        schema_id: Optional[int],
+        limit: int,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"limit": limit}
+        conditions = [
+            "e.deleted_at IS NULL",
+            _readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role),
+        ]
+        if schema_id is not None:
+            params["schema_id"] = schema_id
+            conditions.append("e.schema_id = %(schema_id)s")
+        order_by = "e.updated_at DESC NULLS LAST, e.id DESC"
+        candidates_sql = ""
+        from_sql = "entries e"
+        if search:
+            params["search"] = search
+            params["pattern"] = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            branch_schema = " AND schema_id = %(schema_id)s" if schema_id is not None else ""
+            # One branch per index (search document GIN, title trigram, schema id) instead of an OR across joined
+            # tables, which the planner can only answer with a scan; prefix matching covers typeahead and ILIKE
+            # keeps infix matches the tokenizer would miss.
+            candidates_sql = f"""
+                WITH candidates AS (
+                    SELECT entry_id AS id FROM entry_search_documents
+                    WHERE document @@ entry_search_prefix_query(%(search)s)
+                    UNION
+                    SELECT id FROM entries
+                    WHERE deleted_at IS NULL AND title ILIKE %(pattern)s{branch_schema}
+                    UNION
+                    SELECT id FROM entries
+                    WHERE deleted_at IS NULL{branch_schema}
+                      AND schema_id IN (SELECT id FROM schemas WHERE key ILIKE %(pattern)s OR name ILIKE %(pattern)s)
+                )
+            """
+            from_sql = "candidates c JOIN entries e ON e.id = c.id"
+            order_by = f"COALESCE(ts_rank(d.document, entry_search_prefix_query(%(search)s)), 0) DESC, {order_by}"
+        where = " AND ".join(conditions)
+        data_column = ""
+        if projection is not None and "data_json" in projection["columns"]:
+            data_column = f", {_entry_data_projection('e', projection['data_keys'], params)}"
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                {candidates_sql}
+                SELECT
+                    e.id,
+                    e.title,
+                    s.id AS schema_id,
+                    s.key AS schema_key,
+                    s.name AS schema_name
+                    {data_column}
+                FROM {from_sql}
+                JOIN schemas s ON s.id = e.schema_id
+                LEFT JOIN entry_search_documents d ON d.entry_id = e.id
+                WHERE {where}
+                ORDER BY {order_by}
+                LIMIT %(limit)s;
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+            _attach_entry_blobs(cur, rows, _projected_blob_keys(projection))
+            return rows
+
+    def search_entries(
+        self,
+        *,
+        search: str,
+        schema_id: Optional[int],
+        limit: int,
+        offset: int,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"search": search, "limit": limit, "offset": offset}
+        conditions = [
+            "e.deleted_at IS NULL",
+            "d.document @@ entry_search_prefix_query(%(search)s)",
+            _readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role),
+        ]
+        if schema_id is not None:
+            params["schema_id"] = schema_id
+            conditions.append("e.schema_id = %(schema_id)s")
+        base_from_sql = f"""
+            FROM entry_search_documents d
+            JOIN entries e ON e.id = d.entry_id
+            WHERE {" AND ".join(conditions)}
+        """
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(f"SELECT COUNT(*) AS total {base_from_sql};", params)
+            total = cur.fetchone()["total"]
+            # Headlines are only built for the page, they re-parse the whole text.
+            cur.execute(
+                f"""
+                WITH page AS (
+                    SELECT
+                        e.id,
+                        e.title,
+                        e.schema_id,
+                        e.data_json,
+                        ts_rank(d.document, entry_search_prefix_query(%(search)s)) AS rank,
+                        e.updated_at
+                    {base_from_sql}
+                    ORDER BY rank DESC, e.updated_at DESC NULLS LAST, e.id DESC
+                    LIMIT %(limit)s OFFSET %(offset)s
+                )
+                SELECT
+                    p.id,
+                    p.title,
+                    s.id AS schema_id,
+                    s.key AS schema_key,
+                    s.name AS schema_name,
+                    p.rank,
+                    ts_headline(
+                        'simple',
+                        entry_search_content(p.schema_id, p.title, entry_full_data(p.id, p.data_json)),
+                        entry_search_prefix_query(%(search)s),
+                        'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5'
+                    ) AS headline
+                FROM page p
+                JOIN schemas s ON s.id = p.schema_id
+                ORDER BY p.rank DESC, p.updated_at DESC NULLS LAST, p.id DESC;
+                """,
+                params,
+            )
+            items = cur.fetchall()
+        return {"items": items, "limit": limit, "offset": offset, "total": total}
+
+    def aggregate_entries(
+        self,
+        schema_id: int,
+        *,
+        group_by: List[Dict[str, Any]],
+        metrics: List[Dict[str, Any]],
+        filters: List[Dict[str, Any]],
+        limit: int,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"schema_id": schema_id, "limit": limit}
+        conditions = [
+            "e.schema_id = %(schema_id)s",
+            "e.deleted_at IS NULL",
+            _readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role),
+        ]
+        for index, condition in enumerate(filters):
+            conditions.append(_entry_filter_clause("e", condition, params, f"filter_{index}"))
+
+        joins: List[str] = []
+
+        def value_expression(reference: Dict[str, Any], name: str) -> str:
+            if "value_column" in reference:
+                params[f"{name}_field_id"] = reference["field_id"]
+                joins.append(
+                    f"LEFT JOIN entry_field_values {name} ON {name}.entry_id = e.id AND {name}.field_id = %({name}_field_id)s"
+                )
+                return f"{name}.{reference['value_column']}"
+            params[f"{name}_key"] = reference["key"]
+            document = _entry_document("e", reference)
+            if reference["kind"] == "boolean":
+                # Values left over from before a retype to boolean are grouped as null instead of failing the cast.
+                return (
+                    f"CASE WHEN jsonb_typeof({document} -> %({name}_key)s) = 'boolean' "
+                    f"THEN ({document} ->> %({name}_key)s)::boolean END"
+                )
+            return _entry_data_expression(document, reference["kind"], f"{name}_key")
+
+        select_list: List[str] = []
+        for index, group in enumerate(group_by):
+            expression = value_expression(group, f"g{index}")
+            if group["bucket"] is not None:
+                params[f"g{index}_bucket"] = group["bucket"]
+                expression = f"(date_trunc(%(g{index}_bucket)s, {expression}, 'UTC') AT TIME ZONE 'UTC')::date"
+            select_list.append(f"{expression} AS g{index}")
+        for index, metric in enumerate(metrics):
+            if metric["name"] == "count":
+                select_list.append(f"COUNT(*) AS m{index}")
+            else:
+                expression = f"{metric['function'].upper()}({value_expression(metric, f'm{index}v')})"
+                if metric.get("date_only"):
+                    expression = f"({expression} AT TIME ZONE 'UTC')::date"
+                select_list.append(f"{expression} AS m{index}")
+
+        positions = ", ".join(str(position) for position in range(1, len(group_by) + 1))
+        grouping = f"GROUP BY {positions} ORDER BY {positions}" if group_by else ""
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT {", ".join(select_list)}
+                FROM entries e
+                {" ".join(joins)}
+                WHERE {" AND ".join(conditions)}
+                {grouping}
+                LIMIT %(limit)s;
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+        return [
+            {
+                "keys": {group["name"]: row[f"g{index}"] for index, group in enumerate(group_by)},
+                "values": {metric["name"]: row[f"m{index}"] for index, metric in enumerate(metrics)},
+            }
+            for row in rows
+        ]
+
+    def facet_entries(
+        self,
+        schema_id: int,
+        *,
+        single_keys: List[str],
+        multi_keys: List[str],
+        filters: List[Dict[str, Any]],
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"schema_id": schema_id, "single_keys": single_keys, "multi_keys": multi_keys}
+        conditions = [
+            "e.schema_id = %(schema_id)s",
+            "e.deleted_at IS NULL",
+            _readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role),
+        ]
+        for index, condition in enumerate(filters):
+            conditions.append(_entry_filter_clause("e", condition, params, f"filter_{index}"))
+
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                WITH matched AS MATERIALIZED (
+                    SELECT e.status, e.data_json
+                    FROM entries e
+                    WHERE {" AND ".join(conditions)}
+                )
+                SELECT 'total' AS source, NULL::text AS field_key, NULL::jsonb AS value, COUNT(*) AS count
+                FROM matched
+                UNION ALL
+                SELECT 'status', NULL, to_jsonb(m.status), COUNT(*)
+                FROM matched m
+                GROUP BY m.status
+                UNION ALL
+                SELECT 'field', facet.field_key, facet.value, COUNT(*)
+                FROM matched m
+                CROSS JOIN LATERAL (
+                    SELECT k.key AS field_key, m.data_json -> k.key AS value
+                    FROM unnest(%(single_keys)s::text[]) AS k(key)
+                    UNION ALL
+                    SELECT DISTINCT k.key, item.value
+                    FROM unnest(%(multi_keys)s::text[]) AS k(key)
+                    CROSS JOIN LATERAL jsonb_array_elements(
+                        CASE WHEN jsonb_typeof(m.data_json -> k.key) = 'array' THEN m.data_json -> k.key ELSE '[]'::jsonb END
+                    ) AS item(value)
+                ) facet
+                WHERE jsonb_typeof(facet.value) IN ('string', 'number', 'boolean')
+                GROUP BY facet.field_key, facet.value;
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+
+        result: Dict[str, Any] = {"total": 0, "status": {}, "fields": {key: {} for key in [*single_keys, *multi_keys]}}
+        for row in rows:
+            if row["source"] == "total":
+                result["total"] = row["count"]
+            elif row["source"] == "status":
+                result["status"][row["value"]] = row["count"]
+            else:
+                result["fields"][row["field_key"]][row["value"]] = row["count"]
+        return result
+
+    def rebuild_search_documents(self, schema_id: int, *, batch_size: int = 500) -> int:
+        last_id = 0
+        refreshed = 0
+        with get_connection() as conn, conn.cursor() as cur:
+            while True:
+                cur.execute(
+                    """
+                    WITH batch AS (
+                        SELECT id, schema_id, title, data_json
+                        FROM entries
+                        WHERE schema_id = %(schema_id)s AND id > %(last_id)s
+                        ORDER BY id
+                        LIMIT %(batch_size)s
+                    )
+                    INSERT INTO entry_search_documents (entry_id, document)
+                    SELECT id, entry_search_document(schema_id, title, entry_full_data(id, data_json))
+                    FROM batch
+                    ON CONFLICT (entry_id) DO UPDATE SET document = EXCLUDED.document
+                    RETURNING entry_id;
+                    """,
+                    {"schema_id": schema_id, "last_id": last_id, "batch_size": batch_size},
+                )
+                rows = cur.fetchall()
+                conn.commit()
+                if not rows:
+                    return refreshed
+                refreshed += len(rows)
+                last_id = max(row["entry_id"] for row in rows)
+
+    def list_readable_entry_ids(
+        self,
+        entry_ids: List[int],
+        *,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> List[int]:
+        if not entry_ids:
+            return []
+        params: Dict[str, Any] = {"ids": entry_ids}
+        readable_clause = _readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role)
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(f"SELECT e.id FROM entries e WHERE e.id = ANY(%(ids)s) AND {readable_clause};", params)
+            return [row["id"] for row in cur.fetchall()]
 
-    def list_entries(self, *, schema_id: Optional[int] = None, owner_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        clauses = ["deleted_at IS NULL"]
-        params: List[Any] = []
-        if schema_id is not None:
-            clauses.append("schema_id=%s")
-            params.append(schema_id)
-        if owner_id is not None:
-            clauses.append("owner_id=%s")
-            params.append(owner_id)
-        sql = f"SELECT * FROM entries WHERE {' AND '.join(clauses)} ORDER BY updated_at DESC NULLS LAST, id DESC"
+    def list_existing_reference_targets(self, entry_ids: List[int], attachment_ids: List[int]) -> Dict[str, Set[int]]:
         with get_connection() as conn, conn.cursor() as cur:
-            cur.execute(sql, params)
+            cur.execute(
+                """
+                SELECT 'entry' AS target_type, id FROM entries WHERE id = ANY(%(entry_ids)s)
+                UNION ALL
+                SELECT 'attachment' AS target_type, id FROM attachments WHERE id = ANY(%(attachment_ids)s);
+                """,
+                {"entry_ids": entry_ids, "attachment_ids": attachment_ids},
+            )
             rows = cur.fetchall()
+        existing: Dict[str, Set[int]] = {"entry": set(), "attachment": set()}
         for row in rows:
-            row["data_json"] = row.get("data_json") or {}
-        return rows
-
-    def list_entry_lookup_by_ids(self, entry_ids: List[int]) -> List[Dict[str, Any]]:
-        if not entry_ids:
-            return []
+            existing[row["target_type"]].add(row["id"])
+        return existing
 
+    def list_incoming_references(
+        self,
+        entry_id: int,
+        *,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"entry_id": entry_id}
+        readable_clause = _readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role)
         with get_connection() as conn, conn.cursor() as cur:
             cur.execute(
-                """
+                f"""
                 SELECT
                     e.id,
                     e.title,
                     s.id AS schema_id,
                     s.key AS schema_key,
-                    s.name AS schema_name
+                    s.name AS schema_name,
+                    r.field_key
+                FROM entry_references r
+                JOIN entries e ON e.id = r.source_entry_id
+                JOIN schemas s ON s.id = e.schema_id
+                WHERE r.target_type = 'entry'
+                  AND r.target_id = %(entry_id)s
+                  AND e.deleted_at IS NULL
+                  AND {readable_clause}
+                ORDER BY e.title, e.id, r.field_key;
+                """,
+                params,
+            )
+            return cur.fetchall()
+
+    def list_entry_summaries(
+        self,
+        *,
+        order_by: str,
+        limit: int,
+        is_admin: bool = False,
+        user_id: Optional[int] = None,
+        role: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        order_sql = {
+            "created": "e.created_at DESC, e.id DESC",
+            "updated": "COALESCE(e.updated_at, e.created_at) DESC, e.id DESC",
+        }[order_by]
+        params: Dict[str, Any] = {"limit": limit}
+        readable_sql = _readable_entries_clause("e", params, is_admin=is_admin, user_id=user_id, role=role)
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    e.id,
+                    e.schema_id,
+                    s.key AS schema_key,
+                    s.name AS schema_name,
+                    e.title,
+                    e.status,
+                    e.visibility_level,
+                    e.owner_id,
+                    e.created_at,
+                    e.updated_at
                 FROM entries e
                 JOIN schemas s ON s.id = e.schema_id
-                WHERE e.id = ANY(%s)
-                ORDER BY e.title, e.id;
+                WHERE e.deleted_at IS NULL AND {readable_sql}
+                ORDER BY {order_sql}
+                LIMIT %(limit)s;
                 """,
-                (entry_ids,),
+                params,
             )
             return cur.fetchall()
 
@@ -242,6 +1418,8 @@ class EntryRepository:
         with get_connection() as conn, conn.cursor() as cur:
             cur.execute(f"UPDATE entries SET {assignments} WHERE id=%(entry_id)s RETURNING *;", payload)
             row = cur.fetchone()
+            if row:
+                _attach_entry_blobs(cur, [row])
             conn.commit()
         if not row:
             raise NotFoundError("Entry not found")
@@ -249,6 +1427,116 @@ class EntryRepository:
         return row
 
 
+class SchemaStatsRepository:
+    def get_stats(self, schema_id: int) -> Dict[str, Any]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT * FROM schema_stats WHERE schema_id=%s ORDER BY visibility_level;", (schema_id,))
+            rows = cur.fetchall()
+        return _merge_schema_stats(rows)
+
+    def list_stats(self) -> Dict[int, Dict[str, Any]]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT * FROM schema_stats ORDER BY schema_id, visibility_level;")
+            rows = cur.fetchall()
+        grouped: Dict[int, List[Dict[str, Any]]] = {}
+        for row in rows:
+            grouped.setdefault(row["schema_id"], []).append(row)
+        return {schema_id: _merge_schema_stats(schema_rows) for schema_id, schema_rows in grouped.items()}
+
+    def list_visible_totals(
+        self,
+        *,
+        is_admin: bool = False,
+        user_id: Optional[int] = None,
+        role: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        levels = _visible_levels(is_admin=is_admin, user_id=user_id)
+        params: Dict[str, Any] = {"levels": levels}
+        parts = [
+            """
+            SELECT schema_id, total_entries, last_created_at, last_updated_at
+            FROM schema_stats
+            WHERE visibility_level = ANY(%(levels)s::visibility_level_enum[])
+            """
+        ]
+        if not is_admin and user_id is not None:
+            # Owned and explicitly granted entries outside the visible levels are not covered by the
+            # per-level counters, so they are counted directly through the owner and grant indexes.
+            params["access_user_id"] = user_id
+            grant_subjects = _grant_subjects_clause("ep", params, user_id=user_id, role=role)
+            parts.append(
+                f"""
+                SELECT
+                    e.schema_id,
+                    COUNT(*) AS total_entries,
+                    MAX(e.created_at) AS last_created_at,
+                    MAX(COALESCE(e.updated_at, e.created_at)) AS last_updated_at
+                FROM entries e
+                WHERE e.deleted_at IS NULL
+                  AND e.visibility_level != ALL(%(levels)s::visibility_level_enum[])
+                  AND (
+                      e.owner_id = %(access_user_id)s
+                      OR (
+                          e.visibility_level != 'private'
+                          AND EXISTS (
+                              SELECT 1
+                              FROM entry_permissions ep
+                              WHERE ep.entry_id = e.id
+                                AND ({grant_subjects})
+                          )
+                      )
+                  )
+                GROUP BY e.schema_id
+                """
+            )
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    s.id AS schema_id,
+                    s.key AS schema_key,
+                    s.name AS schema_name,
+                    s.icon,
+                    SUM(t.total_entries)::bigint AS total_entries,
+                    MAX(t.last_created_at) AS last_created_at,
+                    MAX(t.last_updated_at) AS last_updated_at
+                FROM ({" UNION ALL ".join(parts)}) t
+                JOIN schemas s ON s.id = t.schema_id
+                GROUP BY s.id
+                HAVING SUM(t.total_entries) > 0
+                ORDER BY total_entries DESC, s.name, s.id;
+                """,
+                params,
+            )
+            return cur.fetchall()
+
+    def rebuild(self) -> None:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT rebuild_schema_stats();")
+            conn.commit()
+
+
+def _merge_schema_stats(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {
+        "total_entries": 0,
+        "status_counts": {},
+        "visibility_counts": {},
+        "last_created_at": None,
+        "last_updated_at": None,
+    }
+    for row in rows:
+        if not row["total_entries"]:
+            continue
+        stats["total_entries"] += row["total_entries"]
+        stats["visibility_counts"][row["visibility_level"]] = row["total_entries"]
+        for status, count in (row.get("status_counts") or {}).items():
+            stats["status_counts"][status] = stats["status_counts"].get(status, 0) + count
+        for key in ("last_created_at", "last_updated_at"):
+            if row[key] is not None and (stats[key] is None or row[key] > stats[key]):
+                stats[key] = row[key]
+    return stats
+
+
 class RelationRepository:
     def get_relation(self, relation_id: int) -> Dict[str, Any]:
         with get_connection() as conn, conn.cursor() as cur:
@@ -276,6 +1564,78 @@ class RelationRepository:
         row["metadata_json"] = row.get("metadata_json") or {}
         return row
 
+    def bulk_write_relations(self, entry_id: int, relations: List[Dict[str, Any]], *, replace: bool) -> Dict[str, Any]:
+        target_ids = sorted({relation["to_entry_id"] for relation in relations})
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT id FROM entries WHERE id = ANY(%s) FOR KEY SHARE;", (target_ids,))
+            missing_ids = set(target_ids) - {row["id"] for row in cur.fetchall()}
+            if missing_ids:
+                conn.rollback()
+                raise NotFoundError(f"Related entries not found: {', '.join(str(value) for value in sorted(missing_ids))}")
+
+            inserts = relations
+            updates: List[Dict[str, Any]] = []
+            deleted_ids: List[int] = []
+            if replace:
+                cur.execute(
+                    "SELECT id, to_entry_id, relation_type FROM entry_relations WHERE from_entry_id=%s ORDER BY id FOR UPDATE;",
+                    (entry_id,),
+                )
+                existing: Dict[Tuple[int, str], int] = {}
+                for row in cur.fetchall():
+                    key = (row["to_entry_id"], row["relation_type"])
+                    if key in existing:
+                        deleted_ids.append(row["id"])
+                    else:
+                        existing[key] = row["id"]
+                inserts = []
+                for relation in relations:
+                    relation_id = existing.pop((relation["to_entry_id"], relation["relation_type"]), None)
+                    if relation_id is None:
+                        inserts.append(relation)
+                    else:
+                        updates.append({**relation, "id": relation_id})
+                deleted_ids.extend(existing.values())
+
+            if deleted_ids:
+                cur.execute("DELETE FROM entry_relations WHERE id = ANY(%s);", (deleted_ids,))
+            if updates:
+                cur.execute(
+                    """
+                    UPDATE entry_relations r
+                    SET sort_order = v.sort_order, metadata_json = v.metadata_json
+                    FROM unnest(%s::bigint[], %s::int[], %s::jsonb[]) AS v(id, sort_order, metadata_json)
+                    WHERE r.id = v.id
+                      AND (r.sort_order, r.metadata_json) IS DISTINCT FROM (v.sort_order, v.metadata_json);
+                    """,
+                    (
+                        [relation["id"] for relation in updates],
+                        [relation["sort_order"] for relation in updates],
+                        [Jsonb(relation.get("metadata_json") or {}) for relation in updates],
+                    ),
+                )
+            if inserts:
+                cur.execute(
+                    """
+                    INSERT INTO entry_relations (from_entry_id, to_entry_id, relation_type, sort_order, metadata_json)
+                    SELECT %s, v.to_entry_id, v.relation_type, v.sort_order, v.metadata_json
+                    FROM unnest(%s::bigint[], %s::text[], %s::int[], %s::jsonb[]) AS v(to_entry_id, relation_type, sort_order, metadata_json);
+                    """,
+                    (
+                        entry_id,
+                        [relation["to_entry_id"] for relation in inserts],
+                        [relation["relation_type"] for relation in inserts],
+                        [relation["sort_order"] for relation in inserts],
+                        [Jsonb(relation.get("metadata_json") or {}) for relation in inserts],
+                    ),
+                )
+            cur.execute("SELECT * FROM entry_relations WHERE from_entry_id=%s ORDER BY sort_order, id;", (entry_id,))
+            rows = cur.fetchall()
+            conn.commit()
+        for row in rows:
+            row["metadata_json"] = row.get("metadata_json") or {}
+        return {"relations": rows, "deleted_ids": deleted_ids}
+
     def list_relations(self, entry_id: int) -> List[Dict[str, Any]]:
         with get_connection() as conn, conn.cursor() as cur:
             cur.execute(
@@ -291,6 +1651,282 @@ class RelationRepository:
             row["metadata_json"] = row.get("metadata_json") or {}
         return rows
 
+    def list_relations_by_ids(self, relation_ids: List[int]) -> List[Dict[str, Any]]:
+        if not relation_ids:
+            return []
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT * FROM entry_relations WHERE id = ANY(%s) ORDER BY sort_order, id;", (relation_ids,))
+            rows = cur.fetchall()
+        for row in rows:
+            row["metadata_json"] = row.get("metadata_json") or {}
+        return rows
+
+    def list_relation_links(self) -> List[Dict[str, Any]]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT id, from_entry_id, to_entry_id, relation_type, sort_order FROM entry_relations;")
+            return cur.fetchall()
+
+    def list_readable_neighbor_links(
+        self,
+        entry_ids: List[int],
+        *,
+        relation_types: Optional[List[str]],
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"ids": entry_ids}
+        clauses = [_readable_entries_clause("n", params, is_admin=is_admin, user_id=user_id, role=role)]
+        if relation_types:
+            params["relation_types"] = relation_types
+            clauses.append("r.relation_type = ANY(%(relation_types)s)")
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT r.id, r.from_entry_id, r.to_entry_id, r.relation_type, r.sort_order,
+                       frontier.id AS entry_id, n.id AS neighbor_id
+                FROM unnest(%(ids)s::bigint[]) AS frontier(id)
+                CROSS JOIN LATERAL (
+                    SELECT * FROM entry_relations WHERE from_entry_id = frontier.id
+                    UNION ALL
+                    SELECT * FROM entry_relations WHERE to_entry_id = frontier.id
+                ) r
+                JOIN entries n ON n.id = CASE WHEN r.from_entry_id = frontier.id THEN r.to_entry_id ELSE r.from_entry_id END
+                WHERE {" AND ".join(clauses)}
+                ORDER BY frontier.id, r.sort_order, r.id;
+                """,
+                params,
+            )
+            return cur.fetchall()
+
+    def load_path_records(self, entry_ids: List[int], relation_ids: List[int]) -> Dict[str, List[Dict[str, Any]]]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT * FROM entries WHERE id = ANY(%s);", (entry_ids,))
+            entries = cur.fetchall()
+            cur.execute("SELECT * FROM entry_relations WHERE id = ANY(%s);", (relation_ids,))
+            relations = cur.fetchall()
+            cur.execute(
+                "SELECT * FROM schemas WHERE id = ANY(%s) ORDER BY id;",
+                (sorted({row["schema_id"] for row in entries}),),
+            )
+            schemas = cur.fetchall()
+        for row in entries:
+            row["data_json"] = row.get("data_json") or {}
+        for row in relations:
+            row["metadata_json"] = row.get("metadata_json") or {}
+        return {"entries": entries, "relations": relations, "schemas": schemas}
+
+    def load_reachable_subgraph(
+        self,
+        entry_id: int,
+        *,
+        max_depth: int,
+        max_nodes: int,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        params: Dict[str, Any] = {"entry_id": entry_id, "max_depth": max_depth, "node_limit": max_nodes + 1}
+        readable_clause = _readable_entries_clause("n", params, is_admin=is_admin, user_id=user_id, role=role)
+        degree_clause = _readable_entries_clause("dn", params, is_admin=is_admin, user_id=user_id, role=role)
+        with get_connection() as conn, conn.cursor() as cur:
+            # One row per level carrying the visited set, so each entry is loaded once and the walk stops as soon as
+            # max_nodes + 1 entries are known; readable_degree is only computed for those.
+            cur.execute(
+                f"""
+                WITH RECURSIVE levels(visited, frontier, depth) AS (
+                    SELECT ARRAY[%(entry_id)s::bigint], ARRAY[%(entry_id)s::bigint], 0
+                    UNION ALL
+                    SELECT l.visited || next_level.ids, next_level.ids, l.depth + 1
+                    FROM levels l
+                    CROSS JOIN LATERAL (
+                        SELECT array_agg(found.id ORDER BY found.id) AS ids
+                        FROM (
+                            SELECT DISTINCT n.id
+                            FROM unnest(l.frontier) AS f(id)
+                            CROSS JOIN LATERAL (
+                                SELECT to_entry_id AS id FROM entry_relations WHERE from_entry_id = f.id
+                                UNION ALL
+                                SELECT from_entry_id AS id FROM entry_relations WHERE to_entry_id = f.id
+                            ) neighbor
+                            JOIN entries n ON n.id = neighbor.id
+                            WHERE n.id <> ALL(l.visited) AND {readable_clause}
+                            ORDER BY n.id
+                            LIMIT %(node_limit)s - cardinality(l.visited)
+                        ) found
+                    ) next_level
+                    WHERE l.depth < %(max_depth)s
+                      AND cardinality(l.visited) < %(node_limit)s
+                      AND next_level.ids IS NOT NULL
+                )
+                SELECT
+                    e.*,
+                    {_relation_counts_column("e")},
+                    (
+                        SELECT count(*)
+                        FROM entry_relations d
+                        JOIN entries dn ON dn.id = CASE WHEN d.from_entry_id = e.id THEN d.to_entry_id ELSE d.from_entry_id END
+                        WHERE (d.from_entry_id = e.id OR d.to_entry_id = e.id) AND {degree_clause}
+                    ) AS readable_degree
+                FROM entries e
+                WHERE e.id IN (SELECT unnest(visited) FROM (SELECT visited FROM levels ORDER BY depth DESC LIMIT 1) last_level);
+                """,
+                params,
+            )
+            entries = cur.fetchall()
+            entry_ids = [row["id"] for row in entries]
+            cur.execute(
+                """
+                SELECT * FROM entry_relations
+                WHERE from_entry_id = ANY(%(ids)s) AND to_entry_id = ANY(%(ids)s)
+                ORDER BY sort_order, id;
+                """,
+                {"ids": entry_ids},
+            )
+            relations = cur.fetchall()
+            cur.execute(
+                "SELECT * FROM schemas WHERE id = ANY(%s) ORDER BY id;",
+                (sorted({row["schema_id"] for row in entries}),),
+            )
+            schemas = cur.fetchall()
+        for row in entries:
+            row["data_json"] = row.get("data_json") or {}
+        for row in relations:
+            row["metadata_json"] = row.get("metadata_json") or {}
+        return {"entries": entries, "relations": relations, "schemas": schemas}
+
+    def load_relation_tree_records(self, entry_ids: List[int], relation_ids: List[int]) -> Dict[str, List[Dict[str, Any]]]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(f"SELECT e.*, {_relation_counts_column('e')} FROM entries e WHERE e.id = ANY(%s);", (entry_ids,))
+            entries = cur.fetchall()
+            cur.execute("SELECT * FROM entry_relations WHERE id = ANY(%s) ORDER BY sort_order, id;", (relation_ids,))
+            relations = cur.fetchall()
+            cur.execute(
+                "SELECT * FROM schemas WHERE id = ANY(%s) ORDER BY id;",
+                (sorted({row["schema_id"] for row in entries}),),
+            )
+            schemas = cur.fetchall()
+        for row in entries:
+            row["data_json"] = row.get("data_json") or {}
+        for row in relations:
+            row["metadata_json"] = row.get("metadata_json") or {}
+        return {"entries": entries, "relations": relations, "schemas": schemas}
+
+    def list_relation_children_from_links(
+        self,
+        links: List[Dict[str, Any]],
+        *,
+        after: Optional[List[Any]],
+        limit: int,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        if not links:
+            return []
+        params: Dict[str, Any] = {
+            "relation_ids": [link["id"] for link in links],
+            "neighbor_ids": [link["neighbor_id"] for link in links],
+            "limit": limit,
+        }
+        clauses = [_readable_entries_clause("n", params, is_admin=is_admin, user_id=user_id, role=role)]
+        if after is not None:
+            params.update(
+                {
+                    "after_sort_order": after[0],
+                    "after_title": after[1],
+                    "after_entry_id": after[2],
+                    "after_relation_id": after[3],
+                }
+            )
+            clauses.append(
+                "(r.sort_order, n.title, n.id, r.id) > "
+                "(%(after_sort_order)s, %(after_title)s, %(after_entry_id)s, %(after_relation_id)s)"
+            )
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    n.*,
+                    {_relation_counts_column("n")},
+                    to_jsonb(r) AS relation,
+                    (SELECT to_jsonb(s) FROM schemas s WHERE s.id = n.schema_id) AS schema
+                FROM unnest(%(relation_ids)s::bigint[], %(neighbor_ids)s::bigint[]) AS link(relation_id, neighbor_id)
+                JOIN entry_relations r ON r.id = link.relation_id
+                JOIN entries n ON n.id = link.neighbor_id
+                WHERE {" AND ".join(clauses)}
+                ORDER BY r.sort_order, n.title, n.id, r.id
+                LIMIT %(limit)s;
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+        for row in rows:
+            row["data_json"] = row.get("data_json") or {}
+            row["relation"]["metadata_json"] = row["relation"].get("metadata_json") or {}
+        return rows
+
+    def list_relation_children(
+        self,
+        entry_id: int,
+        *,
+        parent_entry_id: Optional[int],
+        after: Optional[List[Any]],
+        limit: int,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"entry_id": entry_id, "parent_entry_id": parent_entry_id, "limit": limit}
+        readable_clause = _readable_entries_clause("n", params, is_admin=is_admin, user_id=user_id, role=role)
+        degree_clause = _readable_entries_clause("dn", params, is_admin=is_admin, user_id=user_id, role=role)
+        clauses = [readable_clause]
+        if parent_entry_id is not None:
+            clauses.append("n.id <> %(parent_entry_id)s")
+        if after is not None:
+            params.update(
+                {
+                    "after_sort_order": after[0],
+                    "after_title": after[1],
+                    "after_entry_id": after[2],
+                    "after_relation_id": after[3],
+                }
+            )
+            clauses.append(
+                "(r.sort_order, n.title, n.id, r.id) > "
+                "(%(after_sort_order)s, %(after_title)s, %(after_entry_id)s, %(after_relation_id)s)"
+            )
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    n.*,
+                    {_relation_counts_column("n")},
+                    to_jsonb(r) AS relation,
+                    (
+                        SELECT count(*)
+                        FROM entry_relations d
+                        JOIN entries dn ON dn.id = CASE WHEN d.from_entry_id = n.id THEN d.to_entry_id ELSE d.from_entry_id END
+                        WHERE (d.from_entry_id = n.id OR d.to_entry_id = n.id)
+                          AND dn.id <> %(entry_id)s
+                          AND {degree_clause}
+                    ) AS child_count,
+                    (SELECT to_jsonb(s) FROM schemas s WHERE s.id = n.schema_id) AS schema
+                FROM entry_relations r
+                JOIN entries n ON n.id = CASE WHEN r.from_entry_id = %(entry_id)s THEN r.to_entry_id ELSE r.from_entry_id END
+                WHERE (r.from_entry_id = %(entry_id)s OR r.to_entry_id = %(entry_id)s)
+                  AND {" AND ".join(clauses)}
+                ORDER BY r.sort_order, n.title, n.id, r.id
+                LIMIT %(limit)s;
+                """,
+                params,
+            )
+            rows = cur.fetchall()
+        for row in rows:
+            row["data_json"] = row.get("data_json") or {}
+            row["relation"]["metadata_json"] = row["relation"].get("metadata_json") or {}
+        return rows
+
     def update_relation(self, relation_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
         payload = dict(updates)
         if "metadata_json" in payload:
@@ -604,12 +2240,200 @@ class AttachmentRepository:
         return row
 
 
-def ensure_unique_field_value(schema_id: int, field_key: str, value: Any, *, exclude_entry_id: Optional[int] = None) -> None:
+class SavedQueryRepository:
+    def list_saved_queries(
+        self,
+        *,
+        is_admin: bool,
+        user_id: Optional[int],
+        role: Optional[str],
+        schema_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        clauses: List[str] = []
+        params: Dict[str, Any] = {}
+        if not is_admin:
+            clauses.append("(owner_id = %(user_id)s OR role = %(role)s)")
+            params.update({"user_id": user_id, "role": role})
+        if schema_id is not None:
+            clauses.append("schema_id = %(schema_id)s")
+            params["schema_id"] = schema_id
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(f"SELECT * FROM saved_queries {where} ORDER BY name, id;", params)
+            return cur.fetchall()
+
+    def get_saved_query(self, saved_query_id: int) -> Dict[str, Any]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT * FROM saved_queries WHERE id=%s;", (saved_query_id,))
+            row = cur.fetchone()
+        if not row:
+            raise NotFoundError("Saved query not found")
+        return row
+
+    def create_saved_query(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO saved_queries (schema_id, name, owner_id, role, filters, sort, fields, created_by)
+                VALUES (%(schema_id)s, %(name)s, %(owner_id)s, %(role)s, %(filters)s, %(sort)s, %(fields)s, %(created_by)s)
+                RETURNING *;
+                """,
+                payload,
+            )
+            row = cur.fetchone()
+            conn.commit()
+        return row
+
+    def update_saved_query(self, saved_query_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
+        payload = dict(updates)
+        payload["saved_query_id"] = saved_query_id
+        assignments = ", ".join(f"{key}=%({key})s" for key in updates)
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(f"UPDATE saved_queries SET {assignments} WHERE id=%(saved_query_id)s RETURNING *;", payload)
+            row = cur.fetchone()
+            cur.execute("DELETE FROM saved_query_results WHERE saved_query_id=%s;", (saved_query_id,))
+            conn.commit()
+        if not row:
+            raise NotFoundError("Saved query not found")
+        return row
+
+    def delete_saved_query(self, saved_query_id: int) -> Dict[str, Any]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("DELETE FROM saved_queries WHERE id=%s RETURNING *;", (saved_query_id,))
+            row = cur.fetchone()
+            conn.commit()
+        if not row:
+            raise NotFoundError("Saved query not found")
+        return row
+
+    def get_result(self, saved_query_id: int) -> Optional[Dict[str, Any]]:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT * FROM saved_query_results WHERE saved_query_id=%s;", (saved_query_id,))
+            return cur.fetchone()
+
+    def store_result(
+        self,
+        saved_query: Dict[str, Any],
+        *,
+        entry_ids: List[int],
+        watermark: Optional[datetime],
+    ) -> Optional[Dict[str, Any]]:
+        # Skipped when the definition changed while the result was computed.
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO saved_query_results (saved_query_id, entry_ids, watermark, refreshed_at)
+                SELECT q.id, %(entry_ids)s, %(watermark)s, NOW()
+                FROM saved_queries q
+                WHERE q.id = %(saved_query_id)s AND q.updated_at IS NOT DISTINCT FROM %(updated_at)s
+                ON CONFLICT (saved_query_id) DO UPDATE SET
+                    entry_ids = EXCLUDED.entry_ids,
+                    watermark = EXCLUDED.watermark,
+                    refreshed_at = EXCLUDED.refreshed_at
+                RETURNING *;
+                """,
+                {
+                    "saved_query_id": saved_query["id"],
+                    "updated_at": saved_query["updated_at"],
+                    "entry_ids": entry_ids,
+                    "watermark": watermark,
+                },
+            )
+            row = cur.fetchone()
+            conn.commit()
+        return row
+
+
+class OutboxRepository:
+    def set_enabled(self, enabled: bool) -> None:
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("UPDATE entry_outbox_settings SET enabled = %s WHERE enabled IS DISTINCT FROM %s;", (enabled, enabled))
+            conn.commit()
+
+    def deliver_batch(
+        self,
+        deliver: Callable[[List[Dict[str, Any]]], None],
+        *,
+        limit: int,
+        max_attempts: int,
+        retry_delay_seconds: float,
+    ) -> int:
+        # Rows stay locked while deliver() runs, so concurrent dispatchers skip them instead of sending them twice.
+        with get_connection() as conn, conn.cursor() as cur:
+            # Rows queued behind an older row of the same entry that is backing off wait for it, keeping per-entry order.
+            cur.execute(
+                """
+                SELECT o.id, o.event_type, o.entry_id, o.payload, o.created_at, o.attempts
+                FROM entry_outbox o
+                WHERE o.failed_at IS NULL
+                  AND o.available_at <= NOW()
+                  AND NOT EXISTS (
+                      SELECT 1
+                      FROM entry_outbox older
+                      WHERE older.entry_id = o.entry_id
+                        AND older.id < o.id
+                        AND older.failed_at IS NULL
+                        AND older.available_at > NOW()
+                  )
+                ORDER BY o.id
+                LIMIT %s
+                FOR UPDATE OF o SKIP LOCKED;
+                """,
+                (limit,),
+            )
+            rows = cur.fetchall()
+            if rows:
+                # Older rows still pending but not in this batch are held by another dispatcher; wait for them too.
+                cur.execute(
+                    """
+                    SELECT entry_id, MIN(id) AS blocking_id
+                    FROM entry_outbox
+                    WHERE entry_id = ANY(%s) AND failed_at IS NULL AND NOT (id = ANY(%s))
+                    GROUP BY entry_id;
+                    """,
+                    ([row["entry_id"] for row in rows], [row["id"] for row in rows]),
+                )
+                blocking = {row["entry_id"]: row["blocking_id"] for row in cur.fetchall()}
+                rows = [row for row in rows if row["id"] < blocking.get(row["entry_id"], row["id"] + 1)]
+            if not rows:
+                conn.rollback()
+                return 0
+            outbox_ids = [row["id"] for row in rows]
+            try:
+                deliver(rows)
+            except Exception as exc:
+                cur.execute(
+                    """
+                    UPDATE entry_outbox SET
+                        attempts = attempts + 1,
+                        last_error = %(error)s,
+                        available_at = NOW() + make_interval(secs => %(delay)s * power(2, attempts)),
+                        failed_at = CASE WHEN attempts + 1 >= %(max_attempts)s THEN NOW() END
+                    WHERE id = ANY(%(ids)s);
+                    """,
+                    {"error": repr(exc), "delay": retry_delay_seconds, "max_attempts": max_attempts, "ids": outbox_ids},
+                )
+                conn.commit()
+                raise
+            cur.execute("DELETE FROM entry_outbox WHERE id = ANY(%s);", (outbox_ids,))
+            conn.commit()
+        return len(rows)
+
+
+def ensure_unique_field_value(
+    schema_id: int,
+    field_key: str,
+    value: Any,
+    *,
+    exclude_entry_id: Optional[int] = None,
+    external: bool = False,
+) -> None:
+    document = "entry_full_data(id, data_json)" if external else "data_json"
     clauses = [
         "schema_id=%s",
         "deleted_at IS NULL",
-        "data_json ? %s",
-        "jsonb_extract_path_text(data_json, %s) = %s",
+        f"{document} ? %s",
+        f"jsonb_extract_path_text({document}, %s) = %s",
     ]
     params: List[Any] = [schema_id, field_key, field_key, str(value)]
     if exclude_entry_id is not None:
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, Query
 
-from ..core.enums import EntryPermission
+from ..core.enums import EntryPermission, EntryRelationType
 from ..core.errors import ForbiddenError
 from ..roles import ENTRY_WRITE_ROLES, READ_ROLES
 from ..schemas import (
@@ -13,24 +13,32 @@ from ..schemas import (
     AttachmentLinkUpdate,
     AttachmentResponse,
     EntryCreate,
+    EntryBundleBatchRequest,
     EntryBundleResponse,
+    EntryChangesResponse,
     EntryHistoryRecord,
+    EntryIncomingReferenceResponse,
     EntryLookupResponse,
     EntryPermissionCreate,
     EntryPermissionResponse,
     EntryPermissionUpdate,
+    EntryRelationBulkRequest,
+    EntryRelationChildrenResponse,
     EntryRelationCreate,
+    EntryRelationPathResponse,
     EntryRelationResponse,
     EntryRelationTreeResponse,
     EntryRelationUpdate,
     EntryResponse,
+    EntrySearchResponse,
     EntryUpdate,
+    SparseEntryResponse,
 )
 from ..security import get_current_user, get_optional_current_user, require_role
 from ..services.attachments import AttachmentService
 from ..services.entries import EntryService
 from ..services.permissions import PermissionService
-from ..services.relations import RelationService
+from ..services.relations import RELATION_PATH_MAX_HOPS, RELATION_TREE_MAX_DEPTH, RELATION_TREE_MAX_NODES, RelationService
 
 router = APIRouter(prefix="/entries", tags=["entries"])
 entry_service = EntryService()
@@ -44,18 +52,67 @@ def list_entry_lookup(
     q: Optional[str] = Query(default=None, max_length=255),
     schema_id: Optional[int] = Query(default=None),
     limit: int = Query(default=20, ge=1, le=100),
+    fields: List[str] = Query(default=[]),
     current_user: Optional[Dict] = Depends(get_optional_current_user),
 ):
-    return entry_service.list_entry_lookup(current_user=current_user, search=q, schema_id=schema_id, limit=limit)
+    return entry_service.list_entry_lookup(
+        current_user=current_user,
+        search=q,
+        schema_id=schema_id,
+        limit=limit,
+        fields=fields,
+    )
+
 
+@router.get("/changes", response_model=EntryChangesResponse)
+def list_entry_changes(
+    since: Optional[str] = Query(default=None, max_length=64),
+    schema_id: Optional[int] = Query(default=None),
+    limit: int = Query(default=500, ge=1, le=1000),
+    current_user: Optional[Dict] = Depends(get_optional_current_user),
+):
+    return entry_service.list_entry_changes(
+        current_user=current_user,
+        since=since,
+        schema_id=schema_id,
+        limit=limit,
+    )
 
-@router.get("", response_model=list[EntryResponse])
+
+@router.get("/search", response_model=EntrySearchResponse)
+def search_entries(
+    q: str = Query(..., min_length=1, max_length=255),
+    schema_id: Optional[int] = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    current_user: Optional[Dict] = Depends(get_optional_current_user),
+):
+    return entry_service.search_entries(
+        current_user=current_user,
+        search=q,
+        schema_id=schema_id,
+        limit=limit,
+        offset=offset,
+    )
+
+
+@router.get("", response_model=list[SparseEntryResponse])
 def list_entries(
     schema_id: Optional[int] = Query(default=None),
     owner_id: Optional[int] = Query(default=None),
+    filters: List[str] = Query(default=[], alias="filter"),
+    sort: Optional[str] = Query(default=None, max_length=120),
+    fields: List[str] = Query(default=[]),
     current_user: Optional[Dict] = Depends(get_optional_current_user),
 ):
-    return entry_service.list_entries(current_user=current_user, schema_id=schema_id, owner_id=owner_id)
+    return entry_service.list_entries(
+        current_user=current_user,
+        schema_id=schema_id,
+        owner_id=owner_id,
+        filters=filters,
+        sort=sort,
+        fields=fields,
+    )
 
 
 @router.get("/{entry_id}", response_model=EntryResponse)
@@ -68,6 +125,11 @@ def get_entry_bundle(entry_id: int, current_user: Optional[Dict] = Depends(get_o
     return entry_service.get_entry_bundle(entry_id, current_user=current_user)
 
 
+@router.post("/bundles", response_model=list[EntryBundleResponse])
+def list_entry_bundles(payload: EntryBundleBatchRequest, current_user: Optional[Dict] = Depends(get_optional_current_user)):
+    return entry_service.list_entry_bundles(payload.entry_ids, current_user=current_user)
+
+
 @router.post("", response_model=EntryResponse, status_code=201)
 def create_entry(payload: EntryCreate, current_user: Dict = Depends(require_role(*ENTRY_WRITE_ROLES))):
     return entry_service.create_entry(payload.model_dump(), current_user=current_user)
@@ -83,6 +145,11 @@ def get_history(entry_id: int, current_user: Optional[Dict] = Depends(get_option
     return entry_service.list_history(entry_id, current_user=current_user)
 
 
+@router.get("/{entry_id}/references/incoming", response_model=list[EntryIncomingReferenceResponse])
+def list_incoming_references(entry_id: int, current_user: Optional[Dict] = Depends(get_optional_current_user)):
+    return entry_service.list_incoming_references(entry_id, current_user=current_user)
+
+
 @router.get("/{entry_id}/relations", response_model=list[EntryRelationResponse])
 def list_relations(entry_id: int, current_user: Optional[Dict] = Depends(get_optional_current_user)):
     entry_service.get_entry(entry_id, current_user=current_user, permission=EntryPermission.READ)
@@ -90,9 +157,51 @@ def list_relations(entry_id: int, current_user: Optional[Dict] = Depends(get_opt
 
 
 @router.get("/{entry_id}/relation-tree", response_model=EntryRelationTreeResponse)
-def get_relation_tree(entry_id: int, current_user: Optional[Dict] = Depends(get_optional_current_user)):
+def get_relation_tree(
+    entry_id: int,
+    max_depth: int = Query(default=RELATION_TREE_MAX_DEPTH, ge=1, le=50),
+    max_nodes: int = Query(default=RELATION_TREE_MAX_NODES, ge=1, le=5000),
+    current_user: Optional[Dict] = Depends(get_optional_current_user),
+):
     entry_service.get_entry(entry_id, current_user=current_user, permission=EntryPermission.READ)
-    return relation_service.get_relation_tree(entry_id, current_user=current_user)
+    return relation_service.get_relation_tree(entry_id, current_user=current_user, max_depth=max_depth, max_nodes=max_nodes)
+
+
+@router.get("/{entry_id}/relation-tree/children", response_model=EntryRelationChildrenResponse)
+def list_relation_tree_children(
+    entry_id: int,
+    parent_entry_id: Optional[int] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    current_user: Optional[Dict] = Depends(get_optional_current_user),
+):
+    entry_service.get_entry(entry_id, current_user=current_user, permission=EntryPermission.READ)
+    return relation_service.list_relation_children(
+        entry_id,
+        current_user=current_user,
+        parent_entry_id=parent_entry_id,
+        cursor=cursor,
+        limit=limit,
+    )
+
+
+@router.get("/{entry_id}/path-to/{target_entry_id}", response_model=EntryRelationPathResponse)
+def find_relation_path(
+    entry_id: int,
+    target_entry_id: int,
+    relation_type: Optional[List[EntryRelationType]] = Query(default=None),
+    max_hops: int = Query(default=RELATION_PATH_MAX_HOPS, ge=1, le=20),
+    current_user: Optional[Dict] = Depends(get_optional_current_user),
+):
+    entry_service.get_entry(entry_id, current_user=current_user, permission=EntryPermission.READ)
+    entry_service.get_entry(target_entry_id, current_user=current_user, permission=EntryPermission.READ)
+    return relation_service.find_relation_path(
+        entry_id,
+        target_entry_id,
+        current_user=current_user,
+        relation_types=None if relation_type is None else [item.value for item in relation_type],
+        max_hops=max_hops,
+    )
 
 
 @router.post("/{entry_id}/relations", response_model=EntryRelationResponse, status_code=201)
@@ -103,6 +212,17 @@ def create_relation(entry_id: int, payload: EntryRelationCreate, current_user: D
     return relation_service.create_relation(relation_payload)
 
 
+@router.post("/{entry_id}/relations/bulk", response_model=list[EntryRelationResponse])
+def bulk_write_relations(
+    entry_id: int,
+    payload: EntryRelationBulkRequest,
+    current_user: Dict = Depends(require_role(*ENTRY_WRITE_ROLES)),
+):
+    entry_service.get_entry(entry_id, current_user=current_user, permission=EntryPermission.MANAGE_RELATIONS)
+    relations = [relation.model_dump(mode="json") for relation in payload.relations]
+    return relation_service.bulk_write_relations(entry_id, relations, replace=payload.mode == "replace")
+
+
 @router.patch("/{entry_id}/relations/{relation_id}", response_model=EntryRelationResponse)
 def update_relation(
     entry_id: int,
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+
+from ..security import get_optional_current_user
+from ..services.events import ENTRY_EVENTS_HEARTBEAT_SECONDS, EventSubscription, entry_event_broker
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+@router.get("")
+async def stream_events(
+    request: Request,
+    schema_id: Optional[int] = Query(default=None),
+    current_user: Optional[Dict] = Depends(get_optional_current_user),
+):
+    subscription = entry_event_broker.subscribe(current_user, schema_id=schema_id, loop=asyncio.get_running_loop())
+    return StreamingResponse(
+        _event_stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _event_stream(request: Request, subscription: EventSubscription) -> AsyncIterator[str]:
+    try:
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            event = await subscription.next_event(ENTRY_EVENTS_HEARTBEAT_SECONDS)
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield _format_event(event)
+            if event["event"] == "overflow":
+                break
+    finally:
+        entry_event_broker.unsubscribe(subscription)
+
+
+def _format_event(event: Dict[str, Any]) -> str:
+    return f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 
 from ..roles import READ_ROLES, SCHEMA_WRITE_ROLES
 from ..schemas import (
@@ -12,7 +12,9 @@ from ..schemas import (
     MetadataSchemaCreate,
     MetadataSchemaResponse,
     MetadataSchemaUpdate,
+    SchemaAggregateResponse,
     SchemaEntriesResponse,
+    SchemaFacetsResponse,
 )
 from ..security import get_optional_current_user, require_role
 from ..services.metadata_schema import MetadataSchemaService
@@ -36,8 +38,40 @@ def get_schema(schema_id: int, _: Dict = Depends(require_role(*READ_ROLES))):
 
 
 @router.get("/{schema_id}/entries", response_model=SchemaEntriesResponse)
-def get_schema_entries(schema_id: int, current_user: Optional[Dict] = Depends(get_optional_current_user)):
-    return service.get_schema_entries(schema_id, current_user=current_user)
+def get_schema_entries(
+    schema_id: int,
+    fields: List[str] = Query(default=[]),
+    current_user: Optional[Dict] = Depends(get_optional_current_user),
+):
+    return service.get_schema_entries(schema_id, current_user=current_user, fields=fields)
+
+
+@router.get("/{schema_id}/aggregate", response_model=SchemaAggregateResponse)
+def aggregate_schema_entries(
+    schema_id: int,
+    metrics: List[str] = Query(default=[], alias="metric"),
+    group_by: List[str] = Query(default=[]),
+    filters: List[str] = Query(default=[], alias="filter"),
+    limit: int = Query(default=1000, ge=1, le=10000),
+    current_user: Optional[Dict] = Depends(get_optional_current_user),
+):
+    return service.aggregate_entries(
+        schema_id,
+        current_user=current_user,
+        metrics=metrics,
+        group_by=group_by,
+        filters=filters,
+        limit=limit,
+    )
+
+
+@router.get("/{schema_id}/facets", response_model=SchemaFacetsResponse)
+def get_schema_facets(
+    schema_id: int,
+    filters: List[str] = Query(default=[], alias="filter"),
+    current_user: Optional[Dict] = Depends(get_optional_current_user),
+):
+    return service.get_facets(schema_id, current_user=current_user, filters=filters)
 
 
 @router.post("", response_model=MetadataSchemaResponse, status_code=201)
@@ -56,17 +90,22 @@ def update_schema(
 
 
 @router.delete("/{schema_id}", response_model=MetadataSchemaResponse)
-def delete_schema(schema_id: int, _: Dict = Depends(require_role(*SCHEMA_WRITE_ROLES))):
-    return service.delete_schema(schema_id)
+def delete_schema(
+    schema_id: int,
+    background_tasks: BackgroundTasks,
+    _: Dict = Depends(require_role(*SCHEMA_WRITE_ROLES)),
+):
+    return service.delete_schema(schema_id, background_tasks=background_tasks)
 
 
 @router.post("/{schema_id}/fields", status_code=201)
 def add_field(
     schema_id: int,
     payload: FieldDefinitionCreate,
+    background_tasks: BackgroundTasks,
     _: Dict = Depends(require_role(*SCHEMA_WRITE_ROLES)),
 ):
-    return service.add_field(schema_id, payload.model_dump())
+    return service.add_field(schema_id, payload.model_dump(), background_tasks=background_tasks)
 
 
 @router.get("/{schema_id}/fields", response_model=list[FieldDefinitionResponse])
@@ -88,11 +127,22 @@ def update_field(
     schema_id: int,
     field_id: int,
     payload: FieldDefinitionUpdate,
+    background_tasks: BackgroundTasks,
     _: Dict = Depends(require_role(*SCHEMA_WRITE_ROLES)),
 ):
-    return service.update_field(schema_id, field_id, payload.model_dump(exclude_unset=True))
+    return service.update_field(
+        schema_id,
+        field_id,
+        payload.model_dump(exclude_unset=True),
+        background_tasks=background_tasks,
+    )
 
 
 @router.delete("/{schema_id}/fields/{field_id}", response_model=FieldDefinitionResponse)
-def delete_field(schema_id: int, field_id: int, _: Dict = Depends(require_role(*SCHEMA_WRITE_ROLES))):
-    return service.delete_field(schema_id, field_id)
+def delete_field(
+    schema_id: int,
+    field_id: int,
+    background_tasks: BackgroundTasks,
+    _: Dict = Depends(require_role(*SCHEMA_WRITE_ROLES)),
+):
+    return service.delete_field(schema_id, field_id, background_tasks=background_tasks)
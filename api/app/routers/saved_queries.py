@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from ..schemas import SavedQueryCreate, SavedQueryEntriesResponse, SavedQueryResponse, SavedQueryUpdate
+from ..security import get_current_user
+from ..services.saved_queries import SavedQueryService
+
+router = APIRouter(prefix="/saved-queries", tags=["saved-queries"])
+service = SavedQueryService()
+
+
+@router.get("", response_model=List[SavedQueryResponse])
+def list_saved_queries(
+    schema_id: Optional[int] = Query(default=None),
+    current_user: Dict = Depends(get_current_user),
+):
+    return service.list_saved_queries(current_user=current_user, schema_id=schema_id)
+
+
+@router.post("", response_model=SavedQueryResponse, status_code=201)
+def create_saved_query(payload: SavedQueryCreate, current_user: Dict = Depends(get_current_user)):
+    return service.create_saved_query(payload.model_dump(), current_user=current_user)
+
+
+@router.get("/{saved_query_id}", response_model=SavedQueryResponse)
+def get_saved_query(saved_query_id: int, current_user: Dict = Depends(get_current_user)):
+    return service.get_saved_query(saved_query_id, current_user=current_user)
+
+
+@router.get("/{saved_query_id}/entries", response_model=SavedQueryEntriesResponse)
+def run_saved_query(
+    saved_query_id: int,
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    current_user: Dict = Depends(get_current_user),
+):
+    return service.run_saved_query(saved_query_id, current_user=current_user, limit=limit, offset=offset)
+
+
+@router.patch("/{saved_query_id}", response_model=SavedQueryResponse)
+def update_saved_query(saved_query_id: int, payload: SavedQueryUpdate, current_user: Dict = Depends(get_current_user)):
+    return service.update_saved_query(saved_query_id, payload.model_dump(exclude_unset=True), current_user=current_user)
+
+
+@router.delete("/{saved_query_id}", response_model=SavedQueryResponse)
+def delete_saved_query(saved_query_id: int, current_user: Dict = Depends(get_current_user)):
+    return service.delete_saved_query(saved_query_id, current_user=current_user)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, SerializerFunctionWrapHandler, model_serializer
 
 from .core.enums import (
     EntryChangeType,
@@ -76,6 +76,28 @@ class MetadataSchemaUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class MetadataSchemaStats(BaseModel):
+    total_entries: int = 0
+    status_counts: Dict[str, int] = Field(default_factory=dict)
+    visibility_counts: Dict[VisibilityLevel, int] = Field(default_factory=dict)
+    last_created_at: Optional[datetime] = None
+    last_updated_at: Optional[datetime] = None
+
+
+class FieldIndexResponse(BaseModel):
+    field_id: int
+    index_name: str
+    status: Literal["pending", "building", "ready", "failed", "dropping"]
+    error: Optional[str] = None
+    updated_at: datetime
+
+
+class FieldPromotionResponse(BaseModel):
+    field_id: int
+    status: Literal["pending", "ready"]
+    updated_at: datetime
+
+
 class MetadataSchemaResponse(MetadataSchemaBase):
     model_config = ConfigDict(from_attributes=True)
 
@@ -83,6 +105,9 @@ class MetadataSchemaResponse(MetadataSchemaBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     fields: List[FieldDefinitionResponse] = Field(default_factory=list)
+    stats: Optional[MetadataSchemaStats] = None
+    field_indexes: List[FieldIndexResponse] = Field(default_factory=list)
+    field_promotions: List[FieldPromotionResponse] = Field(default_factory=list)
 
 
 class EntryBase(BaseModel):
@@ -110,6 +135,12 @@ class EntryUpdate(BaseModel):
     comment: Optional[str] = Field(default=None, max_length=500)
 
 
+class EntryRelationCounts(BaseModel):
+    total: int = 0
+    outgoing: Dict[str, int] = Field(default_factory=dict)
+    incoming: Dict[str, int] = Field(default_factory=dict)
+
+
 class EntryResponse(EntryBase):
     model_config = ConfigDict(from_attributes=True)
 
@@ -120,6 +151,31 @@ class EntryResponse(EntryBase):
     updated_at: Optional[datetime] = None
     archived_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
+    relation_counts: Optional[EntryRelationCounts] = None
+
+
+class SparseResponseModel(BaseModel):
+    @model_serializer(mode="wrap")
+    def _omit_unset_fields(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        return {key: value for key, value in handler(self).items() if key in self.model_fields_set}
+
+
+class SparseEntryResponse(SparseResponseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    schema_id: Optional[int] = None
+    title: Optional[str] = None
+    status: Optional[str] = None
+    visibility_level: Optional[VisibilityLevel] = None
+    owner_id: Optional[int] = None
+    created_by: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    archived_at: Optional[datetime] = None
+    deleted_at: Optional[datetime] = None
+    data_json: Optional[Dict[str, Any]] = None
+    relation_counts: Optional[EntryRelationCounts] = None
 
 
 class EntryRelationCreate(BaseModel):
@@ -129,6 +185,11 @@ class EntryRelationCreate(BaseModel):
     metadata_json: Dict[str, Any] = Field(default_factory=dict)
 
 
+class EntryRelationBulkRequest(BaseModel):
+    mode: Literal["append", "replace"] = "append"
+    relations: List[EntryRelationCreate] = Field(default_factory=list, max_length=1000)
+
+
 class EntryRelationUpdate(BaseModel):
     to_entry_id: Optional[int] = None
     relation_type: Optional[EntryRelationType] = None
@@ -190,6 +251,7 @@ class EntryRelationTreeEntry(BaseModel):
     status: str
     visibility_level: VisibilityLevel
     owner_id: Optional[int] = None
+    relation_counts: Optional[EntryRelationCounts] = None
 
 
 class EntryRelationTreeNode(BaseModel):
@@ -198,6 +260,8 @@ class EntryRelationTreeNode(BaseModel):
     children: List["EntryRelationTreeNode"] = Field(default_factory=list)
     is_reference: bool = False
     reference_reason: Optional[Literal["cycle", "duplicate"]] = None
+    is_expandable: bool = False
+    child_count: int = 0
 
 
 class EntryRelationTreeResponse(BaseModel):
@@ -205,6 +269,22 @@ class EntryRelationTreeResponse(BaseModel):
     tree: EntryRelationTreeNode
 
 
+class EntryRelationPathResponse(BaseModel):
+    from_entry_id: int
+    to_entry_id: int
+    found: bool
+    hops: Optional[int] = None
+    entries: List[EntryRelationTreeEntry] = Field(default_factory=list)
+    relations: List[EntryRelationTreeLink] = Field(default_factory=list)
+
+
+class EntryRelationChildrenResponse(BaseModel):
+    entry_id: int
+    parent_entry_id: Optional[int] = None
+    items: List[EntryRelationTreeNode] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
 class AttachmentResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -268,15 +348,88 @@ class AccessCheckResponse(BaseModel):
     allowed: bool
 
 
-class EntryWithAccessResponse(EntryResponse):
+class SparseEntryWithAccessResponse(SparseEntryResponse):
     access: Dict[str, bool] = Field(default_factory=dict)
 
 
+class SchemaAggregateGroup(BaseModel):
+    keys: Dict[str, Any] = Field(default_factory=dict)
+    values: Dict[str, Any] = Field(default_factory=dict)
+
+
+class SchemaAggregateResponse(BaseModel):
+    schema_id: int
+    group_by: List[str] = Field(default_factory=list)
+    metrics: List[str] = Field(default_factory=list)
+    groups: List[SchemaAggregateGroup] = Field(default_factory=list)
+
+
+class FacetValue(BaseModel):
+    value: Any
+    count: int
+
+
+class SchemaFacet(BaseModel):
+    field_key: str
+    label: str
+    data_type: str
+    values: List[FacetValue] = Field(default_factory=list)
+
+
+class SchemaFacetsResponse(BaseModel):
+    schema_id: int
+    total: int
+    status: List[FacetValue] = Field(default_factory=list)
+    facets: List[SchemaFacet] = Field(default_factory=list)
+
+
+class SavedQueryCreate(BaseModel):
+    schema_id: int
+    name: str = Field(..., min_length=1, max_length=120)
+    role: Optional[str] = None
+    filters: List[str] = Field(default_factory=list)
+    sort: Optional[str] = None
+    fields: List[str] = Field(default_factory=list)
+
+
+class SavedQueryUpdate(BaseModel):
+    name: Optional[str] = Field(default=None, min_length=1, max_length=120)
+    filters: Optional[List[str]] = None
+    sort: Optional[str] = None
+    fields: Optional[List[str]] = None
+
+
+class SavedQueryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    schema_id: int
+    name: str
+    owner_id: Optional[int] = None
+    role: Optional[str] = None
+    filters: List[str] = Field(default_factory=list)
+    sort: Optional[str] = None
+    fields: List[str] = Field(default_factory=list)
+    created_by: Optional[int] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class SavedQueryEntriesResponse(BaseModel):
+    saved_query: SavedQueryResponse
+    refresh: Literal["cache", "incremental", "full"]
+    refreshed_at: datetime
+    entries: List[SparseEntryResponse] = Field(default_factory=list)
+    limit: int
+    offset: int
+    total: int
+
+
 class SchemaEntriesResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     schema_definition: MetadataSchemaResponse = Field(validation_alias="schema", serialization_alias="schema")
-    entries: List[EntryWithAccessResponse] = Field(default_factory=list)
+    entries: List[SparseEntryWithAccessResponse] = Field(default_factory=list)
 
 
 class DashboardEntrySummary(BaseModel):
@@ -292,12 +445,36 @@ class DashboardEntrySummary(BaseModel):
     updated_at: Optional[datetime] = None
 
 
-class EntryLookupResponse(BaseModel):
+class EntryLookupResponse(SparseResponseModel):
     id: int
     title: str
     schema_id: int
     schema_key: str
     schema_name: str
+    data_json: Optional[Dict[str, Any]] = None
+
+
+class EntrySearchHit(EntryLookupResponse):
+    rank: float
+    headline: str
+
+
+class EntrySearchResponse(BaseModel):
+    items: List[EntrySearchHit] = Field(default_factory=list)
+    limit: int
+    offset: int
+    total: int
+
+
+class EntryChangesResponse(BaseModel):
+    changes: List[EntryResponse] = Field(default_factory=list)
+    removed: List[int] = Field(default_factory=list)
+    cursor: str
+    has_more: bool
+
+
+class EntryIncomingReferenceResponse(EntryLookupResponse):
+    field_key: str
 
 
 class DashboardSchemaTotal(BaseModel):
@@ -356,6 +533,10 @@ class EntryBundleResponse(BaseModel):
     permissions: List[EntryPermissionResponse] = Field(default_factory=list)
 
 
+class EntryBundleBatchRequest(BaseModel):
+    entry_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+
 Role = Literal["head_admin", "admin", "manager", "editor", "reader"]
 
 
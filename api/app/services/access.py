@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from ..core.enums import EntryPermission
 from .permissions import PermissionService
@@ -10,8 +10,14 @@ class EntryAccessService:
     def __init__(self):
         self.permissions = PermissionService()
 
-    def get_access_map(self, entry: Dict[str, Any], current_user: Optional[Dict[str, Any]]) -> Dict[str, bool]:
-        return self.permissions.get_access_map(entry, current_user)
+    def get_access_map(
+        self,
+        entry: Dict[str, Any],
+        current_user: Optional[Dict[str, Any]],
+        *,
+        grants: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, bool]:
+        return self.permissions.get_access_map(entry, current_user, grants=grants)
 
     def check_access(
         self,
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DASHBOARD_CACHE_TTL_SECONDS = float(os.environ.get("DASHBOARD_CACHE_TTL_SECONDS", "15"))
+FACET_CACHE_TTL_SECONDS = float(os.environ.get("FACET_CACHE_TTL_SECONDS", "5"))
+
+
+class _Flight:
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._values: Dict[Hashable, Tuple[float, Any]] = {}
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if self.ttl_seconds <= 0:
+            return compute()
+
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight(self._generation)
+                self._flights[key] = flight
+
+        if not is_leader:
+            return flight.wait()
+
+        try:
+            flight.value = compute()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                # A write that invalidated the cache while we were computing makes the result stale.
+                if flight.error is None and flight.generation == self._generation:
+                    self._values[key] = (time.monotonic() + self.ttl_seconds, flight.value)
+            flight.done.set()
+        return flight.value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._values.clear()
+            self._flights.clear()
+
+
+def scope_cache_key(scope: Dict[str, Any]) -> Hashable:
+    if scope["is_admin"]:
+        return ("admin",)
+    if scope["user_id"] is None:
+        return ("anonymous",)
+    return ("user", scope["user_id"], scope["role"])
+
+
+def invalidate_read_caches() -> None:
+    dashboard_cache.invalidate()
+    facet_cache.invalidate()
+
+
+dashboard_cache = TTLCache(DASHBOARD_CACHE_TTL_SECONDS)
+facet_cache = TTLCache(FACET_CACHE_TTL_SECONDS)
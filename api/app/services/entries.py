@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from ..core.enums import EntryChangeType, EntryPermission
-from ..core.errors import ValidationError
+from ..core.enums import EntryChangeType, EntryPermission, FieldDataType
+from ..core.errors import ForbiddenError, ValidationError
 from ..repositories.metadata import EntryRepository, FieldRepository, SchemaRepository, ensure_unique_field_value
 from ..validation.entries import validate_entry_payload
-from .attachments import AttachmentService
+from ..validation.filters import (
+    ENTRY_LOOKUP_COLUMNS,
+    ENTRY_SORT_COLUMNS,
+    apply_entry_projection,
+    is_blob_field,
+    parse_entry_fields,
+    parse_entry_filters,
+    parse_entry_sort,
+)
 from .access import EntryAccessService
+from .cache import invalidate_read_caches
 from .entry_history import EntryHistoryService
 from .permissions import PermissionService
-from .relations import RelationService
+
+_REFERENCE_TARGET_TYPES = {FieldDataType.REFERENCE.value: "entry", FieldDataType.FILE.value: "attachment"}
 
 
 class EntryService:
@@ -21,8 +31,6 @@ class EntryService:
         self.history = EntryHistoryService()
         self.permissions = PermissionService()
         self.access = EntryAccessService()
-        self.relations = RelationService()
-        self.attachments = AttachmentService()
 
     def list_entries(
         self,
@@ -30,9 +38,38 @@ class EntryService:
         current_user: Optional[Dict[str, Any]],
         schema_id: Optional[int] = None,
         owner_id: Optional[int] = None,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        rows = self.entries.list_entries(schema_id=schema_id, owner_id=owner_id)
-        return [row for row in rows if self.permissions.check_access(row, current_user, EntryPermission.READ)]
+        parsed_filters: List[Dict[str, Any]] = []
+        parsed_sort: Optional[Dict[str, Any]] = None
+        projection: Optional[Dict[str, Any]] = None
+        schema_fields: Optional[List[Dict[str, Any]]] = None
+        promoted_field_ids: Set[int] = set()
+        if schema_id is not None and (filters or sort or fields):
+            schema_fields = self.fields.list_fields(self.schemas.get_schema(schema_id)["id"])
+            promoted_field_ids = self.fields.list_promoted_field_ids(schema_id)
+        if schema_fields is None and (filters or (sort and sort.lstrip("-") not in ENTRY_SORT_COLUMNS)):
+            raise ValidationError([{"field": "schema_id", "message": "schema_id is required to filter or sort by fields"}])
+        if filters:
+            parsed_filters = parse_entry_filters(fields=schema_fields, filters=filters, promoted_field_ids=promoted_field_ids)
+        if sort:
+            parsed_sort = parse_entry_sort(fields=schema_fields or [], sort=sort, promoted_field_ids=promoted_field_ids)
+        if fields:
+            projection = parse_entry_fields(fields=schema_fields, requested=fields)
+        rows = self.entries.list_entries(
+            schema_id=schema_id,
+            owner_id=owner_id,
+            filters=parsed_filters,
+            sort=parsed_sort,
+            projection=projection,
+        )
+        return [
+            apply_entry_projection(row, projection)
+            for row in rows
+            if self.permissions.check_access(row, current_user, EntryPermission.READ)
+        ]
 
     def list_entry_lookup(
         self,
@@ -41,36 +78,69 @@ class EntryService:
         search: Optional[str] = None,
         schema_id: Optional[int] = None,
         limit: int = 20,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        schema_rows = self.schemas.list_schemas(include_inactive=True)
-        schema_map = {row["id"]: row for row in schema_rows}
-        visible_entries = self.list_entries(current_user=current_user, schema_id=schema_id)
-
-        normalized_search = (search or "").strip().lower()
-        if normalized_search:
-            visible_entries = [
-                row
-                for row in visible_entries
-                if normalized_search in row["title"].lower()
-                or normalized_search in (schema_map.get(row["schema_id"], {}).get("key") or "").lower()
-                or normalized_search in (schema_map.get(row["schema_id"], {}).get("name") or "").lower()
-            ]
-
-        result: List[Dict[str, Any]] = []
-        for entry in visible_entries[:limit]:
-            schema = schema_map.get(entry["schema_id"])
-            if not schema:
-                continue
-            result.append(
-                {
-                    "id": entry["id"],
-                    "title": entry["title"],
-                    "schema_id": schema["id"],
-                    "schema_key": schema["key"],
-                    "schema_name": schema["name"],
-                }
-            )
-        return result
+        projection: Optional[Dict[str, Any]] = None
+        if fields:
+            schema_fields = None
+            if schema_id is not None:
+                schema_fields = self.fields.list_fields(self.schemas.get_schema(schema_id)["id"])
+            projection = parse_entry_fields(fields=schema_fields, requested=fields, columns=ENTRY_LOOKUP_COLUMNS)
+        return self.entries.search_entry_lookup(
+            search=(search or "").strip() or None,
+            schema_id=schema_id,
+            limit=limit,
+            projection=projection,
+            **self.permissions.get_query_scope(current_user),
+        )
+
+    def search_entries(
+        self,
+        *,
+        current_user: Optional[Dict[str, Any]],
+        search: str,
+        schema_id: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        if not search.strip():
+            raise ValidationError([{"field": "q", "message": "Search text is required"}])
+        return self.entries.search_entries(
+            search=search.strip(),
+            schema_id=schema_id,
+            limit=limit,
+            offset=offset,
+            **self.permissions.get_query_scope(current_user),
+        )
+
+    def list_entry_changes(
+        self,
+        *,
+        current_user: Optional[Dict[str, Any]],
+        since: Optional[str] = None,
+        schema_id: Optional[int] = None,
+        limit: int = 500,
+    ) -> Dict[str, Any]:
+        after_seq, after_id = self._parse_change_cursor(since)
+        rows = self.entries.list_entry_changes(
+            after_seq=after_seq,
+            after_id=after_id,
+            limit=limit + 1,
+            schema_id=schema_id,
+            **self.permissions.get_query_scope(current_user),
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        changes: List[Dict[str, Any]] = []
+        removed: List[int] = []
+        for row in rows:
+            was_removed = row.pop("removed")
+            if row.pop("readable"):
+                changes.append(row)
+            elif since is not None and was_removed:
+                removed.append(row["id"])
+        cursor = f"{rows[-1]['change_seq']}.{rows[-1]['id']}" if rows else f"{after_seq}.{after_id}"
+        return {"changes": changes, "removed": removed, "cursor": cursor, "has_more": has_more}
 
     def get_entry(
         self,
@@ -89,24 +159,94 @@ class EntryService:
         *,
         current_user: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
-        entry = self.get_entry(entry_id, current_user=current_user, permission=EntryPermission.READ)
-        access = self._build_access_map(entry, current_user)
-        relations = self.relations.list_relations(entry_id)
-        return {
-            "entry": entry,
-            "schema": self._get_schema_with_fields(entry["schema_id"]),
-            "access": access,
-            "history": self.history.list_history(entry_id) if access[EntryPermission.VIEW_HISTORY.value] else [],
-            "relations": relations,
-            "relation_targets": self._list_relation_targets(entry_id, relations),
-            "attachments": self.attachments.list_attachments(entry_id),
-            "permissions": self.permissions.list_permissions(entry_id) if access[EntryPermission.MANAGE_PERMISSIONS.value] else [],
-        }
+        bundle = self.entries.get_entry_bundle(entry_id)
+        entry = bundle["entry"]
+        access = self._build_access_map(entry, current_user, grants=bundle["permissions"])
+        if not access[EntryPermission.READ.value]:
+            raise ForbiddenError("Access denied for requested entry")
+        return self._compose_bundle(
+            entry,
+            access=access,
+            schema=bundle["schema"],
+            history=bundle["history"],
+            relations=bundle["relations"],
+            relation_targets=bundle["relation_targets"],
+            attachments=bundle["attachments"],
+            permissions=bundle["permissions"],
+        )
+
+    def list_entry_bundles(
+        self,
+        entry_ids: List[int],
+        *,
+        current_user: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        requested_ids = list(dict.fromkeys(entry_ids))
+        rows = {row["id"]: row for row in self.entries.list_entries_with_grants(requested_ids)}
+
+        readable: List[Tuple[Dict[str, Any], Dict[str, bool], List[Dict[str, Any]]]] = []
+        for entry_id in requested_ids:
+            entry = rows.get(entry_id)
+            if entry is None:
+                continue
+            grants = entry.pop("grants")
+            access = self._build_access_map(entry, current_user, grants=grants)
+            if access[EntryPermission.READ.value]:
+                readable.append((entry, access, grants))
+        if not readable:
+            return []
+
+        sections = self.entries.list_bundle_sections(
+            [entry["id"] for entry, _, _ in readable],
+            history_entry_ids=[entry["id"] for entry, access, _ in readable if access[EntryPermission.VIEW_HISTORY.value]],
+        )
+        schemas = {schema["id"]: dict(schema, fields=[]) for schema in sections["schemas"]}
+        for field in sections["fields"]:
+            schemas[field["schema_id"]]["fields"].append(field)
+        targets = {target["id"]: target for target in sections["relation_targets"]}
+
+        relations_by_entry: Dict[int, List[Dict[str, Any]]] = {}
+        for relation in sections["relations"]:
+            relations_by_entry.setdefault(relation["from_entry_id"], []).append(relation)
+            relations_by_entry.setdefault(relation["to_entry_id"], []).append(relation)
+        history_by_entry: Dict[int, List[Dict[str, Any]]] = {}
+        for item in sections["history"]:
+            history_by_entry.setdefault(item["entry_id"], []).append(item)
+        attachments_by_entry: Dict[int, List[Dict[str, Any]]] = {}
+        for item in sections["attachments"]:
+            attachments_by_entry.setdefault(item["entry_id"], []).append(item)
+
+        bundles: List[Dict[str, Any]] = []
+        for entry, access, grants in readable:
+            entry_id = entry["id"]
+            relations = relations_by_entry.get(entry_id, [])
+            neighbor_ids = {
+                relation["to_entry_id"] if relation["from_entry_id"] == entry_id else relation["from_entry_id"]
+                for relation in relations
+            }
+            relation_targets = sorted(
+                (targets[neighbor_id] for neighbor_id in neighbor_ids if neighbor_id in targets),
+                key=lambda target: (target["title"], target["id"]),
+            )
+            bundles.append(
+                self._compose_bundle(
+                    entry,
+                    access=access,
+                    schema=schemas[entry["schema_id"]],
+                    history=history_by_entry.get(entry_id, []),
+                    relations=relations,
+                    relation_targets=relation_targets,
+                    attachments=attachments_by_entry.get(entry_id, []),
+                    permissions=grants,
+                )
+            )
+        return bundles
 
     def create_entry(self, payload: Dict[str, Any], *, current_user: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         schema = self.schemas.get_schema(payload["schema_id"])
         fields = self.fields.list_fields(schema["id"])
         validated_data = validate_entry_payload(fields=fields, data=payload.get("data_json") or {}, partial=False)
+        self._ensure_references_exist(fields, validated_data)
         self._ensure_unique_fields(schema["id"], fields, validated_data)
 
         actor_id = (current_user or {}).get("id")
@@ -133,6 +273,7 @@ class EntryService:
             new_visibility_level=entry["visibility_level"],
             comment="Entry created",
         )
+        invalidate_read_caches()
         return entry
 
     def update_entry(
@@ -152,6 +293,7 @@ class EntryService:
 
         if "data_json" in payload and payload["data_json"] is not None:
             validated = validate_entry_payload(fields=fields, data=payload["data_json"], partial=True)
+            self._ensure_references_exist(fields, validated)
             new_data.update(validated)
             self._ensure_unique_fields(existing["schema_id"], fields, new_data, exclude_entry_id=entry_id)
             update_fields["data_json"] = new_data
@@ -177,6 +319,7 @@ class EntryService:
             new_visibility_level=updated["visibility_level"],
             comment=payload.get("comment"),
         )
+        invalidate_read_caches()
         return updated
 
     def _permissions_for_update(self, payload: Dict[str, Any]) -> List[EntryPermission]:
@@ -197,6 +340,43 @@ class EntryService:
         self.get_entry(entry_id, current_user=current_user, permission=EntryPermission.VIEW_HISTORY)
         return self.history.list_history(entry_id)
 
+    def list_incoming_references(self, entry_id: int, *, current_user: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        self.get_entry(entry_id, current_user=current_user, permission=EntryPermission.READ)
+        return self.entries.list_incoming_references(entry_id, **self.permissions.get_query_scope(current_user))
+
+    def _ensure_references_exist(self, fields: List[Dict[str, Any]], data_json: Dict[str, Any]) -> None:
+        targets: List[Tuple[str, str, List[int]]] = []
+        for field in fields:
+            target_type = _REFERENCE_TARGET_TYPES.get(field["data_type"])
+            value = data_json.get(field["key"])
+            if target_type is None or value is None:
+                continue
+            targets.append((field["key"], target_type, value if isinstance(value, list) else [value]))
+        if not targets:
+            return
+
+        existing = self.entries.list_existing_reference_targets(
+            sorted({target_id for _, target_type, ids in targets if target_type == "entry" for target_id in ids}),
+            sorted({target_id for _, target_type, ids in targets if target_type == "attachment" for target_id in ids}),
+        )
+        errors = []
+        for field_key, target_type, target_ids in targets:
+            missing = [target_id for target_id in target_ids if target_id not in existing[target_type]]
+            if missing:
+                label = "entries" if target_type == "entry" else "attachments"
+                errors.append({"field": field_key, "message": f"Referenced {label} not found: {missing}"})
+        if errors:
+            raise ValidationError(errors)
+
+    @staticmethod
+    def _parse_change_cursor(since: Optional[str]) -> Tuple[int, int]:
+        if since is None:
+            return 0, 0
+        seq, _, entry_id = since.partition(".")
+        if not (seq.isdigit() and entry_id.isdigit()):
+            raise ValidationError([{"field": "since", "message": "Expected a cursor returned by this endpoint"}])
+        return int(seq), int(entry_id)
+
     def _ensure_unique_fields(
         self,
         schema_id: int,
@@ -211,21 +391,42 @@ class EntryService:
             field_key = field["key"]
             if field_key not in data_json or data_json[field_key] is None:
                 continue
-            ensure_unique_field_value(schema_id, field_key, data_json[field_key], exclude_entry_id=exclude_entry_id)
-
-    def _build_access_map(self, entry: Dict[str, Any], current_user: Optional[Dict[str, Any]]) -> Dict[str, bool]:
-        return self.access.get_access_map(entry, current_user)
+            ensure_unique_field_value(
+                schema_id,
+                field_key,
+                data_json[field_key],
+                exclude_entry_id=exclude_entry_id,
+                external=is_blob_field(field),
+            )
 
-    def _get_schema_with_fields(self, schema_id: int) -> Dict[str, Any]:
-        schema = self.schemas.get_schema(schema_id)
-        schema["fields"] = self.fields.list_fields(schema_id, include_inactive=True)
-        return schema
+    def _compose_bundle(
+        self,
+        entry: Dict[str, Any],
+        *,
+        access: Dict[str, bool],
+        schema: Dict[str, Any],
+        history: List[Dict[str, Any]],
+        relations: List[Dict[str, Any]],
+        relation_targets: List[Dict[str, Any]],
+        attachments: List[Dict[str, Any]],
+        permissions: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        return {
+            "entry": entry,
+            "schema": schema,
+            "access": access,
+            "history": history if access[EntryPermission.VIEW_HISTORY.value] else [],
+            "relations": relations,
+            "relation_targets": relation_targets,
+            "attachments": attachments,
+            "permissions": permissions if access[EntryPermission.MANAGE_PERMISSIONS.value] else [],
+        }
 
-    def _list_relation_targets(self, entry_id: int, relations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        related_entry_ids = sorted(
-            {
-                relation["to_entry_id"] if relation["from_entry_id"] == entry_id else relation["from_entry_id"]
-                for relation in relations
-            }
-        )
-        return self.entries.list_entry_lookup_by_ids(related_entry_ids)
+    def _build_access_map(
+        self,
+        entry: Dict[str, Any],
+        current_user: Optional[Dict[str, Any]],
+        *,
+        grants: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, bool]:
+        return self.access.get_access_map(entry, current_user, grants=grants)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.enums import EntryPermission
+from ..repositories.metadata import EntryRepository
+from .notifications import notification_listener
+from .permissions import PermissionService
+from .relation_index import RELATION_INDEX_CHANNEL
+
+ENTRY_EVENTS_ENABLED = os.environ.get("ENTRY_EVENTS_ENABLED", "true").lower() in {"1", "true", "yes", "on"}
+ENTRY_EVENTS_CHANNEL = "entries_changed"
+ENTRY_EVENTS_QUEUE_SIZE = int(os.environ.get("ENTRY_EVENTS_QUEUE_SIZE", "100"))
+ENTRY_EVENTS_HEARTBEAT_SECONDS = float(os.environ.get("ENTRY_EVENTS_HEARTBEAT_SECONDS", "15"))
+ENTRY_EVENTS_BATCH_SIZE = int(os.environ.get("ENTRY_EVENTS_BATCH_SIZE", "500"))
+
+_RELATION_EVENTS = {"INSERT": "relation.created", "UPDATE": "relation.updated", "DELETE": "relation.deleted"}
+
+logger = logging.getLogger(__name__)
+
+
+class EventSubscription:
+    def __init__(
+        self,
+        user: Optional[Dict[str, Any]],
+        *,
+        schema_id: Optional[int],
+        loop: asyncio.AbstractEventLoop,
+        max_queued: int,
+    ):
+        self.user = user
+        self.schema_id = schema_id
+        self.max_queued = max_queued
+        self.overflowed = False
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        self._loop.call_soon_threadsafe(self._put, event)
+
+    async def next_event(self, timeout: float) -> Optional[Dict[str, Any]]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        if self.overflowed:
+            return
+        if self._queue.qsize() >= self.max_queued:
+            # A subscriber that cannot keep up is cut off rather than buffering without bound.
+            self.overflowed = True
+            event = {"event": "overflow"}
+        self._queue.put_nowait(event)
+
+
+_PendingEvent = Tuple[Dict[str, Any], List[int], Dict[int, Dict[str, Any]]]
+
+
+class EntryEventBroker:
+    def __init__(self, repository: Optional[EntryRepository] = None, *, batch_size: int = ENTRY_EVENTS_BATCH_SIZE):
+        self.entries = repository or EntryRepository()
+        self.permissions = PermissionService()
+        self.batch_size = batch_size
+        self._subscribers: Set[EventSubscription] = set()
+        self._lock = threading.Lock()
+        self._pending: queue.Queue[_PendingEvent] = queue.Queue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="entry-event-fanout", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self._thread = None
+
+    def subscribe(
+        self,
+        user: Optional[Dict[str, Any]],
+        *,
+        loop: asyncio.AbstractEventLoop,
+        schema_id: Optional[int] = None,
+        max_queued: int = ENTRY_EVENTS_QUEUE_SIZE,
+    ) -> EventSubscription:
+        subscription = EventSubscription(user, schema_id=schema_id, loop=loop, max_queued=max_queued)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def handle_entry_notification(self, payload: str) -> None:
+        change = json.loads(payload)
+        event = {
+            "event": change["event"],
+            "entry_id": change["id"],
+            "schema_id": change["schema_id"],
+            "change_seq": change["change_seq"],
+        }
+        # A hard-deleted row is gone by the time we look, so fall back to what the trigger sent.
+        self._pending.put((event, [change["id"]], {change["id"]: {**change, "grants": []}}))
+
+    def handle_relation_notification(self, payload: str) -> None:
+        relation = json.loads(payload)
+        event = {
+            "event": _RELATION_EVENTS[relation["op"]],
+            "relation_id": relation["id"],
+            "from_entry_id": relation["from_entry_id"],
+            "to_entry_id": relation["to_entry_id"],
+            "relation_type": relation["relation_type"],
+        }
+        self._pending.put((event, [relation["from_entry_id"], relation["to_entry_id"]], {}))
+
+    def resync(self) -> None:
+        # Notifications sent while the listener was disconnected are lost; clients catch up via /entries/changes.
+        self._pending.put(({"event": "resync"}, [], {}))
+
+    def publish_pending(self, *, timeout: Optional[float] = None) -> int:
+        try:
+            batch = [self._pending.get(timeout=timeout)]
+        except queue.Empty:
+            return 0
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._pending.get_nowait())
+            except queue.Empty:
+                break
+        self._publish(batch)
+        return len(batch)
+
+    def _run(self) -> None:
+        # Fan-out runs here so the shared listener thread only parses and queues notifications.
+        while not self._stop.is_set():
+            try:
+                self.publish_pending(timeout=1.0)
+            except Exception:
+                logger.exception("Entry event fan-out failed")
+
+    def _publish(self, batch: List[_PendingEvent]) -> None:
+        subscribers = self._snapshot()
+        if not subscribers:
+            return
+        entry_ids = sorted({entry_id for _, ids, _ in batch for entry_id in ids})
+        rows = {row["id"]: row for row in self.entries.list_entry_access(entry_ids)}
+        for event, ids, fallback in batch:
+            if not ids:
+                self._deliver(event, subscribers)
+                continue
+            entries = [rows.get(entry_id) or fallback.get(entry_id) for entry_id in ids]
+            if any(entry is None for entry in entries):
+                continue
+            recipients = [
+                subscription
+                for subscription in subscribers
+                if (subscription.schema_id is None or any(entry["schema_id"] == subscription.schema_id for entry in entries))
+                and all(self._can_read(entry, subscription.user) for entry in entries)
+            ]
+            self._deliver(event, recipients)
+
+    def _deliver(self, event: Dict[str, Any], subscribers: Iterable[EventSubscription]) -> None:
+        for subscription in subscribers:
+            try:
+                subscription.offer(event)
+            except RuntimeError:
+                logger.warning("Dropping event subscriber whose event loop is closed")
+                self.unsubscribe(subscription)
+
+    def _can_read(self, entry: Dict[str, Any], user: Optional[Dict[str, Any]]) -> bool:
+        access = self.permissions.get_access_map(entry, user, grants=entry.get("grants") or [])
+        return access[EntryPermission.READ.value]
+
+    def _snapshot(self) -> List[EventSubscription]:
+        with self._lock:
+            return list(self._subscribers)
+
+
+entry_event_broker = EntryEventBroker()
+
+
+def start_entry_events() -> None:
+    if not ENTRY_EVENTS_ENABLED:
+        return
+    notification_listener.subscribe(
+        ENTRY_EVENTS_CHANNEL,
+        entry_event_broker.handle_entry_notification,
+        on_connect=entry_event_broker.resync,
+    )
+    notification_listener.subscribe(RELATION_INDEX_CHANNEL, entry_event_broker.handle_relation_notification)
+    entry_event_broker.start()
+    notification_listener.start()
+
+
+def stop_entry_events() -> None:
+    if not ENTRY_EVENTS_ENABLED:
+        return
+    notification_listener.stop()
+    entry_event_broker.stop()
@@ -2,18 +2,38 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from ..core.enums import EntryPermission
-from ..core.errors import ValidationError
-from ..repositories.metadata import EntryRepository, FieldRepository, SchemaRepository
+from fastapi import BackgroundTasks
+
+from ..core.enums import EntryPermission, FieldDataType
+from ..core.errors import NotFoundError, ValidationError
+from ..repositories.metadata import EntryRepository, FieldRepository, SchemaRepository, SchemaStatsRepository
 from .access import EntryAccessService
+from .cache import facet_cache, invalidate_read_caches, scope_cache_key
+from ..validation.aggregates import parse_aggregate_request
+from ..validation.filters import (
+    apply_entry_projection,
+    is_blob_field,
+    is_list_field,
+    parse_entry_fields,
+    parse_entry_filters,
+    value_kind,
+)
 from .permissions import PermissionService
 
+SEARCH_WEIGHTS = {"A", "B", "C", "D"}
+_SEARCHABLE_DATA_TYPES = {FieldDataType.TEXT.value, FieldDataType.LONG_TEXT.value}
+_FACET_DATA_TYPES = {FieldDataType.SELECT.value, FieldDataType.MULTI_SELECT.value}
+_FREE_TEXT_DATA_TYPES = {FieldDataType.TEXT.value, FieldDataType.EMAIL.value, FieldDataType.URL.value}
+# B-tree entries are capped at about 2.7 kB; 512 characters stay below it even at 4 bytes per character.
+INDEXED_TEXT_MAX_LENGTH = 512
+
 
 class MetadataSchemaService:
     def __init__(self):
         self.schemas = SchemaRepository()
         self.fields = FieldRepository()
         self.entries = EntryRepository()
+        self.stats = SchemaStatsRepository()
         self.permissions = PermissionService()
         self.access = EntryAccessService()
 
@@ -23,16 +43,29 @@ class MetadataSchemaService:
     def get_schema(self, schema_id: int) -> Dict[str, Any]:
         schema = self.schemas.get_schema(schema_id)
         schema["fields"] = self.fields.list_fields(schema_id, include_inactive=True)
+        schema["stats"] = self.stats.get_stats(schema_id)
+        schema["field_indexes"] = self.fields.list_field_indexes(schema_id)
+        schema["field_promotions"] = self.fields.list_field_promotions(schema_id)
         return schema
 
-    def get_schema_entries(self, schema_id: int, *, current_user: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    def get_schema_entries(
+        self,
+        schema_id: int,
+        *,
+        current_user: Optional[Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         schema = self.get_schema(schema_id)
-        rows = self.entries.list_entries(schema_id=schema_id)
+        projection = None
+        if fields:
+            active_fields = [field for field in schema["fields"] if field["is_active"]]
+            projection = parse_entry_fields(fields=active_fields, requested=fields)
+        rows = self.entries.list_entries(schema_id=schema_id, projection=projection)
         visible_entries = []
         for row in rows:
             if not self.permissions.check_access(row, current_user, EntryPermission.READ):
                 continue
-            entry = dict(row)
+            entry = apply_entry_projection(dict(row), projection)
             entry["access"] = self.access.get_access_map(row, current_user)
             visible_entries.append(entry)
         return {
@@ -40,9 +73,99 @@ class MetadataSchemaService:
             "entries": visible_entries,
         }
 
+    def aggregate_entries(
+        self,
+        schema_id: int,
+        *,
+        current_user: Optional[Dict[str, Any]],
+        metrics: List[str],
+        group_by: List[str],
+        filters: List[str],
+        limit: int = 1000,
+    ) -> Dict[str, Any]:
+        self.schemas.get_schema(schema_id)
+        fields = self.fields.list_fields(schema_id)
+        promoted_field_ids = self.fields.list_promoted_field_ids(schema_id)
+        request = parse_aggregate_request(
+            fields=fields,
+            metrics=metrics,
+            group_by=group_by,
+            promoted_field_ids=promoted_field_ids,
+        )
+        groups = self.entries.aggregate_entries(
+            schema_id,
+            group_by=request["group_by"],
+            metrics=request["metrics"],
+            filters=parse_entry_filters(fields=fields, filters=filters, promoted_field_ids=promoted_field_ids),
+            limit=limit,
+            **self.permissions.get_query_scope(current_user),
+        )
+        return {
+            "schema_id": schema_id,
+            "group_by": [group["name"] for group in request["group_by"]],
+            "metrics": [metric["name"] for metric in request["metrics"]],
+            "groups": groups,
+        }
+
+    def get_facets(
+        self,
+        schema_id: int,
+        *,
+        current_user: Optional[Dict[str, Any]],
+        filters: List[str],
+    ) -> Dict[str, Any]:
+        self.schemas.get_schema(schema_id)
+        fields = self.fields.list_fields(schema_id)
+        facet_fields = [field for field in fields if field["data_type"] in _FACET_DATA_TYPES]
+        single_keys = [field["key"] for field in facet_fields if field["data_type"] == FieldDataType.SELECT.value]
+        multi_keys = [field["key"] for field in facet_fields if field["data_type"] == FieldDataType.MULTI_SELECT.value]
+        parsed_filters = parse_entry_filters(
+            fields=fields,
+            filters=filters,
+            promoted_field_ids=self.fields.list_promoted_field_ids(schema_id),
+        )
+        scope = self.permissions.get_query_scope(current_user)
+        cache_key = (schema_id, tuple(single_keys), tuple(multi_keys), tuple(sorted(filters)), scope_cache_key(scope))
+        counts = facet_cache.get_or_compute(
+            cache_key,
+            lambda: self.entries.facet_entries(
+                schema_id,
+                single_keys=single_keys,
+                multi_keys=multi_keys,
+                filters=parsed_filters,
+                **scope,
+            ),
+        )
+        return {
+            "schema_id": schema_id,
+            "total": counts["total"],
+            "status": self._facet_values([], counts["status"]),
+            "facets": [
+                {
+                    "field_key": field["key"],
+                    "label": field["label"],
+                    "data_type": field["data_type"],
+                    "values": self._facet_values(
+                        (field.get("validation_json") or {}).get("options") or [],
+                        counts["fields"].get(field["key"], {}),
+                    ),
+                }
+                for field in facet_fields
+            ],
+        }
+
+    def _facet_values(self, options: List[Any], counts: Dict[Any, int]) -> List[Dict[str, Any]]:
+        values = [{"value": option, "count": counts.get(option, 0)} for option in options if not isinstance(option, (dict, list))]
+        listed = {value["value"] for value in values}
+        extra = sorted(((value, count) for value, count in counts.items() if value not in listed), key=lambda item: (-item[1], str(item[0])))
+        values.extend({"value": value, "count": count} for value, count in extra)
+        return values
+
     def create_schema(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         schema = self.schemas.create_schema(payload)
         schema["fields"] = []
+        schema["field_indexes"] = []
+        schema["field_promotions"] = []
         return schema
 
     def update_schema(self, schema_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -50,19 +173,41 @@ class MetadataSchemaService:
         if not payload:
             raise ValidationError([{"field": "_request", "message": "No fields to update"}])
         updated = self.schemas.update_schema(schema_id, payload)
+        invalidate_read_caches()
         updated["fields"] = self.fields.list_fields(schema_id, include_inactive=True)
+        updated["stats"] = self.stats.get_stats(schema_id)
+        updated["field_indexes"] = self.fields.list_field_indexes(schema_id)
+        updated["field_promotions"] = self.fields.list_field_promotions(schema_id)
         return updated
 
-    def delete_schema(self, schema_id: int) -> Dict[str, Any]:
+    def delete_schema(self, schema_id: int, *, background_tasks: Optional[BackgroundTasks] = None) -> Dict[str, Any]:
         schema = self.get_schema(schema_id)
         self.schemas.delete_schema(schema_id)
+        invalidate_read_caches()
+        for field_index in schema["field_indexes"]:
+            self._run_task(background_tasks, self.fields.drop_field_index, field_index["field_id"])
         return schema
 
-    def add_field(self, schema_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def add_field(
+        self,
+        schema_id: int,
+        payload: Dict[str, Any],
+        *,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Dict[str, Any]:
         self.schemas.get_schema(schema_id)
         record = dict(payload)
         record["schema_id"] = schema_id
-        return self.fields.create_field(record)
+        self._validate_field_settings(record)
+        self._check_existing_value_lengths(schema_id, record)
+        created = self.fields.create_field(record)
+        if self._is_searchable(created):
+            self._run_task(background_tasks, self.reindex_search_documents, schema_id)
+        if self._index_definition(created) is not None:
+            self._schedule_index_sync(schema_id, created["id"], "pending", background_tasks)
+        if self._promotion_definition(created) is not None:
+            self._schedule_promotion_backfill(schema_id, created["id"], background_tasks)
+        return created
 
     def list_fields(self, schema_id: int, *, include_inactive: bool = True) -> List[Dict[str, Any]]:
         self.schemas.get_schema(schema_id)
@@ -72,12 +217,181 @@ class MetadataSchemaService:
         self.schemas.get_schema(schema_id)
         return self.fields.get_field(schema_id, field_id)
 
-    def update_field(self, schema_id: int, field_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def update_field(
+        self,
+        schema_id: int,
+        field_id: int,
+        payload: Dict[str, Any],
+        *,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Dict[str, Any]:
         self.schemas.get_schema(schema_id)
         if not payload:
             raise ValidationError([{"field": "_request", "message": "No fields to update"}])
-        return self.fields.update_field(schema_id, field_id, payload)
+        existing = self.fields.get_field(schema_id, field_id)
+        merged = {**existing, **payload}
+        self._validate_field_settings(merged)
+        if self._value_length_bound(merged) != self._value_length_bound(existing):
+            self._check_existing_value_lengths(schema_id, merged)
+        updated = self.fields.update_field(schema_id, field_id, payload)
+        if self._search_definition(existing) != self._search_definition(updated):
+            self._run_task(background_tasks, self.reindex_search_documents, schema_id)
+        if self._index_definition(existing) != self._index_definition(updated):
+            status = "dropping" if self._index_definition(updated) is None else "pending"
+            self._schedule_index_sync(schema_id, field_id, status, background_tasks)
+        if self._promotion_definition(existing) != self._promotion_definition(updated):
+            if self._promotion_definition(updated) is None:
+                self.fields.remove_field_promotion(field_id)
+            else:
+                self._schedule_promotion_backfill(schema_id, field_id, background_tasks)
+        return updated
 
-    def delete_field(self, schema_id: int, field_id: int) -> Dict[str, Any]:
+    def delete_field(
+        self,
+        schema_id: int,
+        field_id: int,
+        *,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Dict[str, Any]:
         self.schemas.get_schema(schema_id)
-        return self.fields.delete_field(schema_id, field_id)
+        deleted = self.fields.delete_field(schema_id, field_id)
+        if self._is_searchable(deleted):
+            self._run_task(background_tasks, self.reindex_search_documents, schema_id)
+        if self._index_definition(deleted) is not None:
+            self._schedule_index_sync(schema_id, field_id, "dropping", background_tasks)
+        return deleted
+
+    def reindex_search_documents(self, schema_id: int) -> int:
+        return self.entries.rebuild_search_documents(schema_id)
+
+    def sync_field_index(self, schema_id: int, field_id: int) -> None:
+        try:
+            field = self.fields.get_field(schema_id, field_id)
+        except NotFoundError:
+            field = None
+        if field is None or self._index_definition(field) is None:
+            self.fields.drop_field_index(field_id)
+            return
+        kind = value_kind(FieldDataType(field["data_type"]))
+        self.fields.build_field_index(schema_id, field_id, key=field["key"], kind=kind)
+
+    def _schedule_promotion_backfill(
+        self,
+        schema_id: int,
+        field_id: int,
+        background_tasks: Optional[BackgroundTasks],
+    ) -> None:
+        # Reads keep using data_json until the backfill marks the promotion ready.
+        self.fields.mark_field_promotion(schema_id, field_id, "pending")
+        self._run_task(background_tasks, self.fields.backfill_field_values, schema_id, field_id)
+
+    def _schedule_index_sync(
+        self,
+        schema_id: int,
+        field_id: int,
+        status: str,
+        background_tasks: Optional[BackgroundTasks],
+    ) -> None:
+        self.fields.mark_field_index(schema_id, field_id, status)
+        self._run_task(background_tasks, self.sync_field_index, schema_id, field_id)
+
+    @staticmethod
+    def _run_task(background_tasks: Optional[BackgroundTasks], task, *args: Any) -> None:
+        if background_tasks is None:
+            task(*args)
+        else:
+            background_tasks.add_task(task, *args)
+
+    @staticmethod
+    def _validate_field_settings(field: Dict[str, Any]) -> None:
+        settings = field.get("settings_json") or {}
+        errors = []
+        for flag in ("indexed", "promoted"):
+            enabled = settings.get(flag, False)
+            if not isinstance(enabled, bool):
+                errors.append({"field": f"settings_json.{flag}", "message": "Expected boolean"})
+            elif enabled and (is_blob_field(field) or is_list_field(field)):
+                errors.append({"field": f"settings_json.{flag}", "message": f"Only short single-value fields can be {flag}"})
+            elif enabled and field.get("data_type") in _FREE_TEXT_DATA_TYPES and not _has_bounded_length(field):
+                errors.append(
+                    {
+                        "field": "validation_json.max_length",
+                        "message": f"Must be at most {INDEXED_TEXT_MAX_LENGTH} for {flag} text fields",
+                    }
+                )
+            elif enabled and field.get("data_type") == FieldDataType.SELECT.value and not _has_short_options(field):
+                errors.append(
+                    {
+                        "field": "validation_json.options",
+                        "message": f"Options must be at most {INDEXED_TEXT_MAX_LENGTH} characters for {flag} fields",
+                    }
+                )
+        searchable = settings.get("searchable", False)
+        if not isinstance(searchable, bool):
+            errors.append({"field": "settings_json.searchable", "message": "Expected boolean"})
+        elif searchable and field.get("data_type") not in _SEARCHABLE_DATA_TYPES:
+            errors.append({"field": "settings_json.searchable", "message": "Only text and long_text fields can be searchable"})
+        weight = settings.get("search_weight")
+        if weight is not None and weight not in SEARCH_WEIGHTS:
+            errors.append({"field": "settings_json.search_weight", "message": "Expected one of A, B, C, D"})
+        if errors:
+            raise ValidationError(errors)
+
+    @staticmethod
+    def _value_length_bound(field: Dict[str, Any]) -> Optional[tuple]:
+        settings = field.get("settings_json") or {}
+        kind = value_kind(FieldDataType(field["data_type"]))
+        # Field indexes cover the raw text of boolean fields too; promoted rows only copy text-kind values.
+        indexed = settings.get("indexed") is True and kind in {"text", "boolean"}
+        promoted = settings.get("promoted") is True and kind == "text"
+        if not field.get("is_active", True) or not (indexed or promoted):
+            return None
+        max_length = INDEXED_TEXT_MAX_LENGTH
+        if field["data_type"] in _FREE_TEXT_DATA_TYPES:
+            max_length = (field.get("validation_json") or {}).get("max_length") or INDEXED_TEXT_MAX_LENGTH
+        return (field["key"], max_length)
+
+    def _check_existing_value_lengths(self, schema_id: int, field: Dict[str, Any]) -> None:
+        # Values written before the length limit existed would break the index build or every later write.
+        bound = self._value_length_bound(field)
+        if bound is None:
+            return
+        key, max_length = bound
+        too_long = self.fields.count_long_field_values(schema_id, key, max_length)
+        if too_long:
+            raise ValidationError(
+                [{"field": "validation_json.max_length", "message": f"{too_long} entries have longer values for {key}"}]
+            )
+
+    @staticmethod
+    def _is_searchable(field: Dict[str, Any]) -> bool:
+        return (field.get("settings_json") or {}).get("searchable") is True
+
+    @staticmethod
+    def _index_definition(field: Dict[str, Any]) -> Optional[tuple]:
+        if not field["is_active"] or (field.get("settings_json") or {}).get("indexed") is not True:
+            return None
+        return (field["key"], field["data_type"])
+
+    @staticmethod
+    def _promotion_definition(field: Dict[str, Any]) -> Optional[tuple]:
+        if not field["is_active"] or (field.get("settings_json") or {}).get("promoted") is not True:
+            return None
+        return (field["key"], field["data_type"])
+
+    @classmethod
+    def _search_definition(cls, field: Dict[str, Any]) -> Optional[tuple]:
+        if not cls._is_searchable(field):
+            return None
+        settings = field.get("settings_json") or {}
+        return (field["key"], field["data_type"], field["is_active"], settings.get("search_weight"), field["sort_order"])
+
+
+def _has_bounded_length(field: Dict[str, Any]) -> bool:
+    max_length = (field.get("validation_json") or {}).get("max_length")
+    return isinstance(max_length, int) and not isinstance(max_length, bool) and 0 < max_length <= INDEXED_TEXT_MAX_LENGTH
+
+
+def _has_short_options(field: Dict[str, Any]) -> bool:
+    options = (field.get("validation_json") or {}).get("options") or []
+    return isinstance(options, list) and all(len(str(option)) <= INDEXED_TEXT_MAX_LENGTH for option in options)
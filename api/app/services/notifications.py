@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+import psycopg
+from psycopg import sql
+
+from ..db import DATABASE_URL
+
+NOTIFY_RECONNECT_DELAY_SECONDS = float(os.environ.get("NOTIFY_RECONNECT_DELAY_SECONDS", "5"))
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationListener:
+    def __init__(self, reconnect_delay_seconds: float = NOTIFY_RECONNECT_DELAY_SECONDS):
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self._handlers: Dict[str, List[Callable[[str], None]]] = {}
+        self._on_connect: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._connected = threading.Event()
+        self._reconnect = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(
+        self,
+        channel: str,
+        handler: Callable[[str], None],
+        *,
+        on_connect: Optional[Callable[[], None]] = None,
+    ) -> None:
+        with self._lock:
+            if channel not in self._handlers and self._thread is not None and self._thread.is_alive():
+                # LISTEN runs on the listener's own connection, so pick the new channel up by reconnecting.
+                self._reconnect.set()
+            self._handlers.setdefault(channel, []).append(handler)
+            if on_connect is not None:
+                self._on_connect.append(on_connect)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pg-notify-listener", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self._thread = None
+        self._connected.clear()
+
+    def wait_until_connected(self, timeout: float) -> bool:
+        return self._connected.wait(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(DATABASE_URL, autocommit=True) as conn:
+                    with self._lock:
+                        channels = list(self._handlers)
+                        on_connect = list(self._on_connect)
+                        self._reconnect.clear()
+                    for channel in channels:
+                        conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+                    # Anything published while we were disconnected is lost, so subscribers resync first.
+                    for callback in on_connect:
+                        callback()
+                    self._connected.set()
+                    while not self._stop.is_set() and not self._reconnect.is_set():
+                        for notify in conn.notifies(timeout=1.0):
+                            self._dispatch(notify.channel, notify.payload)
+                if self._reconnect.is_set():
+                    self._connected.clear()
+                    continue
+            except Exception:
+                logger.exception("Notification listener lost its connection")
+            self._connected.clear()
+            self._stop.wait(self.reconnect_delay_seconds)
+
+    def _dispatch(self, channel: str, payload: str) -> None:
+        with self._lock:
+            handlers = list(self._handlers.get(channel, []))
+        for handler in handlers:
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception("Notification handler for %s failed", channel)
+
+
+notification_listener = NotificationListener()
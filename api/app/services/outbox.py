@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import urllib.request
+from typing import Any, Dict, List, Optional, Protocol
+
+from ..repositories.metadata import OutboxRepository
+
+OUTBOX_SINK = os.environ.get("OUTBOX_SINK", "")
+OUTBOX_CAPTURE = os.environ.get("OUTBOX_CAPTURE", "")
+OUTBOX_BATCH_SIZE = int(os.environ.get("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_POLL_INTERVAL_SECONDS = float(os.environ.get("OUTBOX_POLL_INTERVAL_SECONDS", "1"))
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get("OUTBOX_MAX_ATTEMPTS", "10"))
+OUTBOX_RETRY_DELAY_SECONDS = float(os.environ.get("OUTBOX_RETRY_DELAY_SECONDS", "5"))
+OUTBOX_HTTP_TIMEOUT_SECONDS = float(os.environ.get("OUTBOX_HTTP_TIMEOUT_SECONDS", "10"))
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxSink(Protocol):
+    def send(self, events: List[Dict[str, Any]]) -> None: ...
+
+
+class FileOutboxSink:
+    def __init__(self, path: str):
+        self.path = path
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        with open(self.path, "a", encoding="utf-8") as handle:
+            for event in events:
+                handle.write(json.dumps(event, default=str) + "\n")
+            handle.flush()
+            # The outbox rows are deleted once send() returns, so the lines must be on disk first.
+            os.fsync(handle.fileno())
+
+
+class HttpOutboxSink:
+    def __init__(self, url: str, timeout_seconds: float = OUTBOX_HTTP_TIMEOUT_SECONDS):
+        self.url = url
+        self.timeout_seconds = timeout_seconds
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"events": events}, default=str).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+            response.read()
+
+
+def build_outbox_sink(target: str) -> Optional[OutboxSink]:
+    if not target:
+        return None
+    if target.startswith(("http://", "https://")):
+        return HttpOutboxSink(target)
+    if target.startswith("file:"):
+        return FileOutboxSink(target[len("file:"):])
+    raise ValueError(f"Unsupported OUTBOX_SINK: {target!r}")
+
+
+def parse_outbox_capture(value: str) -> Optional[bool]:
+    if not value:
+        return None
+    if value in {"on", "off"}:
+        return value == "on"
+    raise ValueError(f"Unsupported OUTBOX_CAPTURE: {value!r}")
+
+
+class OutboxDispatcher:
+    def __init__(
+        self,
+        sink: OutboxSink,
+        *,
+        repository: Optional[OutboxRepository] = None,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_interval_seconds: float = OUTBOX_POLL_INTERVAL_SECONDS,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        retry_delay_seconds: float = OUTBOX_RETRY_DELAY_SECONDS,
+    ):
+        self.sink = sink
+        self.repo = repository or OutboxRepository()
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def dispatch_once(self) -> int:
+        return self.repo.deliver_batch(
+            self._deliver,
+            limit=self.batch_size,
+            max_attempts=self.max_attempts,
+            retry_delay_seconds=self.retry_delay_seconds,
+        )
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="entry-outbox-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                delivered = self.dispatch_once()
+            except Exception:
+                logger.exception("Entry outbox delivery failed")
+                delivered = 0
+            # A full batch means more rows are probably waiting, so keep draining without sleeping.
+            if delivered < self.batch_size:
+                self._stop.wait(self.poll_interval_seconds)
+
+    def _deliver(self, rows: List[Dict[str, Any]]) -> None:
+        self.sink.send(
+            [
+                {
+                    "id": row["id"],
+                    "type": row["event_type"],
+                    "entry_id": row["entry_id"],
+                    "created_at": row["created_at"].isoformat(),
+                    "entry": row["payload"],
+                }
+                for row in rows
+            ]
+        )
+
+
+outbox_dispatcher: Optional[OutboxDispatcher] = None
+
+
+def start_outbox_dispatcher() -> None:
+    global outbox_dispatcher
+    capture = parse_outbox_capture(OUTBOX_CAPTURE)
+    # Capture is shared by every API process, so it only changes when explicitly configured, never from OUTBOX_SINK.
+    if capture is not None:
+        OutboxRepository().set_enabled(capture)
+    sink = build_outbox_sink(OUTBOX_SINK)
+    if sink is None:
+        return
+    outbox_dispatcher = OutboxDispatcher(sink)
+    outbox_dispatcher.start()
+
+
+def stop_outbox_dispatcher() -> None:
+    if outbox_dispatcher is not None:
+        outbox_dispatcher.stop()
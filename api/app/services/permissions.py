@@ -7,6 +7,7 @@ from ..core.errors import NotFoundError, ValidationError
 from ..permissions.access_control import AccessControlService
 from ..repositories.metadata import EntryRepository
 from ..repositories.metadata import PermissionRepository
+from .cache import invalidate_read_caches
 
 
 class PermissionService:
@@ -22,7 +23,9 @@ class PermissionService:
         record = dict(payload)
         self._validate_subject_type(record.get("subject_type"))
         record["subject_id"] = str(record["subject_id"])
-        return self.repo.create_permission(record)
+        created = self.repo.create_permission(record)
+        invalidate_read_caches()
+        return created
 
     def update_permission(self, entry_id: int, permission_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
         self.entries.get_entry(entry_id)
@@ -38,20 +41,33 @@ class PermissionService:
             self._validate_subject_type(payload.get("subject_type"))
         if "subject_id" in payload and payload["subject_id"] is not None:
             payload["subject_id"] = str(payload["subject_id"])
-        return self.repo.update_permission(permission_id, payload)
+        updated = self.repo.update_permission(permission_id, payload)
+        invalidate_read_caches()
+        return updated
 
     def delete_permission(self, entry_id: int, permission_id: int) -> Dict[str, Any]:
         self.entries.get_entry(entry_id)
         permission = self.repo.get_permission(permission_id)
         if permission["entry_id"] != entry_id:
             raise NotFoundError("Permission not found for entry")
-        return self.repo.delete_permission(permission_id)
+        deleted = self.repo.delete_permission(permission_id)
+        invalidate_read_caches()
+        return deleted
 
     def check_access(self, entry: Dict[str, Any], user: Optional[Dict[str, Any]], permission: EntryPermission) -> bool:
         return self.access.can_access(entry, user, permission)
 
-    def get_access_map(self, entry: Dict[str, Any], user: Optional[Dict[str, Any]]) -> Dict[str, bool]:
-        return self.access.get_access_map(entry, user)
+    def get_access_map(
+        self,
+        entry: Dict[str, Any],
+        user: Optional[Dict[str, Any]],
+        *,
+        grants: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, bool]:
+        return self.access.get_access_map(entry, user, grants=grants)
+
+    def get_query_scope(self, user: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return self.access.build_query_scope(user)
 
     def require_access(self, entry: Dict[str, Any], user: Optional[Dict[str, Any]], permission: EntryPermission) -> None:
         self.access.require_access(entry, user, permission)
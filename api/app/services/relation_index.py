@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..repositories.metadata import RelationRepository
+from .notifications import notification_listener
+
+RELATION_INDEX_ENABLED = os.environ.get("RELATION_INDEX_ENABLED", "false").lower() in {"1", "true", "yes", "on"}
+RELATION_INDEX_CHANNEL = "entry_relations_changed"
+
+
+class _Adjacency:
+    __slots__ = ("relation_ids", "neighbor_ids", "sort_orders", "type_codes", "outgoing")
+
+    def __init__(self):
+        self.relation_ids = array("q")
+        self.neighbor_ids = array("q")
+        self.sort_orders = array("q")
+        self.type_codes = array("H")
+        self.outgoing = array("b")
+
+    def append(self, relation_id: int, neighbor_id: int, sort_order: int, type_code: int, outgoing: bool) -> None:
+        self.relation_ids.append(relation_id)
+        self.neighbor_ids.append(neighbor_id)
+        self.sort_orders.append(sort_order)
+        self.type_codes.append(type_code)
+        self.outgoing.append(1 if outgoing else 0)
+
+    def insert(self, relation_id: int, neighbor_id: int, sort_order: int, type_code: int, outgoing: bool) -> None:
+        position = len(self.relation_ids)
+        for index in range(len(self.relation_ids)):
+            if (self.sort_orders[index], self.relation_ids[index]) > (sort_order, relation_id):
+                position = index
+                break
+        self.relation_ids.insert(position, relation_id)
+        self.neighbor_ids.insert(position, neighbor_id)
+        self.sort_orders.insert(position, sort_order)
+        self.type_codes.insert(position, type_code)
+        self.outgoing.insert(position, 1 if outgoing else 0)
+
+    def remove(self, relation_id: int) -> None:
+        position = self.relation_ids.index(relation_id)
+        for values in (self.relation_ids, self.neighbor_ids, self.sort_orders, self.type_codes, self.outgoing):
+            values.pop(position)
+
+
+class RelationIndex:
+    def __init__(self, repository: Optional[RelationRepository] = None):
+        self.relations = repository or RelationRepository()
+        self._adjacency: Dict[int, _Adjacency] = {}
+        self._endpoints: Dict[int, Tuple[int, int]] = {}
+        self._type_codes: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        self._lock = threading.RLock()
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def load(self) -> None:
+        rows = sorted(self.relations.list_relation_links(), key=lambda row: (row["sort_order"], row["id"]))
+        with self._lock:
+            self._adjacency = {}
+            self._endpoints = {}
+            for row in rows:
+                self._add(row, ordered=True)
+            self._ready = True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._adjacency = {}
+            self._endpoints = {}
+            self._ready = False
+
+    def apply(self, relation: Dict[str, Any]) -> None:
+        with self._lock:
+            if not self._ready:
+                return
+            self._discard(relation["id"])
+            self._add(relation, ordered=False)
+
+    def remove(self, relation_id: int) -> None:
+        with self._lock:
+            if not self._ready:
+                return
+            self._discard(relation_id)
+
+    def handle_notification(self, payload: str) -> None:
+        relation = json.loads(payload)
+        if relation["op"] == "DELETE":
+            self.remove(relation["id"])
+        else:
+            self.apply(relation)
+
+    def neighbors(self, entry_id: int) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            if not self._ready:
+                return None
+            adjacency = self._adjacency.get(entry_id)
+            if adjacency is None:
+                return []
+            links = []
+            for index in range(len(adjacency.relation_ids)):
+                outgoing = adjacency.outgoing[index] == 1
+                neighbor_id = adjacency.neighbor_ids[index]
+                links.append(
+                    {
+                        "id": adjacency.relation_ids[index],
+                        "from_entry_id": entry_id if outgoing else neighbor_id,
+                        "to_entry_id": neighbor_id if outgoing else entry_id,
+                        "relation_type": self._type_names[adjacency.type_codes[index]],
+                        "sort_order": adjacency.sort_orders[index],
+                    }
+                )
+            return links
+
+    def _add(self, relation: Dict[str, Any], *, ordered: bool) -> None:
+        relation_id = relation["id"]
+        from_entry_id = relation["from_entry_id"]
+        to_entry_id = relation["to_entry_id"]
+        type_code = self._type_code(relation["relation_type"])
+        for entry_id, neighbor_id, outgoing in ((from_entry_id, to_entry_id, True), (to_entry_id, from_entry_id, False)):
+            adjacency = self._adjacency.setdefault(entry_id, _Adjacency())
+            if ordered:
+                adjacency.append(relation_id, neighbor_id, relation["sort_order"], type_code, outgoing)
+            else:
+                adjacency.insert(relation_id, neighbor_id, relation["sort_order"], type_code, outgoing)
+        self._endpoints[relation_id] = (from_entry_id, to_entry_id)
+
+    def _discard(self, relation_id: int) -> None:
+        endpoints = self._endpoints.pop(relation_id, None)
+        if endpoints is None:
+            return
+        for entry_id in endpoints:
+            adjacency = self._adjacency[entry_id]
+            adjacency.remove(relation_id)
+            if not adjacency.relation_ids:
+                del self._adjacency[entry_id]
+
+    def _type_code(self, relation_type: str) -> int:
+        code = self._type_codes.get(relation_type)
+        if code is None:
+            code = len(self._type_names)
+            self._type_codes[relation_type] = code
+            self._type_names.append(relation_type)
+        return code
+
+
+relation_index = RelationIndex()
+
+
+def start_relation_index() -> None:
+    if not RELATION_INDEX_ENABLED:
+        return
+    notification_listener.subscribe(RELATION_INDEX_CHANNEL, relation_index.handle_notification, on_connect=relation_index.load)
+    notification_listener.start()
+
+
+def stop_relation_index() -> None:
+    if not RELATION_INDEX_ENABLED:
+        return
+    notification_listener.stop()
+    relation_index.reset()
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set
+import base64
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from ..core.enums import EntryPermission
-from ..core.errors import NotFoundError
+from ..core.errors import NotFoundError, ValidationError
 from ..repositories.metadata import EntryRepository, RelationRepository, SchemaRepository
 from .permissions import PermissionService
+from .relation_index import relation_index
+
+RELATION_TREE_MAX_DEPTH = 5
+RELATION_TREE_MAX_NODES = 500
+RELATION_PATH_MAX_HOPS = 6
 
 
 class RelationService:
@@ -14,15 +20,42 @@ class RelationService:
         self.relations = RelationRepository()
         self.schemas = SchemaRepository()
         self.permissions = PermissionService()
+        self.index = relation_index
 
     def list_relations(self, entry_id: int) -> List[Dict[str, Any]]:
         self.entries.get_entry(entry_id)
-        return self.relations.list_relations(entry_id)
+        links = self._index_links(entry_id)
+        if links is None:
+            return self.relations.list_relations(entry_id)
+        return self.relations.list_relations_by_ids([link["id"] for link in links])
 
     def create_relation(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         self.entries.get_entry(payload["from_entry_id"])
         self.entries.get_entry(payload["to_entry_id"])
-        return self.relations.create_relation(payload)
+        relation = self.relations.create_relation(payload)
+        self.index.apply(relation)
+        return relation
+
+    def bulk_write_relations(self, entry_id: int, relations: List[Dict[str, Any]], *, replace: bool) -> List[Dict[str, Any]]:
+        self.entries.get_entry(entry_id)
+        errors = []
+        seen_keys: Set[Tuple[int, str]] = set()
+        for position, relation in enumerate(relations):
+            if relation["to_entry_id"] == entry_id:
+                errors.append({"field": f"relations[{position}].to_entry_id", "message": "An entry cannot relate to itself"})
+            key = (relation["to_entry_id"], relation["relation_type"])
+            if replace and key in seen_keys:
+                errors.append({"field": f"relations[{position}]", "message": "Duplicate target and relation type"})
+            seen_keys.add(key)
+        if errors:
+            raise ValidationError(errors)
+
+        result = self.relations.bulk_write_relations(entry_id, relations, replace=replace)
+        for relation_id in result["deleted_ids"]:
+            self.index.remove(relation_id)
+        for relation in result["relations"]:
+            self.index.apply(relation)
+        return result["relations"]
 
     def update_relation(self, entry_id: int, relation_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
         self.entries.get_entry(entry_id)
@@ -32,26 +65,51 @@ class RelationService:
         updates = dict(payload)
         if "to_entry_id" in updates and updates["to_entry_id"] is not None:
             self.entries.get_entry(updates["to_entry_id"])
-        return self.relations.update_relation(relation_id, updates)
+        relation = self.relations.update_relation(relation_id, updates)
+        self.index.apply(relation)
+        return relation
 
     def delete_relation(self, entry_id: int, relation_id: int) -> Dict[str, Any]:
         self.entries.get_entry(entry_id)
         relation = self.relations.get_relation(relation_id)
         if relation["from_entry_id"] != entry_id and relation["to_entry_id"] != entry_id:
             raise NotFoundError("Relation not found for entry")
-        return self.relations.delete_relation(relation_id)
+        deleted = self.relations.delete_relation(relation_id)
+        self.index.remove(relation_id)
+        return deleted
 
-    def get_relation_tree(self, entry_id: int, current_user: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        root_entry = self.entries.get_entry(entry_id)
-        expanded_entry_ids: Set[int] = set()
-        schema_cache: Dict[int, Dict[str, Any]] = {}
+    def get_relation_tree(
+        self,
+        entry_id: int,
+        current_user: Optional[Dict[str, Any]],
+        *,
+        max_depth: int = RELATION_TREE_MAX_DEPTH,
+        max_nodes: int = RELATION_TREE_MAX_NODES,
+    ) -> Dict[str, Any]:
+        self.entries.get_entry(entry_id)
+        scope = self.permissions.get_query_scope(current_user)
+        subgraph = self._load_indexed_subgraph(entry_id, max_depth=max_depth, max_nodes=max_nodes, scope=scope)
+        if subgraph is None:
+            subgraph = self.relations.load_reachable_subgraph(entry_id, max_depth=max_depth, max_nodes=max_nodes, **scope)
+        entries_by_id = {entry["id"]: entry for entry in subgraph["entries"]}
+        adjacency: Dict[int, List[Dict[str, Any]]] = {}
+        for relation in subgraph["relations"]:
+            adjacency.setdefault(relation["from_entry_id"], []).append(relation)
+            adjacency.setdefault(relation["to_entry_id"], []).append(relation)
+        for relations in adjacency.values():
+            relations.sort(key=lambda item: (item["sort_order"], item["id"]))
+        schema_cache: Dict[int, Dict[str, Any]] = {schema["id"]: schema for schema in subgraph["schemas"]}
         tree = self._build_tree_node(
-            entry=root_entry,
-            current_user=current_user,
+            entry=entries_by_id[entry_id],
+            entries_by_id=entries_by_id,
+            adjacency=adjacency,
             via_relation=None,
             parent_entry_id=None,
+            depth=0,
+            max_depth=max_depth,
+            budget={"remaining": max_nodes - 1},
             ancestor_entry_ids=set(),
-            expanded_entry_ids=expanded_entry_ids,
+            expanded_entry_ids=set(),
             schema_cache=schema_cache,
         )
         return {
@@ -59,13 +117,254 @@ class RelationService:
             "tree": tree,
         }
 
+    def list_relation_children(
+        self,
+        entry_id: int,
+        current_user: Optional[Dict[str, Any]],
+        *,
+        parent_entry_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        self.entries.get_entry(entry_id)
+        after = None if cursor is None else self._decode_cursor(cursor)
+        scope = self.permissions.get_query_scope(current_user)
+        rows = self._list_indexed_children(entry_id, parent_entry_id=parent_entry_id, after=after, limit=limit + 1, scope=scope)
+        if rows is None:
+            rows = self.relations.list_relation_children(
+                entry_id,
+                parent_entry_id=parent_entry_id,
+                after=after,
+                limit=limit + 1,
+                **scope,
+            )
+        page = rows[:limit]
+        schema_cache: Dict[int, Dict[str, Any]] = {row["schema"]["id"]: row["schema"] for row in page}
+        items = [
+            self._tree_node(
+                entry=row,
+                via_relation=row["relation"],
+                parent_entry_id=entry_id,
+                children=[],
+                child_count=row["child_count"],
+                is_expandable=row["child_count"] > 0,
+                schema_cache=schema_cache,
+            )
+            for row in page
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            last = page[-1]
+            next_cursor = self._encode_cursor([last["relation"]["sort_order"], last["title"], last["id"], last["relation"]["id"]])
+        return {
+            "entry_id": entry_id,
+            "parent_entry_id": parent_entry_id,
+            "items": items,
+            "next_cursor": next_cursor,
+        }
+
+    def find_relation_path(
+        self,
+        entry_id: int,
+        target_entry_id: int,
+        current_user: Optional[Dict[str, Any]],
+        *,
+        relation_types: Optional[List[str]] = None,
+        max_hops: int = RELATION_PATH_MAX_HOPS,
+    ) -> Dict[str, Any]:
+        self.entries.get_entry(entry_id)
+        self.entries.get_entry(target_entry_id)
+        scope = self.permissions.get_query_scope(current_user)
+        forward = {"depth": {entry_id: 0}, "links": {entry_id: None}, "frontier": [entry_id]}
+        backward = {"depth": {target_entry_id: 0}, "links": {target_entry_id: None}, "frontier": [target_entry_id]}
+        meeting_entry_id = entry_id if entry_id == target_entry_id else None
+        hops_searched = 0
+        while meeting_entry_id is None and hops_searched < max_hops and forward["frontier"] and backward["frontier"]:
+            side, other = (forward, backward) if len(forward["frontier"]) <= len(backward["frontier"]) else (backward, forward)
+            next_frontier: List[int] = []
+            for link in self._expand_frontier(sorted(side["frontier"]), side["depth"], relation_types, scope):
+                neighbor_entry_id = link["neighbor_id"]
+                if neighbor_entry_id in side["depth"]:
+                    continue
+                side["depth"][neighbor_entry_id] = side["depth"][link["entry_id"]] + 1
+                side["links"][neighbor_entry_id] = link
+                next_frontier.append(neighbor_entry_id)
+            side["frontier"] = next_frontier
+            hops_searched += 1
+            meetings = [candidate for candidate in next_frontier if candidate in other["depth"]]
+            if meetings:
+                meeting_entry_id = min(meetings, key=lambda candidate: (forward["depth"][candidate] + backward["depth"][candidate], candidate))
+
+        if meeting_entry_id is None:
+            return {
+                "from_entry_id": entry_id,
+                "to_entry_id": target_entry_id,
+                "found": False,
+                "hops": None,
+                "entries": [],
+                "relations": [],
+            }
+
+        path_entry_ids = [meeting_entry_id]
+        path_links: List[Dict[str, Any]] = []
+        while forward["links"][path_entry_ids[0]] is not None:
+            link = forward["links"][path_entry_ids[0]]
+            path_links.insert(0, link)
+            path_entry_ids.insert(0, link["entry_id"])
+        while backward["links"][path_entry_ids[-1]] is not None:
+            link = backward["links"][path_entry_ids[-1]]
+            path_links.append(link)
+            path_entry_ids.append(link["entry_id"])
+
+        records = self.relations.load_path_records(path_entry_ids, [link["id"] for link in path_links])
+        entries_by_id = {entry["id"]: entry for entry in records["entries"]}
+        relations_by_id = {relation["id"]: relation for relation in records["relations"]}
+        schema_cache: Dict[int, Dict[str, Any]] = {schema["id"]: schema for schema in records["schemas"]}
+        return {
+            "from_entry_id": entry_id,
+            "to_entry_id": target_entry_id,
+            "found": True,
+            "hops": len(path_links),
+            "entries": [self._serialize_entry(entries_by_id[path_entry_id], schema_cache=schema_cache) for path_entry_id in path_entry_ids],
+            "relations": [
+                self._serialize_relation(relations_by_id[link["id"]], parent_entry_id=path_entry_ids[position])
+                for position, link in enumerate(path_links)
+            ],
+        }
+
+    def _expand_frontier(
+        self,
+        frontier: List[int],
+        seen_entry_ids: Dict[int, int],
+        relation_types: Optional[List[str]],
+        scope: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        if not self.index.ready:
+            return self.relations.list_readable_neighbor_links(frontier, relation_types=relation_types, **scope)
+        candidates: List[Dict[str, Any]] = []
+        for entry_id in frontier:
+            for link in self.index.neighbors(entry_id) or []:
+                if relation_types and link["relation_type"] not in relation_types:
+                    continue
+                neighbor_entry_id = link["to_entry_id"] if link["from_entry_id"] == entry_id else link["from_entry_id"]
+                if neighbor_entry_id in seen_entry_ids:
+                    continue
+                candidates.append({**link, "entry_id": entry_id, "neighbor_id": neighbor_entry_id})
+        readable_entry_ids = set(self.entries.list_readable_entry_ids(sorted({link["neighbor_id"] for link in candidates}), **scope))
+        return [link for link in candidates if link["neighbor_id"] in readable_entry_ids]
+
+    def _index_links(self, entry_id: int) -> Optional[List[Dict[str, Any]]]:
+        links = self.index.neighbors(entry_id)
+        if links is None:
+            return None
+        # A relation from an entry to itself sits on both sides of its adjacency list.
+        unique = {link["id"]: link for link in links}
+        return [
+            {**link, "neighbor_id": link["to_entry_id"] if link["from_entry_id"] == entry_id else link["from_entry_id"]}
+            for link in unique.values()
+        ]
+
+    def _readable_degrees(
+        self,
+        entry_ids: List[int],
+        scope: Dict[str, Any],
+        *,
+        links_by_entry: Dict[int, List[Dict[str, Any]]],
+        exclude_entry_id: Optional[int] = None,
+    ) -> Optional[Dict[int, int]]:
+        for entry_id in entry_ids:
+            if entry_id not in links_by_entry:
+                links = self._index_links(entry_id)
+                if links is None:
+                    return None
+                links_by_entry[entry_id] = links
+        neighbor_ids = sorted({link["neighbor_id"] for entry_id in entry_ids for link in links_by_entry[entry_id]})
+        readable_entry_ids = set(self.entries.list_readable_entry_ids(neighbor_ids, **scope))
+        return {
+            entry_id: sum(
+                1
+                for link in links_by_entry[entry_id]
+                if link["neighbor_id"] in readable_entry_ids and link["neighbor_id"] != exclude_entry_id
+            )
+            for entry_id in entry_ids
+        }
+
+    def _load_indexed_subgraph(
+        self,
+        entry_id: int,
+        *,
+        max_depth: int,
+        max_nodes: int,
+        scope: Dict[str, Any],
+    ) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        if not self.index.ready:
+            return None
+        # Same walk as load_reachable_subgraph: breadth first, lowest ids first, at most max_nodes + 1 entries.
+        node_limit = max_nodes + 1
+        links_by_entry: Dict[int, List[Dict[str, Any]]] = {}
+        visited = [entry_id]
+        seen_entry_ids = {entry_id}
+        frontier = [entry_id]
+        depth = 0
+        while frontier and depth < max_depth and len(visited) < node_limit:
+            candidates: Set[int] = set()
+            for frontier_entry_id in frontier:
+                links = self._index_links(frontier_entry_id)
+                if links is None:
+                    return None
+                links_by_entry[frontier_entry_id] = links
+                candidates.update(link["neighbor_id"] for link in links if link["neighbor_id"] not in seen_entry_ids)
+            frontier = sorted(self.entries.list_readable_entry_ids(sorted(candidates), **scope))[: node_limit - len(visited)]
+            visited.extend(frontier)
+            seen_entry_ids.update(frontier)
+            depth += 1
+        degrees = self._readable_degrees(visited, scope, links_by_entry=links_by_entry)
+        if degrees is None:
+            return None
+        relation_ids = sorted(
+            {link["id"] for member_id in visited for link in links_by_entry[member_id] if link["neighbor_id"] in seen_entry_ids}
+        )
+        records = self.relations.load_relation_tree_records(visited, relation_ids)
+        for entry in records["entries"]:
+            entry["readable_degree"] = degrees[entry["id"]]
+        return records
+
+    def _list_indexed_children(
+        self,
+        entry_id: int,
+        *,
+        parent_entry_id: Optional[int],
+        after: Optional[List[Any]],
+        limit: int,
+        scope: Dict[str, Any],
+    ) -> Optional[List[Dict[str, Any]]]:
+        links = self._index_links(entry_id) if self.index.ready else None
+        if links is None:
+            return None
+        rows = self.relations.list_relation_children_from_links(
+            [link for link in links if link["neighbor_id"] != parent_entry_id],
+            after=after,
+            limit=limit,
+            **scope,
+        )
+        child_counts = self._readable_degrees([row["id"] for row in rows], scope, links_by_entry={}, exclude_entry_id=entry_id)
+        if child_counts is None:
+            return None
+        for row in rows:
+            row["child_count"] = child_counts[row["id"]]
+        return rows
+
     def _build_tree_node(
         self,
         *,
         entry: Dict[str, Any],
-        current_user: Optional[Dict[str, Any]],
+        entries_by_id: Dict[int, Dict[str, Any]],
+        adjacency: Dict[int, List[Dict[str, Any]]],
         via_relation: Optional[Dict[str, Any]],
         parent_entry_id: Optional[int],
+        depth: int,
+        max_depth: int,
+        budget: Dict[str, int],
         ancestor_entry_ids: Set[int],
         expanded_entry_ids: Set[int],
         schema_cache: Dict[int, Dict[str, Any]],
@@ -75,36 +374,38 @@ class RelationService:
         next_ancestors = set(ancestor_entry_ids)
         next_ancestors.add(entry_id)
 
+        parent_links = sum(1 for relation in adjacency.get(entry_id, []) if parent_entry_id in (relation["from_entry_id"], relation["to_entry_id"]))
+        child_count = entry["readable_degree"] - parent_links
+        # The subgraph stops after max_nodes + 1 entries, so a node whose children were not all loaded stays collapsed.
+        loaded_children = len(adjacency.get(entry_id, [])) - parent_links
+        if depth >= max_depth or child_count > budget["remaining"] or loaded_children < child_count:
+            return self._tree_node(
+                entry=entry,
+                via_relation=via_relation,
+                parent_entry_id=parent_entry_id,
+                children=[],
+                child_count=child_count,
+                is_expandable=child_count > 0,
+                schema_cache=schema_cache,
+            )
+        budget["remaining"] -= child_count
+
         children: List[Dict[str, Any]] = []
-        for relation in self.relations.list_relations(entry_id):
+        for relation in adjacency.get(entry_id, []):
             neighbor_entry_id = relation["to_entry_id"] if relation["from_entry_id"] == entry_id else relation["from_entry_id"]
             if parent_entry_id is not None and neighbor_entry_id == parent_entry_id:
                 continue
-            if neighbor_entry_id in next_ancestors:
-                neighbor_entry = self.entries.get_entry(neighbor_entry_id)
-                if self.permissions.check_access(neighbor_entry, current_user, EntryPermission.READ):
-                    children.append(
-                        self._reference_node(
-                            entry=neighbor_entry,
-                            relation=relation,
-                            current_entry_id=entry_id,
-                            reason="cycle",
-                            schema_cache=schema_cache,
-                        )
-                    )
-                continue
-
-            neighbor_entry = self.entries.get_entry(neighbor_entry_id)
-            if not self.permissions.check_access(neighbor_entry, current_user, EntryPermission.READ):
+            neighbor_entry = entries_by_id.get(neighbor_entry_id)
+            if neighbor_entry is None:
                 continue
 
-            if neighbor_entry_id in expanded_entry_ids:
+            if neighbor_entry_id in next_ancestors or neighbor_entry_id in expanded_entry_ids:
                 children.append(
                     self._reference_node(
                         entry=neighbor_entry,
                         relation=relation,
                         current_entry_id=entry_id,
-                        reason="duplicate",
+                        reason="cycle" if neighbor_entry_id in next_ancestors else "duplicate",
                         schema_cache=schema_cache,
                     )
                 )
@@ -113,9 +414,13 @@ class RelationService:
             children.append(
                 self._build_tree_node(
                     entry=neighbor_entry,
-                    current_user=current_user,
+                    entries_by_id=entries_by_id,
+                    adjacency=adjacency,
                     via_relation=relation,
                     parent_entry_id=entry_id,
+                    depth=depth + 1,
+                    max_depth=max_depth,
+                    budget=budget,
                     ancestor_entry_ids=next_ancestors,
                     expanded_entry_ids=expanded_entry_ids,
                     schema_cache=schema_cache,
@@ -124,14 +429,49 @@ class RelationService:
 
         children.sort(key=lambda item: (item["via_relation"]["sort_order"], item["entry"]["title"], item["entry"]["id"]))
 
+        return self._tree_node(
+            entry=entry,
+            via_relation=via_relation,
+            parent_entry_id=parent_entry_id,
+            children=children,
+            child_count=len(children),
+            is_expandable=False,
+            schema_cache=schema_cache,
+        )
+
+    def _tree_node(
+        self,
+        *,
+        entry: Dict[str, Any],
+        via_relation: Optional[Dict[str, Any]],
+        parent_entry_id: Optional[int],
+        children: List[Dict[str, Any]],
+        child_count: int,
+        is_expandable: bool,
+        schema_cache: Dict[int, Dict[str, Any]],
+    ) -> Dict[str, Any]:
         return {
             "entry": self._serialize_entry(entry, schema_cache=schema_cache),
-            "via_relation": self._serialize_relation(via_relation, parent_entry_id=None if via_relation is None else self._relation_parent_id(via_relation, entry_id)),
+            "via_relation": self._serialize_relation(via_relation, parent_entry_id=parent_entry_id),
             "children": children,
             "is_reference": False,
             "reference_reason": None,
+            "is_expandable": is_expandable,
+            "child_count": child_count,
         }
 
+    def _encode_cursor(self, values: List[Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+    def _decode_cursor(self, cursor: str) -> List[Any]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except (ValueError, UnicodeError):
+            values = None
+        if not isinstance(values, list) or len(values) != 4:
+            raise ValidationError([{"field": "cursor", "message": "Invalid cursor"}])
+        return values
+
     def _reference_node(
         self,
         *,
@@ -147,6 +487,8 @@ class RelationService:
             "children": [],
             "is_reference": True,
             "reference_reason": reason,
+            "is_expandable": False,
+            "child_count": 0,
         }
 
     def _serialize_entry(self, entry: Dict[str, Any], *, schema_cache: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
@@ -158,6 +500,7 @@ class RelationService:
             "status": entry["status"],
             "visibility_level": entry["visibility_level"],
             "owner_id": entry.get("owner_id"),
+            "relation_counts": entry.get("relation_counts"),
         }
 
     def _get_schema_summary(self, schema_id: int, *, schema_cache: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
@@ -187,8 +530,3 @@ class RelationService:
             "metadata_json": relation.get("metadata_json") or {},
             "direction": direction,
         }
-
-    def _relation_parent_id(self, relation: Dict[str, Any], child_entry_id: int) -> int:
-        if relation["from_entry_id"] == child_entry_id:
-            return relation["to_entry_id"]
-        return relation["from_entry_id"]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from ..core.errors import ForbiddenError, ValidationError
+from ..repositories.metadata import EntryRepository, FieldRepository, SavedQueryRepository, SchemaRepository
+from ..roles import READ_ROLES
+from ..validation.filters import apply_entry_projection, parse_entry_fields, parse_entry_filters, parse_entry_sort
+from .permissions import PermissionService
+
+SAVED_QUERY_RESULT_MAX_AGE_SECONDS = float(os.environ.get("SAVED_QUERY_RESULT_MAX_AGE_SECONDS", "300"))
+
+
+class SavedQueryService:
+    def __init__(self):
+        self.repo = SavedQueryRepository()
+        self.schemas = SchemaRepository()
+        self.fields = FieldRepository()
+        self.entries = EntryRepository()
+        self.permissions = PermissionService()
+
+    def list_saved_queries(self, *, current_user: Dict[str, Any], schema_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.repo.list_saved_queries(schema_id=schema_id, **self.permissions.get_query_scope(current_user))
+
+    def get_saved_query(self, saved_query_id: int, *, current_user: Dict[str, Any]) -> Dict[str, Any]:
+        saved_query = self.repo.get_saved_query(saved_query_id)
+        scope = self.permissions.get_query_scope(current_user)
+        if not scope["is_admin"] and saved_query["owner_id"] != scope["user_id"] and saved_query["role"] != scope["role"]:
+            raise ForbiddenError("Access denied for saved query")
+        return saved_query
+
+    def create_saved_query(self, payload: Dict[str, Any], *, current_user: Dict[str, Any]) -> Dict[str, Any]:
+        scope = self.permissions.get_query_scope(current_user)
+        role = payload.get("role")
+        if role is not None:
+            if role not in READ_ROLES:
+                raise ValidationError([{"field": "role", "message": f"Unknown role: {role}"}])
+            if not scope["is_admin"] and role != scope["role"]:
+                raise ForbiddenError("Saved queries can only be shared with your own role")
+        record = {
+            "schema_id": payload["schema_id"],
+            "name": payload["name"],
+            "owner_id": None if role is not None else current_user["id"],
+            "role": role,
+            "filters": payload.get("filters") or [],
+            "sort": payload.get("sort"),
+            "fields": payload.get("fields") or [],
+            "created_by": current_user["id"],
+        }
+        self._parse_definition(record)
+        return self.repo.create_saved_query(record)
+
+    def update_saved_query(
+        self,
+        saved_query_id: int,
+        updates: Dict[str, Any],
+        *,
+        current_user: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        saved_query = self._get_managed_query(saved_query_id, current_user)
+        if not updates:
+            raise ValidationError([{"field": "_request", "message": "No fields to update"}])
+        payload = dict(updates)
+        for key in ("filters", "fields"):
+            if key in payload and payload[key] is None:
+                payload[key] = []
+        self._parse_definition({**saved_query, **payload})
+        return self.repo.update_saved_query(saved_query_id, payload)
+
+    def delete_saved_query(self, saved_query_id: int, *, current_user: Dict[str, Any]) -> Dict[str, Any]:
+        self._get_managed_query(saved_query_id, current_user)
+        return self.repo.delete_saved_query(saved_query_id)
+
+    def run_saved_query(
+        self,
+        saved_query_id: int,
+        *,
+        current_user: Dict[str, Any],
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        saved_query = self.get_saved_query(saved_query_id, current_user=current_user)
+        definition = self._parse_definition(saved_query)
+        projection = definition.pop("projection")
+        schema_id = saved_query["schema_id"]
+        # Read the watermark before querying so writes that land mid-query trigger the next refresh.
+        watermark = self.entries.get_schema_watermark(schema_id)
+        result = self.repo.get_result(saved_query_id)
+
+        if result is not None and result["watermark"] == watermark and not self._is_expired(result):
+            refresh = "cache"
+            entry_ids = result["entry_ids"]
+            refreshed_at = result["refreshed_at"]
+        else:
+            if result is not None and result["watermark"] is not None and not self._is_expired(result):
+                refresh = "incremental"
+                entry_ids = self.entries.list_entry_ids(
+                    schema_id=schema_id,
+                    candidate_ids=result["entry_ids"],
+                    changed_since=result["watermark"],
+                    **definition,
+                )
+            else:
+                refresh = "full"
+                entry_ids = self.entries.list_entry_ids(schema_id=schema_id, **definition)
+            stored = self.repo.store_result(saved_query, entry_ids=entry_ids, watermark=watermark)
+            refreshed_at = stored["refreshed_at"] if stored else datetime.now(timezone.utc)
+
+        # The cached ids are shared by everyone who can see the query, so visibility is applied per caller in SQL.
+        page = self.entries.list_entries_by_ids(
+            entry_ids,
+            limit=limit,
+            offset=offset,
+            projection=projection,
+            **self.permissions.get_query_scope(current_user),
+        )
+        return {
+            "saved_query": saved_query,
+            "refresh": refresh,
+            "refreshed_at": refreshed_at,
+            "entries": [apply_entry_projection(row, projection) for row in page["items"]],
+            "limit": limit,
+            "offset": offset,
+            "total": page["total"],
+        }
+
+    def _get_managed_query(self, saved_query_id: int, current_user: Dict[str, Any]) -> Dict[str, Any]:
+        saved_query = self.get_saved_query(saved_query_id, current_user=current_user)
+        scope = self.permissions.get_query_scope(current_user)
+        if not scope["is_admin"] and saved_query["created_by"] != scope["user_id"]:
+            raise ForbiddenError("Only the creator or an admin can change a saved query")
+        return saved_query
+
+    def _parse_definition(self, saved_query: Dict[str, Any]) -> Dict[str, Any]:
+        schema_id = self.schemas.get_schema(saved_query["schema_id"])["id"]
+        fields = self.fields.list_fields(schema_id)
+        promoted_field_ids = self.fields.list_promoted_field_ids(schema_id)
+        sort = saved_query.get("sort")
+        requested = saved_query.get("fields") or []
+        return {
+            "projection": parse_entry_fields(fields=fields, requested=requested) if requested else None,
+            "filters": parse_entry_filters(
+                fields=fields,
+                filters=saved_query.get("filters") or [],
+                promoted_field_ids=promoted_field_ids,
+            ),
+            "sort": parse_entry_sort(fields=fields, sort=sort, promoted_field_ids=promoted_field_ids) if sort else None,
+        }
+
+    def _is_expired(self, result: Dict[str, Any]) -> bool:
+        age = datetime.now(timezone.utc) - result["refreshed_at"]
+        return age > timedelta(seconds=SAVED_QUERY_RESULT_MAX_AGE_SECONDS)
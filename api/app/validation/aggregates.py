@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import AbstractSet, Any, Dict, List
+
+from ..core.enums import FieldDataType
+from ..core.errors import ValidationError
+from .filters import is_blob_field, value_column, value_kind
+
+AGGREGATE_FUNCTIONS = {"count", "sum", "avg", "min", "max"}
+DATE_BUCKETS = {"day", "week", "month", "quarter", "year"}
+MAX_GROUP_BY = 3
+
+_GROUPABLE_TYPES = {
+    FieldDataType.SELECT,
+    FieldDataType.INTEGER,
+    FieldDataType.BOOLEAN,
+    FieldDataType.DATE,
+    FieldDataType.DATETIME,
+}
+_NUMERIC_TYPES = {FieldDataType.INTEGER, FieldDataType.DECIMAL}
+_TEMPORAL_TYPES = {FieldDataType.DATE, FieldDataType.DATETIME}
+
+
+def parse_aggregate_request(
+    *,
+    fields: List[Dict[str, Any]],
+    metrics: List[str],
+    group_by: List[str],
+    promoted_field_ids: AbstractSet[int] = frozenset(),
+) -> Dict[str, Any]:
+    field_map = {field["key"]: field for field in fields if field.get("is_active", True)}
+    errors: List[Dict[str, str]] = []
+    if len(group_by) > MAX_GROUP_BY:
+        errors.append({"field": "group_by", "message": f"At most {MAX_GROUP_BY} group_by fields are supported"})
+
+    parsed_groups: List[Dict[str, Any]] = []
+    for expression in group_by:
+        key, _, bucket = expression.partition(":")
+        field = field_map.get(key)
+        if field is None:
+            errors.append({"field": "group_by", "message": f"Unknown group_by field: {key}"})
+            continue
+        data_type = FieldDataType(field["data_type"])
+        if data_type not in _GROUPABLE_TYPES:
+            errors.append({"field": "group_by", "message": f"Field {key} cannot be grouped"})
+            continue
+        if data_type in _TEMPORAL_TYPES:
+            bucket = bucket or "day"
+            if bucket not in DATE_BUCKETS:
+                errors.append({"field": "group_by", "message": f"Unknown date bucket: {bucket}"})
+                continue
+        elif bucket:
+            errors.append({"field": "group_by", "message": f"Field {key} does not support bucketing"})
+            continue
+        group = _field_reference(field, promoted_field_ids)
+        group["name"] = f"{key}:{bucket}" if bucket else key
+        group["bucket"] = bucket or None
+        parsed_groups.append(group)
+
+    parsed_metrics: List[Dict[str, Any]] = []
+    for expression in metrics or ["count"]:
+        function, _, key = expression.partition(":")
+        if function not in AGGREGATE_FUNCTIONS:
+            errors.append({"field": "metric", "message": f"Unknown aggregate function: {function}"})
+            continue
+        if function == "count" and not key:
+            parsed_metrics.append({"name": "count", "function": "count"})
+            continue
+        field = field_map.get(key)
+        if field is None:
+            errors.append({"field": "metric", "message": f"Unknown metric field: {key}"})
+            continue
+        data_type = FieldDataType(field["data_type"])
+        allowed = function == "count" or data_type in _NUMERIC_TYPES
+        if function in {"min", "max"} and data_type in _TEMPORAL_TYPES:
+            allowed = True
+        if not allowed:
+            errors.append({"field": "metric", "message": f"Function {function} is not supported for {key}"})
+            continue
+        metric = _field_reference(field, promoted_field_ids)
+        metric["name"] = f"{function}:{key}"
+        metric["function"] = function
+        parsed_metrics.append(metric)
+
+    if errors:
+        raise ValidationError(errors)
+    return {"group_by": parsed_groups, "metrics": parsed_metrics}
+
+
+def _field_reference(field: Dict[str, Any], promoted_field_ids: AbstractSet[int]) -> Dict[str, Any]:
+    data_type = FieldDataType(field["data_type"])
+    reference: Dict[str, Any] = {"key": field["key"], "kind": value_kind(data_type)}
+    if field["id"] in promoted_field_ids:
+        reference["field_id"] = field["id"]
+        reference["value_column"] = value_column(data_type)
+    elif is_blob_field(field):
+        reference["external"] = True
+    if data_type == FieldDataType.DATE:
+        reference["date_only"] = True
+    return reference
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from decimal import Decimal, InvalidOperation
+import re
+from typing import AbstractSet, Any, Dict, List, Optional, Sequence
+
+from ..core.enums import FieldDataType
+from ..core.errors import ValidationError
+
+ENTRY_SORT_COLUMNS = {"title", "created_at", "updated_at"}
+ENTRY_PROJECTION_COLUMNS = (
+    "id",
+    "schema_id",
+    "title",
+    "status",
+    "visibility_level",
+    "owner_id",
+    "created_by",
+    "created_at",
+    "updated_at",
+    "archived_at",
+    "deleted_at",
+    "data_json",
+    "relation_counts",
+)
+ENTRY_LOOKUP_COLUMNS = ("id", "title", "schema_id", "data_json")
+
+_RANGE_OPERATORS = {"gt", "gte", "lt", "lte"}
+_NULL_OPERATORS = {"null", "notnull"}
+_NUMERIC_TYPES = {FieldDataType.INTEGER, FieldDataType.DECIMAL}
+_TEMPORAL_TYPES = {FieldDataType.DATE, FieldDataType.DATETIME}
+_LIST_TYPES = {FieldDataType.MULTI_SELECT}
+_ID_TYPES = {FieldDataType.REFERENCE, FieldDataType.FILE}
+_BLOB_TYPES = {FieldDataType.LONG_TEXT, FieldDataType.JSON}
+_FIELD_KEY_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
+
+def parse_entry_filters(
+    *,
+    fields: List[Dict[str, Any]],
+    filters: List[str],
+    promoted_field_ids: AbstractSet[int] = frozenset(),
+) -> List[Dict[str, Any]]:
+    field_map = {field["key"]: field for field in fields if field.get("is_active", True)}
+    parsed: List[Dict[str, Any]] = []
+    errors: List[Dict[str, str]] = []
+    for expression in filters:
+        try:
+            condition = _parse_filter(field_map, expression)
+            field = field_map[condition["key"]]
+            if field["id"] in promoted_field_ids:
+                condition = _promoted_condition(field, condition)
+            elif is_blob_field(field):
+                condition["external"] = True
+            parsed.append(condition)
+        except ValidationError as exc:
+            errors.extend(exc.detail)
+    if errors:
+        raise ValidationError(errors)
+    return parsed
+
+
+def parse_entry_sort(
+    *,
+    fields: List[Dict[str, Any]],
+    sort: str,
+    promoted_field_ids: AbstractSet[int] = frozenset(),
+) -> Dict[str, Any]:
+    descending = sort.startswith("-")
+    key = sort[1:] if descending else sort
+    if key in ENTRY_SORT_COLUMNS:
+        return {"column": key, "descending": descending}
+    field = next((field for field in fields if field["key"] == key and field.get("is_active", True)), None)
+    if field is None:
+        raise ValidationError([{"field": "sort", "message": f"Unknown sort field: {key}"}])
+    data_type = FieldDataType(field["data_type"])
+    if data_type == FieldDataType.JSON or is_list_field(field):
+        raise ValidationError([{"field": "sort", "message": f"Field {key} cannot be sorted"}])
+    if field["id"] in promoted_field_ids:
+        return {"field_id": field["id"], "value_column": value_column(data_type), "descending": descending}
+    return {"key": key, "kind": value_kind(data_type), "descending": descending, "external": is_blob_field(field)}
+
+
+def parse_entry_fields(
+    *,
+    fields: Optional[List[Dict[str, Any]]],
+    requested: List[str],
+    columns: Sequence[str] = ENTRY_PROJECTION_COLUMNS,
+) -> Dict[str, Any]:
+    tokens = [token.strip() for item in requested for token in item.split(",") if token.strip()]
+    field_keys = None if fields is None else {field["key"] for field in fields if field.get("is_active", True)}
+    selected: List[str] = ["id"]
+    data_keys: Optional[List[str]] = []
+    errors: List[Dict[str, str]] = []
+    for token in tokens:
+        if token in columns:
+            if token == "data_json":
+                data_keys = None
+            elif token not in selected:
+                selected.append(token)
+            continue
+        key = token[len("data_json.") :] if token.startswith("data_json.") else token
+        if not _FIELD_KEY_PATTERN.match(key) or (field_keys is not None and key not in field_keys):
+            errors.append({"field": "fields", "message": f"Unknown field: {token}"})
+            continue
+        if data_keys is not None and key not in data_keys:
+            data_keys.append(key)
+    if errors:
+        raise ValidationError(errors)
+    if data_keys is None or data_keys:
+        selected.append("data_json")
+    return {"columns": selected, "data_keys": data_keys}
+
+
+def apply_entry_projection(row: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if projection is None:
+        return row
+    return {column: row[column] for column in projection["columns"] if column in row}
+
+
+def _parse_filter(field_map: Dict[str, Dict[str, Any]], expression: str) -> Dict[str, Any]:
+    parts = expression.split(":", 2)
+    if len(parts) < 2:
+        raise ValidationError([{"field": "filter", "message": f"Expected key:operator[:value], got {expression!r}"}])
+    key, operator = parts[0], parts[1]
+    field = field_map.get(key)
+    if field is None:
+        raise ValidationError([{"field": "filter", "message": f"Unknown filter field: {key}"}])
+    data_type = FieldDataType(field["data_type"])
+
+    if operator in _NULL_OPERATORS:
+        if len(parts) == 3:
+            raise ValidationError([{"field": "filter", "message": f"Operator {operator} takes no value"}])
+        return {"key": key, "op": operator}
+    if len(parts) < 3 or parts[2] == "":
+        raise ValidationError([{"field": "filter", "message": f"Operator {operator} requires a value"}])
+    raw_value = parts[2]
+
+    if operator == "contains":
+        if not is_list_field(field):
+            raise ValidationError([{"field": "filter", "message": f"Operator contains is not supported for {key}"}])
+        return {"key": key, "op": operator, "values": [_coerce(field, item) for item in raw_value.split(",")]}
+    if is_list_field(field) or data_type == FieldDataType.JSON:
+        raise ValidationError([{"field": "filter", "message": f"Operator {operator} is not supported for {key}"}])
+    if operator == "eq":
+        return {"key": key, "op": operator, "kind": _equality_kind(data_type), "values": [_coerce(field, raw_value)]}
+    if operator == "in":
+        values = [_coerce(field, item) for item in raw_value.split(",")]
+        return {"key": key, "op": operator, "kind": _equality_kind(data_type), "values": values}
+    if operator in _RANGE_OPERATORS:
+        if data_type not in _NUMERIC_TYPES and data_type not in _TEMPORAL_TYPES:
+            raise ValidationError([{"field": "filter", "message": f"Operator {operator} is not supported for {key}"}])
+        value = _coerce(field, raw_value)
+        if data_type == FieldDataType.DATE:
+            value = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+        return {"key": key, "op": operator, "kind": value_kind(data_type), "values": [value]}
+    raise ValidationError([{"field": "filter", "message": f"Unknown filter operator: {operator}"}])
+
+
+def is_list_field(field: Dict[str, Any]) -> bool:
+    data_type = FieldDataType(field["data_type"])
+    if data_type in _LIST_TYPES:
+        return True
+    return data_type in _ID_TYPES and bool((field.get("settings_json") or {}).get("multiple"))
+
+
+def is_blob_field(field: Dict[str, Any]) -> bool:
+    # Large values of these types live in entry_blobs rather than inline in data_json.
+    return FieldDataType(field["data_type"]) in _BLOB_TYPES
+
+
+def value_kind(data_type: FieldDataType) -> str:
+    if data_type in _NUMERIC_TYPES:
+        return "numeric"
+    if data_type in _TEMPORAL_TYPES:
+        return "timestamp"
+    if data_type == FieldDataType.BOOLEAN:
+        return "boolean"
+    return "text"
+
+
+def value_column(data_type: FieldDataType) -> str:
+    return f"value_{value_kind(data_type)}"
+
+
+def _promoted_condition(field: Dict[str, Any], condition: Dict[str, Any]) -> Dict[str, Any]:
+    if condition["op"] == "contains":
+        return condition
+    data_type = FieldDataType(field["data_type"])
+    values = condition.get("values", [])
+    if data_type == FieldDataType.DATE:
+        values = [value if isinstance(value, datetime) else datetime.fromisoformat(value).replace(tzinfo=timezone.utc) for value in values]
+    elif value_kind(data_type) == "text":
+        values = [str(value) for value in values]
+    return {
+        "key": condition["key"],
+        "op": condition["op"],
+        "field_id": field["id"],
+        "value_column": value_column(data_type),
+        "values": values,
+    }
+
+
+def _equality_kind(data_type: FieldDataType) -> str:
+    # Values stored verbatim as JSON scalars can be matched by containment, which the data_json GIN index serves.
+    if data_type in {FieldDataType.DECIMAL, FieldDataType.DATETIME}:
+        return value_kind(data_type)
+    return "json"
+
+
+def _coerce(field: Dict[str, Any], raw_value: str) -> Any:
+    key = field["key"]
+    data_type = FieldDataType(field["data_type"])
+    try:
+        if data_type == FieldDataType.INTEGER or data_type in _ID_TYPES:
+            return int(raw_value)
+        if data_type == FieldDataType.DECIMAL:
+            return Decimal(raw_value)
+        if data_type == FieldDataType.BOOLEAN:
+            if raw_value not in {"true", "false"}:
+                raise ValueError(raw_value)
+            return raw_value == "true"
+        if data_type == FieldDataType.DATE:
+            value = date.fromisoformat(raw_value)
+            return value.isoformat()
+        if data_type == FieldDataType.DATETIME:
+            value = datetime.fromisoformat(raw_value.replace("Z", "+00:00"))
+            return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+    except (ValueError, InvalidOperation):
+        raise ValidationError([{"field": "filter", "message": f"Invalid {data_type.value} value for {key}: {raw_value!r}"}])
+    if data_type in {FieldDataType.SELECT, FieldDataType.MULTI_SELECT}:
+        return _match_option(field, raw_value)
+    return raw_value
+
+
+def _match_option(field: Dict[str, Any], raw_value: str) -> Any:
+    options = (field.get("validation_json") or {}).get("options") or []
+    for option in options:
+        if str(option) == raw_value:
+            return option
+    raise ValidationError([{"field": "filter", "message": f"Value {raw_value!r} is not an option of {field['key']}"}])
+
@@ -4,9 +4,24 @@ BEGIN;
 
 -- 1) Views 
 DROP TABLE IF EXISTS attachments          CASCADE;
+DROP TABLE IF EXISTS entry_former_readers CASCADE;
+DROP TABLE IF EXISTS entry_tombstone_readers CASCADE;
+DROP TABLE IF EXISTS entry_tombstones     CASCADE;
 DROP TABLE IF EXISTS entry_permissions    CASCADE;
 DROP TABLE IF EXISTS entry_history        CASCADE;
 DROP TABLE IF EXISTS entry_relations      CASCADE;
+DROP TABLE IF EXISTS schema_stats         CASCADE;
+DROP TABLE IF EXISTS entry_references     CASCADE;
+DROP TABLE IF EXISTS entry_relation_counts CASCADE;
+DROP TABLE IF EXISTS entry_search_documents CASCADE;
+DROP TABLE IF EXISTS field_indexes        CASCADE;
+DROP TABLE IF EXISTS entry_field_values   CASCADE;
+DROP TABLE IF EXISTS field_promotions     CASCADE;
+DROP TABLE IF EXISTS saved_query_results  CASCADE;
+DROP TABLE IF EXISTS saved_queries        CASCADE;
+DROP TABLE IF EXISTS entry_blobs          CASCADE;
+DROP TABLE IF EXISTS entry_outbox         CASCADE;
+DROP TABLE IF EXISTS entry_outbox_settings CASCADE;
 DROP TABLE IF EXISTS entries              CASCADE;
 DROP TABLE IF EXISTS fields               CASCADE;
 DROP TABLE IF EXISTS schemas              CASCADE;
@@ -14,6 +29,38 @@ DROP TABLE IF EXISTS users                CASCADE;
 
 -- 3) Trigger
 DROP FUNCTION IF EXISTS set_updated_at()   CASCADE;
+DROP FUNCTION IF EXISTS entries_maintain_schema_stats() CASCADE;
+DROP FUNCTION IF EXISTS rebuild_schema_stats() CASCADE;
+DROP FUNCTION IF EXISTS schema_stats_add(BIGINT, visibility_level_enum, TEXT, TIMESTAMPTZ, TIMESTAMPTZ) CASCADE;
+DROP FUNCTION IF EXISTS schema_stats_remove(BIGINT, visibility_level_enum, TEXT, TIMESTAMPTZ, TIMESTAMPTZ) CASCADE;
+DROP FUNCTION IF EXISTS jsonb_counter_adjust(JSONB, TEXT, BIGINT) CASCADE;
+DROP FUNCTION IF EXISTS entry_relations_notify() CASCADE;
+DROP FUNCTION IF EXISTS entries_maintain_references() CASCADE;
+DROP FUNCTION IF EXISTS entry_relations_maintain_counts() CASCADE;
+DROP FUNCTION IF EXISTS rebuild_entry_relation_counts() CASCADE;
+DROP FUNCTION IF EXISTS entry_relation_counts_adjust(BIGINT, TEXT, TEXT, BIGINT) CASCADE;
+DROP FUNCTION IF EXISTS entries_maintain_search_document() CASCADE;
+DROP FUNCTION IF EXISTS schemas_maintain_search_documents() CASCADE;
+DROP FUNCTION IF EXISTS rebuild_entry_search_documents() CASCADE;
+DROP FUNCTION IF EXISTS entry_search_document(BIGINT, TEXT, JSONB) CASCADE;
+DROP FUNCTION IF EXISTS entry_search_content(BIGINT, TEXT, JSONB) CASCADE;
+DROP FUNCTION IF EXISTS entry_search_fields(BIGINT) CASCADE;
+DROP FUNCTION IF EXISTS entry_search_prefix_query(TEXT) CASCADE;
+DROP FUNCTION IF EXISTS entry_data_numeric(JSONB, TEXT) CASCADE;
+DROP FUNCTION IF EXISTS entry_data_timestamp(JSONB, TEXT) CASCADE;
+DROP FUNCTION IF EXISTS entries_maintain_field_values() CASCADE;
+DROP FUNCTION IF EXISTS entry_field_values_refresh(BIGINT, BIGINT, JSONB, BIGINT) CASCADE;
+DROP FUNCTION IF EXISTS rebuild_entry_references() CASCADE;
+DROP FUNCTION IF EXISTS entries_store_blobs() CASCADE;
+DROP FUNCTION IF EXISTS entry_full_data(BIGINT, JSONB) CASCADE;
+DROP FUNCTION IF EXISTS entry_blob_min_bytes() CASCADE;
+DROP FUNCTION IF EXISTS entry_references_refresh(BIGINT, BIGINT, JSONB) CASCADE;
+DROP FUNCTION IF EXISTS entries_set_change_seq() CASCADE;
+DROP FUNCTION IF EXISTS entries_notify() CASCADE;
+DROP FUNCTION IF EXISTS entries_write_outbox() CASCADE;
+DROP FUNCTION IF EXISTS entry_permissions_touch_entry() CASCADE;
+DROP FUNCTION IF EXISTS entries_track_access() CASCADE;
+DROP FUNCTION IF EXISTS entries_write_tombstone() CASCADE;
 DROP TYPE IF EXISTS entry_permission_enum  CASCADE;
 DROP TYPE IF EXISTS permission_subject_type_enum CASCADE;
 DROP TYPE IF EXISTS field_data_type_enum   CASCADE;
@@ -111,7 +111,10 @@ CREATE TABLE IF NOT EXISTS entries (
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ,
     archived_at TIMESTAMPTZ,
-    deleted_at TIMESTAMPTZ
+    deleted_at TIMESTAMPTZ,
+    change_seq BIGINT NOT NULL DEFAULT 0,
+    access_changed_seq BIGINT NOT NULL DEFAULT 0,
+    widest_visibility visibility_level_enum NOT NULL DEFAULT 'private'
 );
 
 CREATE INDEX IF NOT EXISTS idx_entries_schema_status ON entries (schema_id, status);
@@ -119,10 +122,303 @@ CREATE INDEX IF NOT EXISTS idx_entries_owner ON entries (owner_id);
 CREATE INDEX IF NOT EXISTS idx_entries_visibility ON entries (visibility_level);
 CREATE INDEX IF NOT EXISTS idx_entries_data_json ON entries USING GIN (data_json);
 
+-- Updates issued by triggers (see entry_permissions_touch_entry) only bump change_seq.
 DROP TRIGGER IF EXISTS trg_entries_updated ON entries;
 CREATE TRIGGER trg_entries_updated
 BEFORE UPDATE ON entries
-FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+FOR EACH ROW WHEN (pg_trigger_depth() < 1) EXECUTE FUNCTION set_updated_at();
+
+-- change_seq is the writing transaction's id: every later commit gets a larger value, and readers only
+-- trust values below the oldest running transaction, so a delta-sync cursor never skips a late commit.
+CREATE OR REPLACE FUNCTION entries_set_change_seq()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.change_seq := pg_current_xact_id()::text::bigint;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_change_seq ON entries;
+CREATE TRIGGER trg_entries_change_seq
+BEFORE INSERT OR UPDATE ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_set_change_seq();
+
+CREATE INDEX IF NOT EXISTS idx_entries_change_seq ON entries (change_seq, id);
+
+-- Owners and grantees an entry has lost, so delta sync can tell who may still hold a copy of it.
+CREATE TABLE IF NOT EXISTS entry_former_readers (
+    entry_id BIGINT NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    subject_type permission_subject_type_enum NOT NULL,
+    subject_id TEXT NOT NULL,
+    PRIMARY KEY (entry_id, subject_type, subject_id)
+);
+
+-- access_changed_seq marks the last visibility, owner, deletion or grant change; widest_visibility is the broadest
+-- visibility the entry has ever had. Together with entry_former_readers they bound who could once read it.
+CREATE OR REPLACE FUNCTION entries_track_access()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        NEW.widest_visibility := NEW.visibility_level;
+        RETURN NEW;
+    END IF;
+    IF NEW.visibility_level IS DISTINCT FROM OLD.visibility_level
+        OR NEW.owner_id IS DISTINCT FROM OLD.owner_id
+        OR NEW.deleted_at IS DISTINCT FROM OLD.deleted_at THEN
+        NEW.access_changed_seq := pg_current_xact_id()::text::bigint;
+    END IF;
+    NEW.widest_visibility := CASE
+        WHEN 'public' IN (OLD.widest_visibility, NEW.visibility_level) THEN 'public'
+        WHEN 'internal' IN (OLD.widest_visibility, NEW.visibility_level) THEN 'internal'
+        WHEN 'restricted' IN (OLD.widest_visibility, NEW.visibility_level) THEN 'restricted'
+        ELSE 'private'
+    END::visibility_level_enum;
+    IF OLD.owner_id IS NOT NULL AND NEW.owner_id IS DISTINCT FROM OLD.owner_id THEN
+        INSERT INTO entry_former_readers (entry_id, subject_type, subject_id)
+        VALUES (OLD.id, 'user', OLD.owner_id::text)
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_track_access ON entries;
+CREATE TRIGGER trg_entries_track_access
+BEFORE INSERT OR UPDATE ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_track_access();
+
+CREATE OR REPLACE FUNCTION entries_notify()
+RETURNS TRIGGER AS $$
+DECLARE
+    entry entries;
+    event TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        entry := OLD;
+        event := 'entry.deleted';
+    ELSIF TG_OP = 'INSERT' THEN
+        entry := NEW;
+        event := 'entry.created';
+    ELSE
+        entry := NEW;
+        event := CASE
+            WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'entry.deleted'
+            ELSE 'entry.updated'
+        END;
+    END IF;
+    PERFORM pg_notify(
+        'entries_changed',
+        json_build_object(
+            'event', event,
+            'id', entry.id,
+            'schema_id', entry.schema_id,
+            'owner_id', entry.owner_id,
+            'visibility_level', entry.visibility_level,
+            'change_seq', entry.change_seq
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_notify ON entries;
+CREATE TRIGGER trg_entries_notify
+AFTER INSERT OR UPDATE OR DELETE ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_notify();
+
+CREATE INDEX IF NOT EXISTS idx_entries_created ON entries (created_at DESC, id DESC) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_entries_last_changed ON entries ((COALESCE(updated_at, created_at)) DESC, id DESC) WHERE deleted_at IS NULL;
+
+-- Large long_text/json values live out of line so list scans do not drag them through TOAST.
+CREATE TABLE IF NOT EXISTS entry_blobs (
+    entry_id BIGINT NOT NULL REFERENCES entries(id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+    field_key TEXT NOT NULL,
+    value JSONB NOT NULL,
+    PRIMARY KEY (entry_id, field_key)
+);
+
+CREATE OR REPLACE FUNCTION entry_blob_min_bytes()
+RETURNS INT AS $$
+  SELECT 2048;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION entry_full_data(p_entry_id BIGINT, p_data JSONB)
+RETURNS JSONB AS $$
+  SELECT COALESCE(p_data, '{}'::jsonb) || COALESCE(
+    (SELECT jsonb_object_agg(b.field_key, b.value) FROM entry_blobs b WHERE b.entry_id = p_entry_id),
+    '{}'::jsonb
+  );
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION entries_store_blobs()
+RETURNS TRIGGER AS $$
+DECLARE
+  large JSONB;
+BEGIN
+  SELECT COALESCE(jsonb_object_agg(d.key, d.value), '{}'::jsonb) INTO large
+  FROM jsonb_each(NEW.data_json) d
+  JOIN fields f ON f.schema_id = NEW.schema_id AND f.key = d.key
+  WHERE f.data_type IN ('long_text', 'json')
+    AND octet_length(d.value::text) >= entry_blob_min_bytes();
+
+  -- Keys missing from the new document keep their blob; a small inline value replaces it.
+  IF TG_OP = 'UPDATE' THEN
+    DELETE FROM entry_blobs b
+    WHERE b.entry_id = NEW.id AND NEW.data_json ? b.field_key AND NOT large ? b.field_key;
+  END IF;
+  IF large = '{}'::jsonb THEN
+    RETURN NEW;
+  END IF;
+  INSERT INTO entry_blobs AS b (entry_id, field_key, value)
+  SELECT NEW.id, d.key, d.value FROM jsonb_each(large) d
+  ON CONFLICT (entry_id, field_key) DO UPDATE SET value = EXCLUDED.value
+  WHERE b.value IS DISTINCT FROM EXCLUDED.value;
+  NEW.data_json = NEW.data_json - ARRAY(SELECT jsonb_object_keys(large));
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_blobs ON entries;
+CREATE TRIGGER trg_entries_blobs
+BEFORE INSERT OR UPDATE OF schema_id, data_json ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_store_blobs();
+CREATE INDEX IF NOT EXISTS idx_entries_schema_visibility ON entries (schema_id, visibility_level) WHERE deleted_at IS NULL;
+
+CREATE TABLE IF NOT EXISTS schema_stats (
+    schema_id BIGINT NOT NULL REFERENCES schemas(id) ON DELETE CASCADE,
+    visibility_level visibility_level_enum NOT NULL,
+    total_entries BIGINT NOT NULL DEFAULT 0,
+    status_counts JSONB NOT NULL DEFAULT '{}'::jsonb,
+    last_created_at TIMESTAMPTZ,
+    last_updated_at TIMESTAMPTZ,
+    PRIMARY KEY (schema_id, visibility_level)
+);
+
+-- Adds delta to one key of a {key: count} object, dropping the key when it reaches zero.
+CREATE OR REPLACE FUNCTION jsonb_counter_adjust(counts JSONB, counter_key TEXT, delta BIGINT)
+RETURNS JSONB AS $$
+  SELECT CASE
+    WHEN COALESCE((counts->>counter_key)::bigint, 0) + delta <= 0 THEN counts - counter_key
+    ELSE counts || jsonb_build_object(counter_key, COALESCE((counts->>counter_key)::bigint, 0) + delta)
+  END;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION schema_stats_add(
+  p_schema_id BIGINT,
+  p_visibility_level visibility_level_enum,
+  p_status TEXT,
+  p_created_at TIMESTAMPTZ,
+  p_updated_at TIMESTAMPTZ
+)
+RETURNS VOID AS $$
+BEGIN
+  INSERT INTO schema_stats AS s (
+    schema_id, visibility_level, total_entries, status_counts, last_created_at, last_updated_at
+  )
+  VALUES (
+    p_schema_id, p_visibility_level, 1, jsonb_build_object(p_status, 1), p_created_at, COALESCE(p_updated_at, p_created_at)
+  )
+  ON CONFLICT (schema_id, visibility_level) DO UPDATE SET
+    total_entries = s.total_entries + 1,
+    status_counts = jsonb_counter_adjust(s.status_counts, p_status, 1),
+    last_created_at = GREATEST(s.last_created_at, EXCLUDED.last_created_at),
+    last_updated_at = GREATEST(s.last_updated_at, EXCLUDED.last_updated_at);
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION schema_stats_remove(
+  p_schema_id BIGINT,
+  p_visibility_level visibility_level_enum,
+  p_status TEXT,
+  p_created_at TIMESTAMPTZ,
+  p_updated_at TIMESTAMPTZ
+)
+RETURNS VOID AS $$
+BEGIN
+  UPDATE schema_stats s SET
+    total_entries = GREATEST(s.total_entries - 1, 0),
+    status_counts = jsonb_counter_adjust(s.status_counts, p_status, -1)
+  WHERE s.schema_id = p_schema_id AND s.visibility_level = p_visibility_level;
+
+  -- Timestamps are high-water marks; only rescan when the removed entry held one of them.
+  UPDATE schema_stats s SET
+    last_created_at = agg.last_created_at,
+    last_updated_at = agg.last_updated_at
+  FROM (
+    SELECT MAX(e.created_at) AS last_created_at, MAX(COALESCE(e.updated_at, e.created_at)) AS last_updated_at
+    FROM entries e
+    WHERE e.schema_id = p_schema_id AND e.visibility_level = p_visibility_level AND e.deleted_at IS NULL
+  ) agg
+  WHERE s.schema_id = p_schema_id
+    AND s.visibility_level = p_visibility_level
+    AND (s.last_created_at <= p_created_at OR s.last_updated_at <= COALESCE(p_updated_at, p_created_at));
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION entries_maintain_schema_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'UPDATE'
+     AND OLD.deleted_at IS NULL AND NEW.deleted_at IS NULL
+     AND OLD.schema_id = NEW.schema_id AND OLD.visibility_level = NEW.visibility_level THEN
+    UPDATE schema_stats s SET
+      status_counts = CASE
+        WHEN OLD.status = NEW.status THEN s.status_counts
+        ELSE jsonb_counter_adjust(jsonb_counter_adjust(s.status_counts, OLD.status, -1), NEW.status, 1)
+      END,
+      last_created_at = GREATEST(s.last_created_at, NEW.created_at),
+      last_updated_at = GREATEST(s.last_updated_at, COALESCE(NEW.updated_at, NEW.created_at))
+    WHERE s.schema_id = NEW.schema_id AND s.visibility_level = NEW.visibility_level;
+    RETURN NULL;
+  END IF;
+
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.deleted_at IS NULL THEN
+    PERFORM schema_stats_remove(OLD.schema_id, OLD.visibility_level, OLD.status, OLD.created_at, OLD.updated_at);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.deleted_at IS NULL THEN
+    PERFORM schema_stats_add(NEW.schema_id, NEW.visibility_level, NEW.status, NEW.created_at, NEW.updated_at);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rebuild_schema_stats()
+RETURNS VOID AS $$
+BEGIN
+  LOCK TABLE schema_stats IN EXCLUSIVE MODE;
+  DELETE FROM schema_stats;
+  INSERT INTO schema_stats (
+    schema_id, visibility_level, total_entries, status_counts, last_created_at, last_updated_at
+  )
+  SELECT
+    schema_id,
+    visibility_level,
+    SUM(status_total),
+    jsonb_object_agg(status, status_total),
+    MAX(last_created_at),
+    MAX(last_updated_at)
+  FROM (
+    SELECT
+      schema_id,
+      visibility_level,
+      status,
+      COUNT(*) AS status_total,
+      MAX(created_at) AS last_created_at,
+      MAX(COALESCE(updated_at, created_at)) AS last_updated_at
+    FROM entries
+    WHERE deleted_at IS NULL
+    GROUP BY schema_id, visibility_level, status
+  ) grouped
+  GROUP BY schema_id, visibility_level;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_schema_stats ON entries;
+CREATE TRIGGER trg_entries_schema_stats
+AFTER INSERT OR UPDATE OR DELETE ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_maintain_schema_stats();
+
+SELECT rebuild_schema_stats();
 
 CREATE TABLE IF NOT EXISTS entry_relations (
     id BIGSERIAL PRIMARY KEY,
@@ -139,6 +435,118 @@ CREATE INDEX IF NOT EXISTS idx_entry_relations_from ON entry_relations (from_ent
 CREATE INDEX IF NOT EXISTS idx_entry_relations_to ON entry_relations (to_entry_id, relation_type);
 CREATE INDEX IF NOT EXISTS idx_entry_relations_metadata ON entry_relations USING GIN (metadata_json);
 
+CREATE OR REPLACE FUNCTION entry_relations_notify()
+RETURNS TRIGGER AS $$
+DECLARE
+    rel entry_relations;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        rel := OLD;
+    ELSE
+        rel := NEW;
+    END IF;
+    PERFORM pg_notify(
+        'entry_relations_changed',
+        json_build_object(
+            'op', TG_OP,
+            'id', rel.id,
+            'from_entry_id', rel.from_entry_id,
+            'to_entry_id', rel.to_entry_id,
+            'relation_type', rel.relation_type,
+            'sort_order', rel.sort_order
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entry_relations_notify ON entry_relations;
+CREATE TRIGGER trg_entry_relations_notify
+AFTER INSERT OR UPDATE OR DELETE ON entry_relations
+FOR EACH ROW EXECUTE FUNCTION entry_relations_notify();
+
+CREATE TABLE IF NOT EXISTS entry_relation_counts (
+    entry_id BIGINT PRIMARY KEY REFERENCES entries(id) ON DELETE CASCADE,
+    total BIGINT NOT NULL DEFAULT 0,
+    outgoing JSONB NOT NULL DEFAULT '{}'::jsonb,
+    incoming JSONB NOT NULL DEFAULT '{}'::jsonb
+);
+
+CREATE OR REPLACE FUNCTION entry_relation_counts_adjust(
+  p_entry_id BIGINT,
+  p_direction TEXT,
+  p_relation_type TEXT,
+  p_delta BIGINT
+)
+RETURNS VOID AS $$
+BEGIN
+  -- The entry may be going away in the same statement (cascade from entries); skip it then.
+  INSERT INTO entry_relation_counts AS c (entry_id, total, outgoing, incoming)
+  SELECT
+    p_entry_id,
+    GREATEST(p_delta, 0),
+    CASE WHEN p_direction = 'outgoing' THEN jsonb_counter_adjust('{}'::jsonb, p_relation_type, p_delta) ELSE '{}'::jsonb END,
+    CASE WHEN p_direction = 'incoming' THEN jsonb_counter_adjust('{}'::jsonb, p_relation_type, p_delta) ELSE '{}'::jsonb END
+  WHERE EXISTS (SELECT 1 FROM entries WHERE id = p_entry_id)
+  ON CONFLICT (entry_id) DO UPDATE SET
+    total = GREATEST(c.total + p_delta, 0),
+    outgoing = CASE WHEN p_direction = 'outgoing' THEN jsonb_counter_adjust(c.outgoing, p_relation_type, p_delta) ELSE c.outgoing END,
+    incoming = CASE WHEN p_direction = 'incoming' THEN jsonb_counter_adjust(c.incoming, p_relation_type, p_delta) ELSE c.incoming END;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION entry_relations_maintain_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'UPDATE'
+     AND OLD.from_entry_id = NEW.from_entry_id
+     AND OLD.to_entry_id = NEW.to_entry_id
+     AND OLD.relation_type = NEW.relation_type THEN
+    RETURN NULL;
+  END IF;
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM entry_relation_counts_adjust(OLD.from_entry_id, 'outgoing', OLD.relation_type, -1);
+    PERFORM entry_relation_counts_adjust(OLD.to_entry_id, 'incoming', OLD.relation_type, -1);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM entry_relation_counts_adjust(NEW.from_entry_id, 'outgoing', NEW.relation_type, 1);
+    PERFORM entry_relation_counts_adjust(NEW.to_entry_id, 'incoming', NEW.relation_type, 1);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rebuild_entry_relation_counts()
+RETURNS VOID AS $$
+BEGIN
+  LOCK TABLE entry_relation_counts IN EXCLUSIVE MODE;
+  DELETE FROM entry_relation_counts;
+  INSERT INTO entry_relation_counts (entry_id, total, outgoing, incoming)
+  SELECT
+    entry_id,
+    SUM(relation_total),
+    COALESCE(jsonb_object_agg(relation_type, relation_total) FILTER (WHERE direction = 'outgoing'), '{}'::jsonb),
+    COALESCE(jsonb_object_agg(relation_type, relation_total) FILTER (WHERE direction = 'incoming'), '{}'::jsonb)
+  FROM (
+    SELECT from_entry_id AS entry_id, 'outgoing' AS direction, relation_type, COUNT(*) AS relation_total
+    FROM entry_relations
+    GROUP BY from_entry_id, relation_type
+    UNION ALL
+    SELECT to_entry_id AS entry_id, 'incoming' AS direction, relation_type, COUNT(*) AS relation_total
+    FROM entry_relations
+    GROUP BY to_entry_id, relation_type
+  ) grouped
+  GROUP BY entry_id;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entry_relations_counts ON entry_relations;
+CREATE TRIGGER trg_entry_relations_counts
+AFTER INSERT OR UPDATE OR DELETE ON entry_relations
+FOR EACH ROW EXECUTE FUNCTION entry_relations_maintain_counts();
+
+SELECT rebuild_entry_relation_counts();
+
 CREATE TABLE IF NOT EXISTS entry_history (
     id BIGSERIAL PRIMARY KEY,
     entry_id BIGINT NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
@@ -183,3 +591,464 @@ CREATE TABLE IF NOT EXISTS entry_permissions (
 
 CREATE INDEX IF NOT EXISTS idx_entry_permissions_entry ON entry_permissions (entry_id);
 CREATE INDEX IF NOT EXISTS idx_entry_permissions_subject ON entry_permissions (subject_type, subject_id);
+
+CREATE OR REPLACE FUNCTION entry_permissions_touch_entry()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- The entry is already gone when its grants are removed by ON DELETE CASCADE.
+    IF TG_OP <> 'INSERT' AND EXISTS (SELECT 1 FROM entries WHERE id = OLD.entry_id) THEN
+        INSERT INTO entry_former_readers (entry_id, subject_type, subject_id)
+        VALUES (OLD.entry_id, OLD.subject_type, OLD.subject_id)
+        ON CONFLICT DO NOTHING;
+    END IF;
+    UPDATE entries
+    SET change_seq = pg_current_xact_id()::text::bigint,
+        access_changed_seq = pg_current_xact_id()::text::bigint
+    WHERE id = CASE WHEN TG_OP = 'DELETE' THEN OLD.entry_id ELSE NEW.entry_id END;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entry_permissions_touch_entry ON entry_permissions;
+CREATE TRIGGER trg_entry_permissions_touch_entry
+AFTER INSERT OR UPDATE OR DELETE ON entry_permissions
+FOR EACH ROW EXECUTE FUNCTION entry_permissions_touch_entry();
+
+-- Hard-deleted entries (a schema being deleted) leave a tombstone with everyone who could once read them, so
+-- delta sync can still report them as removed.
+CREATE TABLE IF NOT EXISTS entry_tombstones (
+    entry_id BIGINT PRIMARY KEY,
+    schema_id BIGINT NOT NULL,
+    owner_id INT,
+    widest_visibility visibility_level_enum NOT NULL,
+    change_seq BIGINT NOT NULL,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_entry_tombstones_change_seq ON entry_tombstones (change_seq, entry_id);
+
+CREATE TABLE IF NOT EXISTS entry_tombstone_readers (
+    entry_id BIGINT NOT NULL REFERENCES entry_tombstones(entry_id) ON DELETE CASCADE,
+    subject_type permission_subject_type_enum NOT NULL,
+    subject_id TEXT NOT NULL,
+    PRIMARY KEY (entry_id, subject_type, subject_id)
+);
+
+-- Runs before the delete, while the entry's grants and former readers have not been cascaded away yet.
+CREATE OR REPLACE FUNCTION entries_write_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO entry_tombstones (entry_id, schema_id, owner_id, widest_visibility, change_seq)
+    VALUES (OLD.id, OLD.schema_id, OLD.owner_id, OLD.widest_visibility, pg_current_xact_id()::text::bigint)
+    ON CONFLICT (entry_id) DO NOTHING;
+    INSERT INTO entry_tombstone_readers (entry_id, subject_type, subject_id)
+    SELECT OLD.id, ep.subject_type, ep.subject_id FROM entry_permissions ep WHERE ep.entry_id = OLD.id
+    UNION
+    SELECT OLD.id, fr.subject_type, fr.subject_id FROM entry_former_readers fr WHERE fr.entry_id = OLD.id
+    ON CONFLICT DO NOTHING;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_write_tombstone ON entries;
+CREATE TRIGGER trg_entries_write_tombstone
+BEFORE DELETE ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_write_tombstone();
+
+CREATE TABLE IF NOT EXISTS entry_references (
+    source_entry_id BIGINT NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    field_key TEXT NOT NULL,
+    target_type TEXT NOT NULL CHECK (target_type IN ('entry', 'attachment')),
+    target_id BIGINT NOT NULL,
+    PRIMARY KEY (source_entry_id, field_key, target_type, target_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_entry_references_target ON entry_references (target_type, target_id);
+
+CREATE OR REPLACE FUNCTION entry_references_refresh(p_entry_id BIGINT, p_schema_id BIGINT, p_data JSONB)
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM entry_references WHERE source_entry_id = p_entry_id;
+    INSERT INTO entry_references (source_entry_id, field_key, target_type, target_id)
+    SELECT DISTINCT
+        p_entry_id,
+        f.key,
+        CASE WHEN f.data_type = 'reference' THEN 'entry' ELSE 'attachment' END,
+        item.value::BIGINT
+    FROM fields f
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE jsonb_typeof(p_data -> f.key)
+            WHEN 'array' THEN p_data -> f.key
+            WHEN 'number' THEN jsonb_build_array(p_data -> f.key)
+            ELSE '[]'::jsonb
+        END
+    ) AS item(value)
+    WHERE f.schema_id = p_schema_id
+      AND f.data_type IN ('reference', 'file')
+      AND item.value ~ '^-?[0-9]{1,18}$';
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION entries_maintain_references()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+       AND NEW.data_json IS NOT DISTINCT FROM OLD.data_json
+       AND NEW.schema_id = OLD.schema_id THEN
+        RETURN NULL;
+    END IF;
+    PERFORM entry_references_refresh(NEW.id, NEW.schema_id, NEW.data_json);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rebuild_entry_references()
+RETURNS VOID AS $$
+BEGIN
+    LOCK TABLE entry_references IN EXCLUSIVE MODE;
+    PERFORM entry_references_refresh(id, schema_id, data_json) FROM entries;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_references ON entries;
+CREATE TRIGGER trg_entries_references
+AFTER INSERT OR UPDATE ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_maintain_references();
+
+SELECT rebuild_entry_references();
+
+CREATE TABLE IF NOT EXISTS entry_search_documents (
+    entry_id BIGINT PRIMARY KEY REFERENCES entries(id) ON DELETE CASCADE,
+    document TSVECTOR NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_entry_search_documents_document ON entry_search_documents USING GIN (document);
+
+CREATE OR REPLACE FUNCTION entry_search_fields(p_schema_id BIGINT)
+RETURNS TABLE (key TEXT, weight "char") AS $$
+  SELECT
+    f.key,
+    CASE
+      WHEN upper(f.settings_json ->> 'search_weight') IN ('A', 'B', 'C', 'D') THEN upper(f.settings_json ->> 'search_weight')
+      ELSE 'B'
+    END::"char"
+  FROM fields f
+  WHERE f.schema_id = p_schema_id
+    AND f.is_active IS TRUE
+    AND f.data_type IN ('text', 'long_text')
+    AND f.settings_json -> 'searchable' = 'true'::jsonb
+  ORDER BY f.sort_order, f.id;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION entry_search_document(p_schema_id BIGINT, p_title TEXT, p_data JSONB)
+RETURNS TSVECTOR AS $$
+DECLARE
+  v_document TSVECTOR;
+  v_field RECORD;
+BEGIN
+  SELECT setweight(to_tsvector('simple', COALESCE(p_title, '')), 'A')
+      || setweight(to_tsvector('simple', s.key || ' ' || s.name), 'D')
+  INTO v_document
+  FROM schemas s
+  WHERE s.id = p_schema_id;
+
+  FOR v_field IN SELECT * FROM entry_search_fields(p_schema_id) LOOP
+    IF jsonb_typeof(p_data -> v_field.key) = 'string' THEN
+      v_document := v_document || setweight(to_tsvector('simple', p_data ->> v_field.key), v_field.weight);
+    END IF;
+  END LOOP;
+  RETURN v_document;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+CREATE OR REPLACE FUNCTION entry_search_content(p_schema_id BIGINT, p_title TEXT, p_data JSONB)
+RETURNS TEXT AS $$
+  SELECT array_to_string(
+    ARRAY[p_title] || ARRAY(
+      SELECT p_data ->> sf.key
+      FROM entry_search_fields(p_schema_id) sf
+      WHERE jsonb_typeof(p_data -> sf.key) = 'string'
+    ),
+    ' ... '
+  );
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION entry_search_prefix_query(p_search TEXT)
+RETURNS TSQUERY AS $$
+  SELECT COALESCE(
+    (
+      SELECT to_tsquery('simple', string_agg(quote_literal(lexeme) || ':*', ' & '))
+      FROM unnest(tsvector_to_array(to_tsvector('simple', COALESCE(p_search, '')))) AS lexeme
+    ),
+    ''::tsquery
+  );
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION entries_maintain_search_document()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO entry_search_documents (entry_id, document)
+  VALUES (NEW.id, entry_search_document(NEW.schema_id, NEW.title, entry_full_data(NEW.id, NEW.data_json)))
+  ON CONFLICT (entry_id) DO UPDATE SET document = EXCLUDED.document;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION schemas_maintain_search_documents()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE entry_search_documents d
+  SET document = entry_search_document(e.schema_id, e.title, entry_full_data(e.id, e.data_json))
+  FROM entries e
+  WHERE d.entry_id = e.id AND e.schema_id = NEW.id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rebuild_entry_search_documents()
+RETURNS VOID AS $$
+BEGIN
+  LOCK TABLE entry_search_documents IN EXCLUSIVE MODE;
+  DELETE FROM entry_search_documents;
+  INSERT INTO entry_search_documents (entry_id, document)
+  SELECT id, entry_search_document(schema_id, title, entry_full_data(id, data_json))
+  FROM entries;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_search_document ON entries;
+CREATE TRIGGER trg_entries_search_document
+AFTER INSERT OR UPDATE OF schema_id, title, data_json ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_maintain_search_document();
+
+DROP TRIGGER IF EXISTS trg_schemas_search_documents ON schemas;
+CREATE TRIGGER trg_schemas_search_documents
+AFTER UPDATE OF key, name ON schemas
+FOR EACH ROW
+WHEN (OLD.key IS DISTINCT FROM NEW.key OR OLD.name IS DISTINCT FROM NEW.name)
+EXECUTE FUNCTION schemas_maintain_search_documents();
+
+SELECT rebuild_entry_search_documents();
+
+-- Substring lookups on titles use a trigram index where the extension is installable.
+DO $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    EXECUTE 'CREATE INDEX IF NOT EXISTS idx_entries_title_trgm ON entries USING GIN (title gin_trgm_ops) WHERE deleted_at IS NULL';
+  END IF;
+END $$;
+
+-- Typed data_json accessors shared by entry filters, sorts and expression indexes; naive datetimes read as UTC.
+CREATE OR REPLACE FUNCTION entry_data_numeric(p_data JSONB, p_key TEXT)
+RETURNS NUMERIC AS $$
+  SELECT CASE
+    WHEN jsonb_typeof(p_data -> p_key) IN ('number', 'string')
+      AND (p_data ->> p_key) ~ '^-?[0-9]+(\.[0-9]+)?([eE][-+]?[0-9]+)?$'
+    THEN (p_data ->> p_key)::NUMERIC
+  END;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION entry_data_timestamp(p_data JSONB, p_key TEXT)
+RETURNS TIMESTAMPTZ AS $$
+BEGIN
+  IF jsonb_typeof(p_data -> p_key) = 'string'
+    AND (p_data ->> p_key) ~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}([T ][0-9]{2}:[0-9]{2}(:[0-9]{2}(\.[0-9]+)?)?([+-][0-9]{2}(:?[0-9]{2})?|Z)?)?$'
+  THEN
+    -- The pattern lets impossible dates such as 2026-13-45 through; treat them as missing like any other bad value.
+    BEGIN
+      RETURN (p_data ->> p_key)::TIMESTAMPTZ;
+    EXCEPTION WHEN data_exception THEN
+      RETURN NULL;
+    END;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE SET timezone = 'UTC';
+
+CREATE TABLE IF NOT EXISTS field_indexes (
+    field_id BIGINT PRIMARY KEY,
+    schema_id BIGINT NOT NULL REFERENCES schemas(id) ON DELETE CASCADE,
+    index_name TEXT NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('pending', 'building', 'ready', 'failed', 'dropping')),
+    error TEXT,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_field_indexes_schema ON field_indexes (schema_id, field_id);
+
+CREATE TABLE IF NOT EXISTS field_promotions (
+    field_id BIGINT PRIMARY KEY REFERENCES fields(id) ON DELETE CASCADE,
+    schema_id BIGINT NOT NULL REFERENCES schemas(id) ON DELETE CASCADE,
+    status TEXT NOT NULL CHECK (status IN ('pending', 'ready')),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_field_promotions_schema ON field_promotions (schema_id, field_id);
+
+CREATE TABLE IF NOT EXISTS entry_field_values (
+    entry_id BIGINT NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    field_id BIGINT NOT NULL REFERENCES fields(id) ON DELETE CASCADE,
+    value_numeric NUMERIC,
+    value_timestamp TIMESTAMPTZ,
+    value_text TEXT,
+    value_boolean BOOLEAN,
+    PRIMARY KEY (entry_id, field_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_entry_field_values_numeric ON entry_field_values (field_id, value_numeric, entry_id) WHERE value_numeric IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_entry_field_values_timestamp ON entry_field_values (field_id, value_timestamp, entry_id) WHERE value_timestamp IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_entry_field_values_text ON entry_field_values (field_id, value_text, entry_id) WHERE value_text IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_entry_field_values_boolean ON entry_field_values (field_id, value_boolean, entry_id) WHERE value_boolean IS NOT NULL;
+
+CREATE OR REPLACE FUNCTION entry_field_values_refresh(
+    p_entry_id BIGINT,
+    p_schema_id BIGINT,
+    p_data JSONB,
+    p_field_id BIGINT DEFAULT NULL
+)
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM entry_field_values
+    WHERE entry_id = p_entry_id
+      AND (p_field_id IS NULL OR field_id = p_field_id);
+    INSERT INTO entry_field_values (entry_id, field_id, value_numeric, value_timestamp, value_text, value_boolean)
+    SELECT p_entry_id, v.field_id, v.value_numeric, v.value_timestamp, v.value_text, v.value_boolean
+    FROM (
+        SELECT
+            f.id AS field_id,
+            CASE WHEN f.data_type IN ('integer', 'decimal') THEN entry_data_numeric(p_data, f.key) END AS value_numeric,
+            CASE WHEN f.data_type IN ('date', 'datetime') THEN entry_data_timestamp(p_data, f.key) END AS value_timestamp,
+            CASE
+                WHEN f.data_type NOT IN ('integer', 'decimal', 'date', 'datetime', 'boolean')
+                 AND jsonb_typeof(p_data -> f.key) IN ('string', 'number')
+                THEN p_data ->> f.key
+            END AS value_text,
+            CASE WHEN f.data_type = 'boolean' AND jsonb_typeof(p_data -> f.key) = 'boolean' THEN (p_data ->> f.key)::BOOLEAN END AS value_boolean
+        FROM field_promotions fp
+        JOIN fields f ON f.id = fp.field_id
+        WHERE fp.schema_id = p_schema_id
+          AND (p_field_id IS NULL OR fp.field_id = p_field_id)
+    ) v
+    WHERE v.value_numeric IS NOT NULL
+       OR v.value_timestamp IS NOT NULL
+       OR v.value_text IS NOT NULL
+       OR v.value_boolean IS NOT NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION entries_maintain_field_values()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+       AND NEW.data_json IS NOT DISTINCT FROM OLD.data_json
+       AND NEW.schema_id = OLD.schema_id
+       AND NOT EXISTS (SELECT 1 FROM entry_blobs b WHERE b.entry_id = NEW.id) THEN
+        RETURN NULL;
+    END IF;
+    PERFORM entry_field_values_refresh(NEW.id, NEW.schema_id, entry_full_data(NEW.id, NEW.data_json));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_field_values ON entries;
+CREATE TRIGGER trg_entries_field_values
+AFTER INSERT OR UPDATE OF data_json, schema_id ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_maintain_field_values();
+
+CREATE INDEX IF NOT EXISTS idx_entries_schema_changed ON entries (schema_id, (COALESCE(updated_at, created_at)));
+
+CREATE TABLE IF NOT EXISTS saved_queries (
+    id BIGSERIAL PRIMARY KEY,
+    schema_id BIGINT NOT NULL REFERENCES schemas(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    owner_id INT REFERENCES users(id) ON DELETE CASCADE,
+    role TEXT CHECK (role IN ('head_admin', 'admin', 'manager', 'editor', 'reader')),
+    filters TEXT[] NOT NULL DEFAULT '{}',
+    sort TEXT,
+    fields TEXT[] NOT NULL DEFAULT '{}',
+    created_by INT REFERENCES users(id) ON DELETE SET NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ,
+    CONSTRAINT ck_saved_queries_subject CHECK ((owner_id IS NULL) <> (role IS NULL))
+);
+
+CREATE INDEX IF NOT EXISTS idx_saved_queries_owner ON saved_queries (owner_id, id) WHERE owner_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_saved_queries_role ON saved_queries (role, id) WHERE role IS NOT NULL;
+
+DROP TRIGGER IF EXISTS trg_saved_queries_updated ON saved_queries;
+CREATE TRIGGER trg_saved_queries_updated
+BEFORE UPDATE ON saved_queries
+FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+CREATE TABLE IF NOT EXISTS saved_query_results (
+    saved_query_id BIGINT PRIMARY KEY REFERENCES saved_queries(id) ON DELETE CASCADE,
+    entry_ids BIGINT[] NOT NULL,
+    watermark TIMESTAMPTZ,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Outbox rows are written by the same statement as the entry change and drained by the API's dispatcher.
+CREATE TABLE IF NOT EXISTS entry_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    event_type TEXT NOT NULL,
+    entry_id BIGINT NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    attempts INT NOT NULL DEFAULT 0,
+    available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_error TEXT,
+    failed_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_entry_outbox_pending ON entry_outbox (available_at, id) WHERE failed_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_entry_outbox_entry ON entry_outbox (entry_id, id) WHERE failed_at IS NULL;
+
+-- Single row gating capture for every API process; set explicitly through OUTBOX_CAPTURE or by an operator.
+CREATE TABLE IF NOT EXISTS entry_outbox_settings (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    enabled BOOLEAN NOT NULL DEFAULT FALSE
+);
+
+INSERT INTO entry_outbox_settings (id, enabled) VALUES (TRUE, FALSE) ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION entries_write_outbox()
+RETURNS TRIGGER AS $$
+DECLARE
+    entry entries;
+    event TEXT;
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM entry_outbox_settings WHERE enabled) THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        entry := OLD;
+        event := 'entry.deleted';
+    ELSIF TG_OP = 'INSERT' THEN
+        entry := NEW;
+        event := 'entry.created';
+    ELSE
+        -- Grant changes only bump change_seq; downstream systems receive entry content, not access state.
+        IF to_jsonb(OLD) - 'change_seq' - 'access_changed_seq' = to_jsonb(NEW) - 'change_seq' - 'access_changed_seq' THEN
+            RETURN NULL;
+        END IF;
+        entry := NEW;
+        event := CASE
+            WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'entry.deleted'
+            ELSE 'entry.updated'
+        END;
+    END IF;
+    INSERT INTO entry_outbox (event_type, entry_id, payload)
+    VALUES (
+        event,
+        entry.id,
+        jsonb_set(to_jsonb(entry), '{data_json}', entry_full_data(entry.id, entry.data_json))
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entries_outbox ON entries;
+CREATE TRIGGER trg_entries_outbox
+AFTER INSERT OR UPDATE OR DELETE ON entries
+FOR EACH ROW EXECUTE FUNCTION entries_write_outbox();
@@ -0,0 +1,9 @@
+Write-Host "⏳ Rebuilding schema statistics (using container env)..."
+
+docker compose exec -T db sh -lc 'psql -v ON_ERROR_STOP=1 -U "$POSTGRES_USER" -d "$POSTGRES_DB" -c "SELECT rebuild_schema_stats();"'
+if ($LASTEXITCODE -eq 0) {
+  Write-Host "✅ schema_stats erfolgreich neu aufgebaut."
+} else {
+  Write-Host "❌ Fehler beim Neuaufbau von schema_stats."
+  exit $LASTEXITCODE
+}
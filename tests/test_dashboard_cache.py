@@ -0,0 +1,58 @@
+import threading
+import time
+
+from api.app.services.cache import TTLCache
+
+
+def test_ttl_cache_computes_concurrent_identical_requests_once():
+    cache = TTLCache(ttl_seconds=60)
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"total_entries": 3}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute(("admin",), compute))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert results == [{"total_entries": 3}] * 5
+
+
+def test_ttl_cache_invalidation_discards_cached_and_in_flight_results():
+    cache = TTLCache(ttl_seconds=60)
+    values = iter([1, 2, 3])
+
+    assert cache.get_or_compute("key", lambda: next(values)) == 1
+    assert cache.get_or_compute("key", lambda: next(values)) == 1
+
+    cache.invalidate()
+    assert cache.get_or_compute("key", lambda: next(values)) == 2
+
+    def compute_during_write():
+        cache.invalidate()
+        return 99
+
+    assert cache.get_or_compute("other", compute_during_write) == 99
+    assert cache.get_or_compute("other", lambda: next(values)) == 3
+
+
+def test_ttl_cache_expires_entries_and_can_be_disabled():
+    cache = TTLCache(ttl_seconds=0.05)
+    values = iter([1, 2])
+    assert cache.get_or_compute("key", lambda: next(values)) == 1
+    time.sleep(0.1)
+    assert cache.get_or_compute("key", lambda: next(values)) == 2
+
+    disabled = TTLCache(ttl_seconds=0)
+    counter = iter([1, 2])
+    assert disabled.get_or_compute("key", lambda: next(counter)) == 1
+    assert disabled.get_or_compute("key", lambda: next(counter)) == 2
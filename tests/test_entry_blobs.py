@@ -0,0 +1,107 @@
+from api.app.db import get_connection
+from api.app.security import create_access_token
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _stored(entry_id: int) -> tuple:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT data_json FROM entries WHERE id=%s;", (entry_id,))
+        inline = cur.fetchone()["data_json"]
+        cur.execute("SELECT field_key FROM entry_blobs WHERE entry_id=%s ORDER BY field_key;", (entry_id,))
+        return inline, [row["field_key"] for row in cur.fetchall()]
+
+
+def test_large_field_values_are_stored_out_of_line(client):
+    _ensure_test_actor()
+    admin_headers = {"Authorization": f"Bearer {create_access_token({'id': 999, 'role': 'head_admin'})}"}
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_blob_case",
+            "name": "Entry Blob Case",
+            "description": "Schema for out-of-line field storage test",
+            "icon": "archive",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    for key, data_type, settings in (
+        ("notes", "long_text", {"searchable": True}),
+        ("payload", "json", {}),
+        ("label", "text", {}),
+    ):
+        response = client.post(
+            f"/schemas/{schema_id}/fields",
+            json={"key": key, "label": key.title(), "data_type": data_type, "settings_json": settings},
+        )
+        assert response.status_code == 201
+
+    notes = "lighthouse " + "x" * 4000
+    payload = {"rows": list(range(1000))}
+    created = client.post(
+        "/entries",
+        json={
+            "schema_id": schema_id,
+            "title": "Big",
+            "status": "open",
+            "visibility_level": "public",
+            "data_json": {"notes": notes, "payload": payload, "label": "big"},
+        },
+    )
+    assert created.status_code == 201
+    entry = created.json()
+    assert entry["data_json"] == {"notes": notes, "payload": payload, "label": "big"}
+    small = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": "Small", "status": "open", "visibility_level": "public", "data_json": {"notes": "short"}},
+    ).json()
+
+    assert _stored(entry["id"]) == ({"label": "big"}, ["notes", "payload"])
+    assert _stored(small["id"]) == ({"notes": "short"}, [])
+
+    listed = {item["id"]: item for item in client.get(f"/entries?schema_id={schema_id}").json()}
+    assert listed[entry["id"]]["data_json"] == {"label": "big"}
+    assert listed[small["id"]]["data_json"] == {"notes": "short"}
+
+    assert client.get(f"/entries/{entry['id']}").json()["data_json"]["notes"] == notes
+    projected = client.get(f"/entries?schema_id={schema_id}&fields=notes&sort=title").json()
+    assert [item["data_json"] for item in projected] == [{"notes": notes}, {"notes": "short"}]
+    whole = client.get(f"/entries?schema_id={schema_id}&fields=data_json&filter=label:eq:big").json()
+    assert whole[0]["data_json"]["payload"] == payload
+
+    filtered = client.get(f"/entries?schema_id={schema_id}&filter=payload:notnull").json()
+    assert [item["id"] for item in filtered] == [entry["id"]]
+    searched = client.get(f"/entries/search?q=lighthouse&schema_id={schema_id}", headers=admin_headers).json()
+    assert [item["id"] for item in searched["items"]] == [entry["id"]]
+
+    invalid = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": "essay", "label": "Essay", "data_type": "long_text", "settings_json": {"indexed": True}},
+    )
+    assert invalid.status_code == 422
+
+    updated = client.patch(f"/entries/{entry['id']}", json={"data_json": {"label": "renamed"}})
+    assert updated.status_code == 200
+    assert updated.json()["data_json"]["notes"] == notes
+    assert _stored(entry["id"]) == ({"label": "renamed"}, ["notes", "payload"])
+
+    shrunk = client.patch(f"/entries/{entry['id']}", json={"data_json": {"notes": "beacon"}})
+    assert shrunk.status_code == 200
+    assert _stored(entry["id"]) == ({"label": "renamed", "notes": "beacon"}, ["payload"])
+    assert client.get(f"/entries/search?q=lighthouse&schema_id={schema_id}", headers=admin_headers).json()["total"] == 0
+
+    history = client.get(f"/entries/{entry['id']}/history", headers=admin_headers).json()
+    assert any((record.get("old_data_json") or {}).get("notes") == notes for record in history)
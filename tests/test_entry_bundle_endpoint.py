@@ -144,3 +144,125 @@ def test_entry_bundle_endpoint_returns_detail_payload_in_one_response(client):
     assert payload["attachments"][0]["file_name"] == "briefing.pdf"
     assert len(payload["permissions"]) == 1
     assert payload["permissions"][0]["permission"] == "read"
+
+
+def test_entry_bundle_is_loaded_with_a_single_database_round_trip(client, monkeypatch):
+    import api.app.repositories.metadata as metadata_repository
+    from api.app.services.entries import EntryService
+
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_bundle_round_trip",
+            "name": "Entry Bundle Round Trip",
+            "description": "Schema for bundle round trip test",
+            "icon": "layers",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    entry_resp = client.post(
+        "/entries",
+        json={
+            "schema_id": schema_resp.json()["id"],
+            "title": "Round Trip Entry",
+            "status": "open",
+            "visibility_level": "internal",
+            "data_json": {},
+        },
+    )
+    assert entry_resp.status_code == 201
+    entry_id = entry_resp.json()["id"]
+
+    opened = []
+    original_get_connection = metadata_repository.get_connection
+
+    def counting_get_connection():
+        opened.append(1)
+        return original_get_connection()
+
+    monkeypatch.setattr(metadata_repository, "get_connection", counting_get_connection)
+    bundle = EntryService().get_entry_bundle(entry_id, current_user={"id": 1001, "role": "reader"})
+
+    assert len(opened) == 1
+    assert bundle["entry"]["id"] == entry_id
+    assert bundle["access"]["read"] is True
+    assert bundle["history"] == []
+    assert bundle["permissions"] == []
+
+
+def test_entry_bundles_endpoint_returns_readable_bundles_matching_single_bundle(client):
+    _ensure_test_actor()
+    auth_headers = _auth_headers()
+
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_bundle_batch",
+            "name": "Entry Bundle Batch",
+            "description": "Schema for batch bundle test",
+            "icon": "layers",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    entry_ids = []
+    for title, visibility_level in (("Batch One", "internal"), ("Batch Two", "internal"), ("Batch Hidden", "private")):
+        resp = client.post(
+            "/entries",
+            json={
+                "schema_id": schema_id,
+                "title": title,
+                "status": "open",
+                "visibility_level": visibility_level,
+                "data_json": {},
+            },
+        )
+        assert resp.status_code == 201
+        entry_ids.append(resp.json()["id"])
+    first_id, second_id, hidden_id = entry_ids
+
+    relation_resp = client.post(
+        f"/entries/{first_id}/relations",
+        json={"to_entry_id": second_id, "relation_type": "related_to", "sort_order": 1, "metadata_json": {}},
+    )
+    assert relation_resp.status_code == 201
+    attachment_resp = client.post(
+        f"/entries/{second_id}/attachments",
+        json={
+            "file_name": "batch.pdf",
+            "external_url": "https://example.com/batch.pdf",
+            "file_size": 1,
+            "checksum": "entry-bundle-batch-attachment",
+        },
+    )
+    assert attachment_resp.status_code == 201
+
+    response = client.post("/entries/bundles", json={"entry_ids": [second_id, first_id, 987654321, second_id]}, headers=auth_headers)
+    assert response.status_code == 200
+    bundles = response.json()
+    assert [bundle["entry"]["id"] for bundle in bundles] == [second_id, first_id]
+    for bundle in bundles:
+        single = client.get(f"/entries/{bundle['entry']['id']}/bundle", headers=auth_headers)
+        assert single.status_code == 200
+        assert bundle == single.json()
+
+    reader_headers = {"Authorization": f"Bearer {create_access_token({'id': 1001, 'role': 'reader'})}"}
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (1001, 'bundle_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO NOTHING;
+            """
+        )
+        conn.commit()
+    reader_response = client.post("/entries/bundles", json={"entry_ids": [first_id, hidden_id]}, headers=reader_headers)
+    assert reader_response.status_code == 200
+    reader_bundles = reader_response.json()
+    assert [bundle["entry"]["id"] for bundle in reader_bundles] == [first_id]
+    assert reader_bundles[0]["history"] == []
+    assert reader_bundles[0]["relation_targets"][0]["id"] == second_id
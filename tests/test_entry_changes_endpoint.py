@@ -0,0 +1,121 @@
+from api.app.db import get_connection
+from api.app.security import create_access_token
+
+
+def _ensure_users() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES
+                (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb),
+                (1501, 'changes_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET
+                username = EXCLUDED.username,
+                role = EXCLUDED.role,
+                is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _headers(user_id: int, role: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token({'id': user_id, 'role': role})}"}
+
+
+def _sync(client, headers: dict, since=None, **params) -> dict:
+    if since is not None:
+        params["since"] = since
+    response = client.get("/entries/changes", params=params, headers=headers)
+    assert response.status_code == 200, response.json()
+    return response.json()
+
+
+def test_entry_changes_return_deltas_since_cursor(client):
+    _ensure_users()
+    reader = _headers(1501, "reader")
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_changes_case",
+            "name": "Entry Changes Case",
+            "description": "Schema for delta sync test",
+            "icon": "refresh",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    ids = {}
+    for title, visibility in (
+        ("One", "internal"),
+        ("Two", "internal"),
+        ("Three", "public"),
+        ("Hidden", "restricted"),
+        ("Secret", "private"),
+    ):
+        response = client.post(
+            "/entries",
+            json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": visibility, "data_json": {}},
+        )
+        assert response.status_code == 201
+        ids[title] = response.json()["id"]
+
+    initial = _sync(client, reader, schema_id=schema_id)
+    assert [item["title"] for item in initial["changes"]] == ["One", "Two", "Three"]
+    assert initial["removed"] == []
+    assert initial["has_more"] is False
+
+    paged = _sync(client, reader, schema_id=schema_id, limit=2)
+    assert [item["title"] for item in paged["changes"]] == ["One", "Two"]
+    assert paged["has_more"] is True
+    rest = _sync(client, reader, paged["cursor"], schema_id=schema_id, limit=2)
+    assert [item["title"] for item in rest["changes"]] == ["Three"]
+    assert rest["removed"] == []
+
+    cursor = initial["cursor"]
+    assert _sync(client, reader, cursor, schema_id=schema_id) == {
+        "changes": [],
+        "removed": [],
+        "cursor": cursor,
+        "has_more": False,
+    }
+
+    assert client.patch(f"/entries/{ids['One']}", json={"title": "One renamed"}).status_code == 200
+    assert client.patch(f"/entries/{ids['Two']}", json={"visibility_level": "private"}).status_code == 200
+    deleted = client.patch(f"/entries/{ids['Three']}", json={"deleted_at": "2026-01-01T00:00:00Z"})
+    assert deleted.status_code == 200
+    grant = client.post(
+        f"/entries/{ids['Hidden']}/permissions",
+        json={"subject_type": "user", "subject_id": "1501", "permission": "read"},
+    )
+    assert grant.status_code == 201
+    assert client.patch(f"/entries/{ids['Secret']}", json={"deleted_at": "2026-01-01T00:00:00Z"}).status_code == 200
+
+    delta = _sync(client, reader, cursor, schema_id=schema_id)
+    assert [item["title"] for item in delta["changes"]] == ["One renamed", "Hidden"]
+    assert delta["removed"] == [ids["Two"], ids["Three"]]
+    anonymous = _sync(client, {}, cursor, schema_id=schema_id)
+    assert anonymous["changes"] == []
+    assert anonymous["removed"] == [ids["Three"]]
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT updated_at FROM entries WHERE id=%s;", (ids["Hidden"],))
+        assert cur.fetchone()["updated_at"] is None
+
+    assert _sync(client, reader, delta["cursor"], schema_id=schema_id)["changes"] == []
+
+    revoked = client.delete(f"/entries/{ids['Hidden']}/permissions/{grant.json()['id']}")
+    assert revoked.status_code == 200
+    after_revoke = _sync(client, reader, delta["cursor"], schema_id=schema_id)
+    assert after_revoke["changes"] == []
+    assert after_revoke["removed"] == [ids["Hidden"]]
+
+    assert client.delete(f"/schemas/{schema_id}").status_code == 200
+    dropped = _sync(client, reader, after_revoke["cursor"], schema_id=schema_id)
+    assert dropped["changes"] == []
+    assert dropped["removed"] == [ids["One"], ids["Two"], ids["Three"], ids["Hidden"]]
+    assert _sync(client, {}, after_revoke["cursor"], schema_id=schema_id)["removed"] == [ids["Three"]]
+    assert _sync(client, reader, dropped["cursor"], schema_id=schema_id)["removed"] == []
+    assert _sync(client, reader, schema_id=schema_id)["removed"] == []
+    assert client.get("/entries/changes?since=bogus").status_code == 422
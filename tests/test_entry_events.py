@@ -0,0 +1,178 @@
+import asyncio
+import json
+
+from api.app.db import get_connection
+from api.app.repositories.metadata import EntryRepository
+from api.app.services.events import ENTRY_EVENTS_CHANNEL, EntryEventBroker
+from api.app.services.notifications import NotificationListener
+from api.app.services.relation_index import RELATION_INDEX_CHANNEL
+
+
+def _ensure_users() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES
+                (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb),
+                (1601, 'events_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET
+                username = EXCLUDED.username,
+                role = EXCLUDED.role,
+                is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _create_entry(client, schema_id: int, title: str, visibility_level: str) -> int:
+    response = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": visibility_level, "data_json": {}},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _drain(loop, subscription, count: int) -> list:
+    events = []
+    while len(events) < count:
+        event = loop.run_until_complete(subscription.next_event(5))
+        assert event is not None, events
+        if event["event"] != "resync":
+            events.append(event)
+    return events
+
+
+def test_entry_events_fan_out_with_permission_filtering(client):
+    _ensure_users()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_events_case",
+            "name": "Entry Events Case",
+            "description": "Schema for entry event stream test",
+            "icon": "radio",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    loop = asyncio.new_event_loop()
+    broker = EntryEventBroker()
+    admin = broker.subscribe({"id": 999, "role": "head_admin"}, loop=loop)
+    reader = broker.subscribe({"id": 1601, "role": "reader"}, loop=loop, schema_id=schema_id)
+    other_schema = broker.subscribe({"id": 1601, "role": "reader"}, loop=loop, schema_id=schema_id + 1000)
+    listener = NotificationListener(reconnect_delay_seconds=0.1)
+    listener.subscribe(ENTRY_EVENTS_CHANNEL, broker.handle_entry_notification, on_connect=broker.resync)
+    listener.subscribe(RELATION_INDEX_CHANNEL, broker.handle_relation_notification)
+    broker.start()
+    listener.start()
+    try:
+        assert listener.wait_until_connected(5)
+        shared_id = _create_entry(client, schema_id, "Shared", "internal")
+        private_id = _create_entry(client, schema_id, "Private", "private")
+        relation = client.post(
+            f"/entries/{shared_id}/relations",
+            json={"to_entry_id": private_id, "relation_type": "related_to", "sort_order": 0, "metadata_json": {}},
+        )
+        assert relation.status_code == 201
+        assert client.patch(f"/entries/{shared_id}", json={"title": "Shared renamed"}).status_code == 200
+        deleted = client.patch(f"/entries/{shared_id}", json={"deleted_at": "2026-01-01T00:00:00Z"})
+        assert deleted.status_code == 200
+
+        admin_events = _drain(loop, admin, 5)
+        assert [event["event"] for event in admin_events] == [
+            "entry.created",
+            "entry.created",
+            "relation.created",
+            "entry.updated",
+            "entry.deleted",
+        ]
+        assert admin_events[2]["relation_id"] == relation.json()["id"]
+
+        reader_events = _drain(loop, reader, 3)
+        assert [(event["event"], event["entry_id"]) for event in reader_events] == [
+            ("entry.created", shared_id),
+            ("entry.updated", shared_id),
+            ("entry.deleted", shared_id),
+        ]
+        assert reader_events[0]["schema_id"] == schema_id
+        assert loop.run_until_complete(reader.next_event(0.3)) is None
+        assert loop.run_until_complete(other_schema.next_event(0.1)) in (None, {"event": "resync"})
+    finally:
+        listener.stop()
+        broker.stop()
+        loop.close()
+
+
+class CountingEntryRepository(EntryRepository):
+    def __init__(self):
+        self.lookups = []
+
+    def list_entry_access(self, entry_ids):
+        self.lookups.append(list(entry_ids))
+        return super().list_entry_access(entry_ids)
+
+
+def test_queued_notifications_share_one_access_lookup(client):
+    _ensure_users()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_events_batch",
+            "name": "Entry Events Batch",
+            "description": "Schema for batched event fan-out test",
+            "icon": "radio",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+    public_id = _create_entry(client, schema_id, "Open", "public")
+    private_id = _create_entry(client, schema_id, "Closed", "private")
+
+    loop = asyncio.new_event_loop()
+    try:
+        repository = CountingEntryRepository()
+        broker = EntryEventBroker(repository)
+        anonymous = broker.subscribe(None, loop=loop)
+        for entry_id, visibility in ((public_id, "public"), (private_id, "private"), (public_id, "public")):
+            payload = {
+                "event": "entry.updated",
+                "id": entry_id,
+                "schema_id": schema_id,
+                "owner_id": 999,
+                "visibility_level": visibility,
+                "change_seq": 1,
+            }
+            broker.handle_entry_notification(json.dumps(payload))
+        assert repository.lookups == []
+        assert broker.publish_pending(timeout=1) == 3
+        assert repository.lookups == [sorted([public_id, private_id])]
+        events = [loop.run_until_complete(anonymous.next_event(1)) for _ in range(2)]
+        assert [event["entry_id"] for event in events] == [public_id, public_id]
+        assert loop.run_until_complete(anonymous.next_event(0.1)) is None
+    finally:
+        loop.close()
+
+
+def test_slow_event_subscriber_is_cut_off():
+    loop = asyncio.new_event_loop()
+    try:
+        broker = EntryEventBroker()
+        subscription = broker.subscribe(None, loop=loop, max_queued=2)
+        for index in range(5):
+            subscription.offer({"event": "entry.updated", "entry_id": index})
+        events = [loop.run_until_complete(subscription.next_event(1)) for _ in range(3)]
+        assert [event["event"] for event in events] == ["entry.updated", "entry.updated", "overflow"]
+        assert subscription.overflowed
+        assert loop.run_until_complete(subscription.next_event(0.1)) is None
+    finally:
+        loop.close()
+
+
+def test_event_stream_route_is_registered(client):
+    paths = {item["path"] for item in client.get("/__routes").json()}
+    assert "/events" in paths
@@ -0,0 +1,132 @@
+from api.app.db import get_connection
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _create_field(client, schema_id: int, key: str, data_type: str, **extra) -> None:
+    response = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": key, "label": key.title(), "data_type": data_type, **extra},
+    )
+    assert response.status_code == 201
+
+
+def _titles(response) -> list[str]:
+    assert response.status_code == 200, response.json()
+    return [item["title"] for item in response.json()]
+
+
+def test_entries_filter_and_sort_dsl(client):
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_filter_case",
+            "name": "Entry Filter Case",
+            "description": "Schema for entry filter test",
+            "icon": "filter",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    _create_field(client, schema_id, "priority", "integer")
+    _create_field(client, schema_id, "cost", "decimal")
+    _create_field(client, schema_id, "due", "date")
+    _create_field(client, schema_id, "stage", "select", validation_json={"options": ["new", "done"]})
+    _create_field(client, schema_id, "tags", "multi_select", validation_json={"options": ["red", "blue", "green"]})
+    _create_field(client, schema_id, "note", "text", validation_json={"allow_null": True})
+
+    rows = [
+        ("One", {"priority": 1, "cost": "10.50", "due": "2026-01-05", "stage": "new", "tags": ["red"], "note": "a"}),
+        ("Two", {"priority": 5, "cost": "9.5", "due": "2026-02-10", "stage": "done", "tags": ["red", "blue"], "note": None}),
+        ("Three", {"priority": 3, "cost": "100", "due": "2026-03-15", "stage": "new", "tags": ["green"]}),
+    ]
+    for title, data in rows:
+        response = client.post(
+            "/entries",
+            json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": "public", "data_json": data},
+        )
+        assert response.status_code == 201
+
+    base = f"/entries?schema_id={schema_id}"
+    assert _titles(client.get(f"{base}&filter=stage:eq:new&sort=priority")) == ["One", "Three"]
+    assert _titles(client.get(f"{base}&filter=priority:in:1,5&sort=-priority")) == ["Two", "One"]
+    assert _titles(client.get(f"{base}&filter=priority:gte:3&filter=priority:lt:5")) == ["Three"]
+    assert _titles(client.get(f"{base}&filter=cost:gt:9.75&sort=cost")) == ["One", "Three"]
+    assert _titles(client.get(f"{base}&filter=cost:eq:9.50")) == ["Two"]
+    assert _titles(client.get(f"{base}&filter=due:gte:2026-02-01&sort=-due")) == ["Three", "Two"]
+    assert _titles(client.get(f"{base}&filter=tags:contains:red,blue")) == ["Two"]
+    assert _titles(client.get(f"{base}&filter=note:null&sort=title")) == ["Three", "Two"]
+    assert _titles(client.get(f"{base}&filter=note:notnull")) == ["One"]
+    assert _titles(client.get(f"{base}&sort=title")) == ["One", "Three", "Two"]
+
+    invalid_requests = [
+        f"{base}&filter=missing:eq:1",
+        f"{base}&filter=priority:eq:abc",
+        f"{base}&filter=priority:contains:1",
+        f"{base}&filter=stage:gt:new",
+        f"{base}&filter=stage:eq:unknown",
+        f"{base}&filter=priority:between:1",
+        f"{base}&sort=tags",
+        "/entries?filter=priority:eq:1",
+    ]
+    for url in invalid_requests:
+        response = client.get(url)
+        assert response.status_code == 422, url
+
+
+def test_impossible_dates_left_by_a_retyped_field_read_as_null(client):
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_filter_retyped_date",
+            "name": "Entry Filter Retyped Date",
+            "description": "Schema for retyped date field test",
+            "icon": "filter",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+    field_resp = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": "due", "label": "Due", "data_type": "text"},
+    )
+    assert field_resp.status_code == 201
+    field_id = field_resp.json()["id"]
+
+    for title, due in (("Valid", "2026-01-05"), ("Impossible", "2026-13-45")):
+        response = client.post(
+            "/entries",
+            json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": "public", "data_json": {"due": due}},
+        )
+        assert response.status_code == 201
+
+    retyped = client.patch(
+        f"/schemas/{schema_id}/fields/{field_id}",
+        json={"data_type": "date", "settings_json": {"promoted": True, "indexed": True}},
+    )
+    assert retyped.status_code == 200, retyped.json()
+
+    base = f"/entries?schema_id={schema_id}"
+    assert _titles(client.get(f"{base}&filter=due:gte:2026-01-01")) == ["Valid"]
+    assert _titles(client.get(f"{base}&sort=due")) == ["Valid", "Impossible"]
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT status FROM field_indexes WHERE field_id = %s;", (field_id,))
+        assert cur.fetchone()["status"] == "ready"
+        cur.execute("UPDATE entries SET data_json = data_json || '{\"note\": 1}' WHERE schema_id = %s;", (schema_id,))
+        assert cur.rowcount == 2
+        conn.commit()
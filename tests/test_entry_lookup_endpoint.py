@@ -73,3 +73,76 @@ def test_entry_lookup_returns_minimal_visible_entries_with_search_and_limit(clie
     filtered_payload = filtered_response.json()
     assert len(filtered_payload) == 3
     assert all(set(item.keys()) == {"id", "title", "schema_id", "schema_key", "schema_name"} for item in filtered_payload)
+
+
+def test_entry_lookup_ranks_prefix_matches_and_respects_visibility(client):
+    _ensure_test_actor()
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (1301, 'lookup_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "lookup_ranking_case",
+            "name": "Quokka Registry",
+            "description": "Schema for entry lookup ranking test",
+            "icon": "search",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    ids = {}
+    for title, visibility in (
+        ("Zebra Crossing", "internal"),
+        ("Crossbow Notes", "internal"),
+        ("Hidden Crossroads", "private"),
+        ("Field 50% Done", "internal"),
+    ):
+        create_resp = client.post(
+            "/entries",
+            json={
+                "schema_id": schema_id,
+                "title": title,
+                "status": "open",
+                "visibility_level": visibility,
+                "data_json": {},
+            },
+        )
+        assert create_resp.status_code == 201
+        ids[title] = create_resp.json()["id"]
+
+    admin_headers = _auth_headers()
+    reader_headers = {"Authorization": f"Bearer {create_access_token({'id': 1301, 'role': 'reader'})}"}
+
+    prefix = client.get(f"/entries/lookup?q=cross&schema_id={schema_id}", headers=admin_headers).json()
+    assert {item["title"] for item in prefix} == {"Zebra Crossing", "Crossbow Notes", "Hidden Crossroads"}
+
+    reader = client.get(f"/entries/lookup?q=cross&schema_id={schema_id}", headers=reader_headers).json()
+    assert {item["title"] for item in reader} == {"Zebra Crossing", "Crossbow Notes"}
+
+    infix = client.get(f"/entries/lookup?q=ebra&schema_id={schema_id}", headers=admin_headers).json()
+    assert [item["id"] for item in infix] == [ids["Zebra Crossing"]]
+
+    literal = client.get(f"/entries/lookup?q=50%25&schema_id={schema_id}", headers=admin_headers).json()
+    assert [item["id"] for item in literal] == [ids["Field 50% Done"]]
+
+    by_schema_name = client.get("/entries/lookup?q=quokka&limit=100", headers=reader_headers).json()
+    assert {item["id"] for item in by_schema_name} == {
+        ids["Zebra Crossing"],
+        ids["Crossbow Notes"],
+        ids["Field 50% Done"],
+    }
+
+    assert client.patch(f"/schemas/{schema_id}", json={"name": "Wombat Registry"}).status_code == 200
+    renamed = client.get("/entries/lookup?q=wombat&limit=100", headers=admin_headers).json()
+    assert len([item for item in renamed if item["schema_id"] == schema_id]) == 4
+    assert all(item["schema_name"] == "Wombat Registry" for item in renamed if item["schema_id"] == schema_id)
@@ -0,0 +1,224 @@
+import json
+
+import pytest
+
+from api.app.db import get_connection
+from api.app.repositories.metadata import OutboxRepository
+from api.app.services import outbox
+from api.app.services.outbox import FileOutboxSink, OutboxDispatcher, build_outbox_sink, parse_outbox_capture
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _outbox_rows() -> list:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT id, event_type, entry_id, attempts, failed_at, last_error FROM entry_outbox ORDER BY id;")
+        return cur.fetchall()
+
+
+def _make_available() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("UPDATE entry_outbox SET available_at = NOW();")
+        conn.commit()
+
+
+@pytest.fixture
+def outbox_enabled(client):
+    OutboxRepository().set_enabled(True)
+    yield
+    OutboxRepository().set_enabled(False)
+
+
+class RecordingSink:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batches = []
+
+    def send(self, events):
+        if self.fail:
+            raise ConnectionError("sink unavailable")
+        self.batches.append(events)
+
+
+def test_entry_writes_are_delivered_through_the_outbox(client, outbox_enabled, tmp_path):
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_outbox_case",
+            "name": "Entry Outbox Case",
+            "description": "Schema for outbox delivery test",
+            "icon": "send",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM entry_outbox;")
+        conn.commit()
+
+    created = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": "Outbound", "status": "open", "visibility_level": "public", "data_json": {}},
+    )
+    assert created.status_code == 201
+    entry_id = created.json()["id"]
+    assert client.patch(f"/entries/{entry_id}", json={"status": "done"}).status_code == 200
+    grant = client.post(f"/entries/{entry_id}/permissions", json={"subject_type": "role", "subject_id": "reader", "permission": "edit"})
+    assert grant.status_code == 201
+    assert client.patch(f"/entries/{entry_id}", json={"deleted_at": "2026-01-01T00:00:00Z"}).status_code == 200
+    assert [(row["event_type"], row["entry_id"]) for row in _outbox_rows()] == [
+        ("entry.created", entry_id),
+        ("entry.updated", entry_id),
+        ("entry.deleted", entry_id),
+    ]
+
+    failing = OutboxDispatcher(RecordingSink(fail=True), batch_size=2, max_attempts=2, retry_delay_seconds=60)
+    with pytest.raises(ConnectionError):
+        failing.dispatch_once()
+    rows = _outbox_rows()
+    assert [row["attempts"] for row in rows] == [1, 1, 0]
+    assert "sink unavailable" in rows[0]["last_error"]
+
+    sink = RecordingSink()
+    dispatcher = OutboxDispatcher(sink, batch_size=2)
+    assert dispatcher.dispatch_once() == 0
+    assert sink.batches == []
+
+    _make_available()
+    with pytest.raises(ConnectionError):
+        failing.dispatch_once()
+    assert [row["failed_at"] is not None for row in _outbox_rows()] == [True, True, False]
+    assert dispatcher.dispatch_once() == 1
+    assert [event["type"] for event in sink.batches[0]] == ["entry.deleted"]
+    assert sink.batches[0][0]["entry"]["status"] == "done"
+    assert dispatcher.dispatch_once() == 0
+
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("UPDATE entry_outbox SET failed_at = NULL, available_at = NOW();")
+        conn.commit()
+    path = tmp_path / "outbox.jsonl"
+    assert isinstance(build_outbox_sink(f"file:{path}"), FileOutboxSink)
+    assert OutboxDispatcher(build_outbox_sink(f"file:{path}")).dispatch_once() == 2
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(line["type"], line["entry"]["title"]) for line in lines] == [
+        ("entry.created", "Outbound"),
+        ("entry.updated", "Outbound"),
+    ]
+    assert _outbox_rows() == []
+
+
+def test_concurrent_dispatchers_skip_locked_rows(client, outbox_enabled):
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_outbox_concurrency",
+            "name": "Entry Outbox Concurrency",
+            "description": "Schema for concurrent outbox dispatch test",
+            "icon": "send",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM entry_outbox;")
+        conn.commit()
+    for title in ("First", "Second"):
+        response = client.post(
+            "/entries",
+            json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": "public", "data_json": {}},
+        )
+        assert response.status_code == 201
+
+    other_sink = RecordingSink()
+    other = OutboxDispatcher(other_sink, batch_size=10)
+
+    class NestedSink(RecordingSink):
+        def send(self, events):
+            assert other.dispatch_once() == 1
+            super().send(events)
+
+    sink = NestedSink()
+    assert OutboxDispatcher(sink, batch_size=1).dispatch_once() == 1
+    assert [event["entry"]["title"] for event in sink.batches[0]] == ["First"]
+    assert [event["entry"]["title"] for event in other_sink.batches[0]] == ["Second"]
+    assert _outbox_rows() == []
+
+    entry_id = other_sink.batches[0][0]["entry_id"]
+    for status in ("done", "archived"):
+        assert client.patch(f"/entries/{entry_id}", json={"status": status}).status_code == 200
+
+    class BlockedSink(RecordingSink):
+        def send(self, events):
+            assert OutboxDispatcher(RecordingSink(), batch_size=10).dispatch_once() == 0
+            super().send(events)
+
+    blocked = BlockedSink()
+    assert OutboxDispatcher(blocked, batch_size=1).dispatch_once() == 1
+    assert [event["entry"]["status"] for event in blocked.batches[0]] == ["done"]
+    assert [row["event_type"] for row in _outbox_rows()] == ["entry.updated"]
+
+
+def test_outbox_capture_is_off_unless_configured(client, monkeypatch):
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_outbox_disabled",
+            "name": "Entry Outbox Disabled",
+            "description": "Schema for disabled outbox test",
+            "icon": "send",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT enabled FROM entry_outbox_settings;")
+        assert cur.fetchone()["enabled"] is False
+        cur.execute("DELETE FROM entry_outbox;")
+        conn.commit()
+    created = client.post(
+        "/entries",
+        json={"schema_id": schema_resp.json()["id"], "title": "Quiet", "status": "open", "visibility_level": "public", "data_json": {}},
+    )
+    assert created.status_code == 201
+    assert client.patch(f"/entries/{created.json()['id']}", json={"status": "done"}).status_code == 200
+    assert _outbox_rows() == []
+
+    monkeypatch.setattr(outbox, "OUTBOX_SINK", "")
+    monkeypatch.setattr(outbox, "OUTBOX_CAPTURE", "")
+    OutboxRepository().set_enabled(True)
+    try:
+        outbox.start_outbox_dispatcher()
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT enabled FROM entry_outbox_settings;")
+            assert cur.fetchone()["enabled"] is True
+        monkeypatch.setattr(outbox, "OUTBOX_CAPTURE", "off")
+        outbox.start_outbox_dispatcher()
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT enabled FROM entry_outbox_settings;")
+            assert cur.fetchone()["enabled"] is False
+    finally:
+        OutboxRepository().set_enabled(False)
+
+
+def test_unknown_outbox_sink_is_rejected():
+    assert build_outbox_sink("") is None
+    with pytest.raises(ValueError):
+        build_outbox_sink("ftp://example.invalid")
+    assert [parse_outbox_capture(value) for value in ("", "on", "off")] == [None, True, False]
+    with pytest.raises(ValueError):
+        parse_outbox_capture("yes")
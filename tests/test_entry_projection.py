@@ -0,0 +1,94 @@
+from api.app.db import get_connection
+from api.app.security import create_access_token
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def test_fields_parameter_projects_columns_and_data_keys(client):
+    _ensure_test_actor()
+    admin_headers = {"Authorization": f"Bearer {create_access_token({'id': 999, 'role': 'head_admin'})}"}
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_projection_case",
+            "name": "Entry Projection Case",
+            "description": "Schema for sparse fieldset test",
+            "icon": "columns",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    for key, data_type in (("score", "integer"), ("body", "long_text"), ("title", "text")):
+        response = client.post(
+            f"/schemas/{schema_id}/fields",
+            json={"key": key, "label": key.title(), "data_type": data_type},
+        )
+        assert response.status_code == 201
+
+    entry_ids = {}
+    for title, visibility in (("Visible", "public"), ("Hidden", "private")):
+        response = client.post(
+            "/entries",
+            json={
+                "schema_id": schema_id,
+                "title": title,
+                "status": "open",
+                "visibility_level": visibility,
+                "data_json": {"score": 3, "body": "x" * 500, "title": f"data {title}"},
+            },
+        )
+        assert response.status_code == 201
+        entry_ids[title] = response.json()["id"]
+
+    base = f"/entries?schema_id={schema_id}"
+    projected = client.get(f"{base}&fields=title,score&fields=status")
+    assert projected.status_code == 200
+    assert projected.json() == [{"id": entry_ids["Visible"], "title": "Visible", "status": "open", "data_json": {"score": 3}}]
+
+    explicit = client.get(f"{base}&fields=data_json.title", headers=admin_headers).json()
+    assert {item["id"]: item["data_json"] for item in explicit} == {
+        entry_ids["Visible"]: {"title": "data Visible"},
+        entry_ids["Hidden"]: {"title": "data Hidden"},
+    }
+    assert all(set(item) == {"id", "data_json"} for item in explicit)
+
+    counts = client.get(f"{base}&fields=relation_counts,data_json").json()
+    assert set(counts[0]) == {"id", "relation_counts", "data_json"}
+    assert counts[0]["data_json"]["body"] == "x" * 500
+
+    full = client.get(base).json()
+    assert "visibility_level" in full[0] and "body" in full[0]["data_json"]
+    assert "relation_counts" not in full[0]
+
+    schema_entries = client.get(f"/schemas/{schema_id}/entries?fields=score", headers=admin_headers).json()["entries"]
+    assert [set(item) for item in schema_entries] == [{"id", "data_json", "access"}] * 2
+    assert schema_entries[0]["access"]["read"] is True
+
+    lookup = client.get(f"/entries/lookup?schema_id={schema_id}&fields=score").json()
+    assert lookup == [
+        {
+            "id": entry_ids["Visible"],
+            "title": "Visible",
+            "schema_id": schema_id,
+            "schema_key": "entry_projection_case",
+            "schema_name": "Entry Projection Case",
+            "data_json": {"score": 3},
+        }
+    ]
+
+    assert client.get(f"{base}&fields=missing").status_code == 422
+    assert client.get(f"/schemas/{schema_id}/entries?fields=missing").status_code == 422
+    assert client.get(f"/entries/lookup?schema_id={schema_id}&fields=status").status_code == 422
+    assert client.get("/entries?fields=Bad-Key").status_code == 422
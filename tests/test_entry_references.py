@@ -0,0 +1,109 @@
+from api.app.db import get_connection
+from api.app.security import create_access_token
+
+
+def _ensure_users() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES
+                (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb),
+                (1501, 'references_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _create_field(client, schema_id: int, key: str, data_type: str, settings_json: dict) -> None:
+    response = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={
+            "key": key,
+            "label": key.title(),
+            "description": None,
+            "data_type": data_type,
+            "is_required": False,
+            "is_unique": False,
+            "default_value": None,
+            "sort_order": 10,
+            "is_active": True,
+            "validation_json": {"allow_null": True},
+            "settings_json": settings_json,
+        },
+    )
+    assert response.status_code == 201
+
+
+def _create_entry(client, schema_id: int, title: str, data_json: dict, visibility_level: str = "internal"):
+    return client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": visibility_level, "data_json": data_json},
+    )
+
+
+def test_entry_references_are_indexed_validated_and_listed(client):
+    _ensure_users()
+    admin_headers = {"Authorization": f"Bearer {create_access_token({'id': 999, 'role': 'head_admin'})}"}
+    reader_headers = {"Authorization": f"Bearer {create_access_token({'id': 1501, 'role': 'reader'})}"}
+
+    schema_resp = client.post(
+        "/schemas",
+        json={"key": "entry_references_case", "name": "Entry References Case", "description": None, "icon": "link", "is_active": True},
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+    _create_field(client, schema_id, "manager", "reference", {})
+    _create_field(client, schema_id, "peers", "reference", {"multiple": True})
+    _create_field(client, schema_id, "contract", "file", {})
+
+    target_id = _create_entry(client, schema_id, "Target", {}).json()["id"]
+    other_id = _create_entry(client, schema_id, "Other", {}).json()["id"]
+
+    missing = _create_entry(client, schema_id, "Broken", {"manager": 987654321, "peers": [target_id, 987654322]})
+    assert missing.status_code == 422
+    assert {error["field"] for error in missing.json()["detail"]} == {"manager", "peers"}
+    missing_file = _create_entry(client, schema_id, "Broken File", {"contract": 987654323})
+    assert missing_file.status_code == 422
+
+    first = _create_entry(client, schema_id, "Alpha", {"manager": target_id, "peers": [other_id]})
+    assert first.status_code == 201
+    first_id = first.json()["id"]
+    second = _create_entry(client, schema_id, "Beta", {"peers": [target_id, other_id]})
+    assert second.status_code == 201
+    second_id = second.json()["id"]
+    hidden = _create_entry(client, schema_id, "Hidden", {"manager": target_id}, visibility_level="private")
+    assert hidden.status_code == 201
+    hidden_id = hidden.json()["id"]
+
+    incoming = client.get(f"/entries/{target_id}/references/incoming", headers=admin_headers)
+    assert incoming.status_code == 200
+    assert [(row["id"], row["field_key"]) for row in incoming.json()] == [
+        (first_id, "manager"),
+        (second_id, "peers"),
+        (hidden_id, "manager"),
+    ]
+
+    reader_incoming = client.get(f"/entries/{target_id}/references/incoming", headers=reader_headers).json()
+    assert [row["id"] for row in reader_incoming] == [first_id, second_id]
+
+    assert client.patch(f"/entries/{first_id}", json={"data_json": {"manager": other_id}}).status_code == 200
+    assert client.patch(f"/entries/{first_id}", json={"data_json": {"peers": [987654324]}}).status_code == 422
+    assert [row["id"] for row in client.get(f"/entries/{target_id}/references/incoming", headers=admin_headers).json()] == [
+        second_id,
+        hidden_id,
+    ]
+    other_incoming = client.get(f"/entries/{other_id}/references/incoming", headers=admin_headers).json()
+    assert sorted((row["id"], row["field_key"]) for row in other_incoming) == sorted(
+        [(first_id, "manager"), (first_id, "peers"), (second_id, "peers")]
+    )
+
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT source_entry_id, field_key, target_type, target_id FROM entry_references ORDER BY 1, 2, 4;")
+        maintained = cur.fetchall()
+        cur.execute("SELECT rebuild_entry_references();")
+        cur.execute("SELECT source_entry_id, field_key, target_type, target_id FROM entry_references ORDER BY 1, 2, 4;")
+        rebuilt = cur.fetchall()
+        conn.commit()
+    assert maintained == rebuilt
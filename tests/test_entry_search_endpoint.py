@@ -0,0 +1,120 @@
+from api.app.db import get_connection
+from api.app.security import create_access_token
+
+
+def _ensure_users() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES
+                (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb),
+                (1401, 'search_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET
+                username = EXCLUDED.username,
+                role = EXCLUDED.role,
+                is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _headers(user_id: int, role: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token({'id': user_id, 'role': role})}"}
+
+
+def _create_entry(client, schema_id: int, title: str, data_json: dict, visibility_level: str = "internal") -> int:
+    response = client.post(
+        "/entries",
+        json={
+            "schema_id": schema_id,
+            "title": title,
+            "status": "open",
+            "visibility_level": visibility_level,
+            "data_json": data_json,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_entry_search_uses_searchable_fields_with_weights_and_pagination(client):
+    _ensure_users()
+    admin_headers = _headers(999, "head_admin")
+
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "entry_search_case",
+            "name": "Entry Search Case",
+            "description": "Schema for entry search test",
+            "icon": "search",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    fields = {}
+    for key, data_type, settings in (
+        ("summary", "text", {"searchable": True, "search_weight": "B"}),
+        ("notes", "long_text", {}),
+        ("code", "integer", {}),
+    ):
+        response = client.post(
+            f"/schemas/{schema_id}/fields",
+            json={"key": key, "label": key.title(), "data_type": data_type, "settings_json": settings},
+        )
+        assert response.status_code == 201
+        fields[key] = response.json()["id"]
+
+    invalid = client.patch(f"/schemas/{schema_id}/fields/{fields['code']}", json={"settings_json": {"searchable": True}})
+    assert invalid.status_code == 422
+    invalid_weight = client.patch(
+        f"/schemas/{schema_id}/fields/{fields['notes']}",
+        json={"settings_json": {"searchable": True, "search_weight": "Z"}},
+    )
+    assert invalid_weight.status_code == 422
+
+    body_match = _create_entry(client, schema_id, "Quarterly Report", {"summary": "Harbour crane inspection", "notes": "lighthouse"})
+    title_match = _create_entry(client, schema_id, "Harbour Overview", {"summary": "General notes"})
+    hidden = _create_entry(client, schema_id, "Private Harbour", {"summary": "harbour"}, visibility_level="private")
+
+    response = client.get(f"/entries/search?q=harb&schema_id={schema_id}", headers=admin_headers)
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["total"] == 3
+    assert payload["limit"] == 20 and payload["offset"] == 0
+    ids = [item["id"] for item in payload["items"]]
+    assert ids.index(title_match) < ids.index(body_match)
+    body_hit = next(item for item in payload["items"] if item["id"] == body_match)
+    assert "<mark>Harbour</mark>" in body_hit["headline"]
+    assert body_hit["schema_key"] == "entry_search_case"
+    assert body_hit["rank"] > 0
+
+    page = client.get(f"/entries/search?q=harb&schema_id={schema_id}&limit=1&offset=1", headers=admin_headers).json()
+    assert page["total"] == 3
+    assert [item["id"] for item in page["items"]] == [ids[1]]
+
+    reader = client.get(f"/entries/search?q=harb&schema_id={schema_id}", headers=_headers(1401, "reader")).json()
+    assert reader["total"] == 2
+    assert hidden not in {item["id"] for item in reader["items"]}
+
+    assert client.get(f"/entries/search?q=lighthouse&schema_id={schema_id}", headers=admin_headers).json()["total"] == 0
+
+    enable = client.patch(
+        f"/schemas/{schema_id}/fields/{fields['notes']}",
+        json={"settings_json": {"searchable": True, "search_weight": "C"}},
+    )
+    assert enable.status_code == 200
+    reindexed = client.get(f"/entries/search?q=lighthouse&schema_id={schema_id}", headers=admin_headers).json()
+    assert [item["id"] for item in reindexed["items"]] == [body_match]
+
+    assert client.patch(f"/entries/{body_match}", json={"data_json": {"notes": "beacon"}}).status_code == 200
+    assert client.get(f"/entries/search?q=lighthouse&schema_id={schema_id}", headers=admin_headers).json()["total"] == 0
+    assert client.get(f"/entries/search?q=beacon&schema_id={schema_id}", headers=admin_headers).json()["total"] == 1
+
+    assert client.delete(f"/schemas/{schema_id}/fields/{fields['notes']}").status_code == 200
+    assert client.get(f"/entries/search?q=beacon&schema_id={schema_id}", headers=admin_headers).json()["total"] == 0
+
+    assert client.get("/entries/search?q=%20", headers=admin_headers).status_code == 422
@@ -0,0 +1,173 @@
+from api.app.db import get_connection
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _index_definition(index_name: str):
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT pg_get_indexdef(c.oid) AS definition, i.indisvalid
+            FROM pg_class c
+            JOIN pg_index i ON i.indexrelid = c.oid
+            WHERE c.relname = %s;
+            """,
+            (index_name,),
+        )
+        return cur.fetchone()
+
+
+def test_indexed_fields_get_partial_expression_indexes(client):
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "field_index_case",
+            "name": "Field Index Case",
+            "description": "Schema for field index test",
+            "icon": "database",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+    assert schema_resp.json()["field_indexes"] == []
+
+    field_resp = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": "priority", "label": "Priority", "data_type": "integer", "settings_json": {"indexed": True}},
+    )
+    assert field_resp.status_code == 201
+    field_id = field_resp.json()["id"]
+    index_name = f"idx_entries_field_{field_id}"
+
+    schema = client.get(f"/schemas/{schema_id}").json()
+    assert schema["field_indexes"] == [
+        {
+            "field_id": field_id,
+            "index_name": index_name,
+            "status": "ready",
+            "error": None,
+            "updated_at": schema["field_indexes"][0]["updated_at"],
+        }
+    ]
+    index = _index_definition(index_name)
+    assert index["indisvalid"] is True
+    assert "entry_data_numeric(data_json, 'priority'::text)" in index["definition"]
+    assert f"schema_id = {schema_id}" in index["definition"]
+
+    renamed = client.patch(
+        f"/schemas/{schema_id}/fields/{field_id}", json={"key": "rank", "data_type": "text", "validation_json": {"max_length": 64}}
+    )
+    assert renamed.status_code == 200
+    assert "(data_json ->> 'rank'::text)" in _index_definition(index_name)["definition"]
+
+    invalid = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": "tags", "label": "Tags", "data_type": "multi_select", "settings_json": {"indexed": True}},
+    )
+    assert invalid.status_code == 422
+
+    disabled = client.patch(f"/schemas/{schema_id}/fields/{field_id}", json={"settings_json": {"indexed": False}})
+    assert disabled.status_code == 200
+    assert _index_definition(index_name) is None
+    assert client.get(f"/schemas/{schema_id}").json()["field_indexes"] == []
+
+    assert client.patch(f"/schemas/{schema_id}/fields/{field_id}", json={"settings_json": {"indexed": True}}).status_code == 200
+    assert _index_definition(index_name) is not None
+    assert client.delete(f"/schemas/{schema_id}/fields/{field_id}").status_code == 200
+    assert _index_definition(index_name) is None
+
+    second = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": "due", "label": "Due", "data_type": "date", "settings_json": {"indexed": True}},
+    )
+    assert second.status_code == 201
+    second_index = f"idx_entries_field_{second.json()['id']}"
+    assert "entry_data_timestamp(data_json, 'due'::text)" in _index_definition(second_index)["definition"]
+    assert client.delete(f"/schemas/{schema_id}").status_code == 200
+    assert _index_definition(second_index) is None
+
+
+def test_indexed_text_fields_need_a_bounded_length(client):
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "field_index_text_case",
+            "name": "Field Index Text Case",
+            "description": "Schema for indexed text limits",
+            "icon": "database",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    unbounded = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": "code", "label": "Code", "data_type": "text", "settings_json": {"indexed": True}},
+    )
+    assert unbounded.status_code == 422
+    too_wide = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={
+            "key": "code",
+            "label": "Code",
+            "data_type": "text",
+            "validation_json": {"max_length": 5000},
+            "settings_json": {"indexed": True},
+        },
+    )
+    assert too_wide.status_code == 422
+
+    field_resp = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": "code", "label": "Code", "data_type": "text", "validation_json": {"max_length": 64, "allow_null": True}},
+    )
+    assert field_resp.status_code == 201
+    field_id = field_resp.json()["id"]
+
+    def create(title, code):
+        return client.post(
+            "/entries",
+            json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": "public", "data_json": {"code": code}},
+        )
+
+    assert create("Long", "x" * 3000).status_code == 422
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            "UPDATE entries SET data_json = jsonb_set(data_json, '{code}', to_jsonb(repeat('x', 3000))) WHERE id = %s;",
+            (create("Legacy", "short").json()["id"],),
+        )
+        conn.commit()
+    legacy = client.patch(f"/schemas/{schema_id}/fields/{field_id}", json={"settings_json": {"indexed": True}})
+    assert legacy.status_code == 422
+    assert _index_definition(f"idx_entries_field_{field_id}") is None
+
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM entries WHERE schema_id = %s;", (schema_id,))
+        conn.commit()
+    assert client.patch(f"/schemas/{schema_id}/fields/{field_id}", json={"settings_json": {"indexed": True}}).status_code == 200
+    assert _index_definition(f"idx_entries_field_{field_id}")["indisvalid"] is True
+    assert create("Long", "x" * 3000).status_code == 422
+    for title in ("A", "B", "C"):
+        assert create(title, None if title == "B" else title.lower()).status_code == 201
+
+    def titles(sort):
+        response = client.get(f"/entries?schema_id={schema_id}&sort={sort}")
+        assert response.status_code == 200
+        return [item["title"] for item in response.json()]
+
+    assert titles("code") == ["A", "C", "B"]
+    assert titles("-code") == ["B", "C", "A"]
+    assert client.delete(f"/schemas/{schema_id}").status_code == 200
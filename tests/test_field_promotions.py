@@ -0,0 +1,158 @@
+from api.app.db import get_connection
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _promoted_values(field_id: int) -> dict:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT entry_id, value_numeric, value_timestamp, value_text, value_boolean
+            FROM entry_field_values
+            WHERE field_id = %s;
+            """,
+            (field_id,),
+        )
+        return {row.pop("entry_id"): row for row in cur.fetchall()}
+
+
+def _titles(response) -> list[str]:
+    assert response.status_code == 200, response.json()
+    return [item["title"] for item in response.json()]
+
+
+def test_promoted_fields_are_backfilled_maintained_and_queried(client):
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "field_promotion_case",
+            "name": "Field Promotion Case",
+            "description": "Schema for field promotion test",
+            "icon": "database",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    field_ids = {}
+    for key, data_type in (("score", "decimal"), ("due", "date"), ("label", "text"), ("flag", "boolean")):
+        response = client.post(
+            f"/schemas/{schema_id}/fields",
+            json={
+                "key": key,
+                "label": key.title(),
+                "data_type": data_type,
+                "validation_json": {"allow_null": True, "max_length": 64} if data_type == "text" else {"allow_null": True},
+            },
+        )
+        assert response.status_code == 201
+        field_ids[key] = response.json()["id"]
+
+    entry_ids = {}
+    for title, data in (
+        ("Low", {"score": "1.5", "due": "2026-03-01", "label": "b", "flag": True}),
+        ("High", {"score": "20", "due": "2026-01-01", "label": "a", "flag": False}),
+        ("Empty", {"score": None}),
+    ):
+        response = client.post(
+            "/entries",
+            json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": "public", "data_json": data},
+        )
+        assert response.status_code == 201
+        entry_ids[title] = response.json()["id"]
+
+    for key in field_ids:
+        response = client.patch(f"/schemas/{schema_id}/fields/{field_ids[key]}", json={"settings_json": {"promoted": True}})
+        assert response.status_code == 200
+
+    promotions = client.get(f"/schemas/{schema_id}").json()["field_promotions"]
+    assert {row["field_id"]: row["status"] for row in promotions} == {field_id: "ready" for field_id in field_ids.values()}
+
+    scores = _promoted_values(field_ids["score"])
+    assert set(scores) == {entry_ids["Low"], entry_ids["High"]}
+    assert float(scores[entry_ids["High"]]["value_numeric"]) == 20.0
+
+    base = f"/entries?schema_id={schema_id}"
+    assert _titles(client.get(f"{base}&filter=score:gt:2")) == ["High"]
+    assert _titles(client.get(f"{base}&filter=score:eq:1.50")) == ["Low"]
+    assert _titles(client.get(f"{base}&filter=score:null")) == ["Empty"]
+    assert _titles(client.get(f"{base}&filter=due:lt:2026-02-01")) == ["High"]
+    assert _titles(client.get(f"{base}&filter=due:eq:2026-03-01")) == ["Low"]
+    assert _titles(client.get(f"{base}&filter=label:in:a,c")) == ["High"]
+    assert _titles(client.get(f"{base}&filter=flag:eq:true")) == ["Low"]
+    assert _titles(client.get(f"{base}&sort=-score")) == ["Empty", "High", "Low"]
+    assert _titles(client.get(f"{base}&sort=due")) == ["High", "Low", "Empty"]
+
+    assert client.patch(f"/entries/{entry_ids['Empty']}", json={"data_json": {"score": "5"}}).status_code == 200
+    assert float(_promoted_values(field_ids["score"])[entry_ids["Empty"]]["value_numeric"]) == 5.0
+    assert _titles(client.get(f"{base}&filter=score:gte:5&sort=score")) == ["Empty", "High"]
+
+    renamed = client.patch(f"/schemas/{schema_id}/fields/{field_ids['label']}", json={"key": "name"})
+    assert renamed.status_code == 200
+    assert _promoted_values(field_ids["label"]) == {}
+    assert _titles(client.get(f"{base}&filter=name:notnull")) == []
+
+    invalid = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": "blob", "label": "Blob", "data_type": "json", "settings_json": {"promoted": True}},
+    )
+    assert invalid.status_code == 422
+
+    demoted = client.patch(f"/schemas/{schema_id}/fields/{field_ids['score']}", json={"settings_json": {}})
+    assert demoted.status_code == 200
+    assert _promoted_values(field_ids["score"]) == {}
+    assert _titles(client.get(f"{base}&filter=score:gt:2&sort=score")) == ["Empty", "High"]
+
+
+def test_promoted_text_fields_need_a_bounded_length(client):
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "field_promotion_text_case",
+            "name": "Field Promotion Text Case",
+            "description": "Schema for promoted text limits",
+            "icon": "database",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    unbounded = client.post(
+        f"/schemas/{schema_id}/fields",
+        json={"key": "note", "label": "Note", "data_type": "text", "settings_json": {"promoted": True}},
+    )
+    assert unbounded.status_code == 422
+
+    field_resp = client.post(f"/schemas/{schema_id}/fields", json={"key": "note", "label": "Note", "data_type": "text"})
+    assert field_resp.status_code == 201
+    field_id = field_resp.json()["id"]
+    entry = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": "Long", "status": "open", "visibility_level": "public", "data_json": {"note": "x" * 4000}},
+    )
+    assert entry.status_code == 201
+
+    bounded = {"validation_json": {"max_length": 128}, "settings_json": {"promoted": True}}
+    assert client.patch(f"/schemas/{schema_id}/fields/{field_id}", json=bounded).status_code == 422
+    assert _promoted_values(field_id) == {}
+
+    assert client.patch(f"/entries/{entry.json()['id']}", json={"data_json": {"note": "short"}}).status_code == 200
+    assert client.patch(f"/schemas/{schema_id}/fields/{field_id}", json=bounded).status_code == 200
+    assert _promoted_values(field_id)[entry.json()["id"]]["value_text"] == "short"
+    long_write = client.patch(f"/entries/{entry.json()['id']}", json={"data_json": {"note": "x" * 4000}})
+    assert long_write.status_code == 422
+    assert client.delete(f"/schemas/{schema_id}").status_code == 200
@@ -0,0 +1,85 @@
+from api.app.db import get_connection
+from api.app.security import create_access_token
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _create_entry(client, schema_id: int, title: str) -> int:
+    response = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": "internal", "data_json": {}},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_bulk_relation_endpoint_appends_and_replaces_in_one_transaction(client):
+    _ensure_test_actor()
+    auth_headers = {"Authorization": f"Bearer {create_access_token({'id': 999, 'role': 'head_admin'})}"}
+    schema_resp = client.post(
+        "/schemas",
+        json={"key": "relation_bulk_case", "name": "Relation Bulk Case", "description": None, "icon": "link", "is_active": True},
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+    hub_id = _create_entry(client, schema_id, "Hub")
+    first_id = _create_entry(client, schema_id, "First")
+    second_id = _create_entry(client, schema_id, "Second")
+    third_id = _create_entry(client, schema_id, "Third")
+
+    appended = client.post(
+        f"/entries/{hub_id}/relations/bulk",
+        json={
+            "relations": [
+                {"to_entry_id": first_id, "sort_order": 1},
+                {"to_entry_id": second_id, "sort_order": 2, "metadata_json": {"weight": 1}},
+            ]
+        },
+    )
+    assert appended.status_code == 200
+    appended_rows = appended.json()
+    assert [row["to_entry_id"] for row in appended_rows] == [first_id, second_id]
+    second_relation_id = appended_rows[1]["id"]
+
+    replaced = client.post(
+        f"/entries/{hub_id}/relations/bulk",
+        json={
+            "mode": "replace",
+            "relations": [
+                {"to_entry_id": third_id, "sort_order": 1},
+                {"to_entry_id": second_id, "sort_order": 5, "metadata_json": {"weight": 2}},
+            ],
+        },
+    )
+    assert replaced.status_code == 200
+    rows = replaced.json()
+    assert [(row["to_entry_id"], row["sort_order"]) for row in rows] == [(third_id, 1), (second_id, 5)]
+    assert rows[1]["id"] == second_relation_id
+    assert rows[1]["metadata_json"] == {"weight": 2}
+    assert client.get(f"/entries/{first_id}/relations", headers=auth_headers).json() == []
+
+    missing = client.post(
+        f"/entries/{hub_id}/relations/bulk",
+        json={"mode": "replace", "relations": [{"to_entry_id": first_id}, {"to_entry_id": 987654321}]},
+    )
+    assert missing.status_code == 404
+    assert [row["id"] for row in client.get(f"/entries/{hub_id}/relations", headers=auth_headers).json()] == [row["id"] for row in rows]
+
+    self_relation = client.post(f"/entries/{hub_id}/relations/bulk", json={"relations": [{"to_entry_id": hub_id}]})
+    assert self_relation.status_code == 422
+
+    duplicate = client.post(
+        f"/entries/{hub_id}/relations/bulk",
+        json={"mode": "replace", "relations": [{"to_entry_id": first_id}, {"to_entry_id": first_id}]},
+    )
+    assert duplicate.status_code == 422
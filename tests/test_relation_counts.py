@@ -0,0 +1,85 @@
+from api.app.db import get_connection
+from api.app.security import create_access_token
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _create_entry(client, schema_id: int, title: str) -> int:
+    response = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": "internal", "data_json": {}},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_relation(client, from_entry_id: int, to_entry_id: int, relation_type: str) -> int:
+    response = client.post(
+        f"/entries/{from_entry_id}/relations",
+        json={"to_entry_id": to_entry_id, "relation_type": relation_type, "sort_order": 0, "metadata_json": {}},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _snapshot() -> list:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT * FROM entry_relation_counts WHERE total > 0 ORDER BY entry_id;")
+        return cur.fetchall()
+
+
+def test_relation_counts_are_maintained_and_exposed(client):
+    _ensure_test_actor()
+    auth_headers = {"Authorization": f"Bearer {create_access_token({'id': 999, 'role': 'head_admin'})}"}
+    schema_resp = client.post(
+        "/schemas",
+        json={"key": "relation_counts_case", "name": "Relation Counts Case", "description": None, "icon": "hash", "is_active": True},
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    hub_id = _create_entry(client, schema_id, "Hub")
+    first_id = _create_entry(client, schema_id, "First")
+    second_id = _create_entry(client, schema_id, "Second")
+    doomed_id = _create_entry(client, schema_id, "Doomed")
+
+    first_relation_id = _create_relation(client, hub_id, first_id, "related_to")
+    _create_relation(client, hub_id, second_id, "related_to")
+    _create_relation(client, second_id, hub_id, "contains")
+    _create_relation(client, doomed_id, hub_id, "references")
+
+    assert client.patch(f"/entries/{hub_id}/relations/{first_relation_id}", json={"relation_type": "parent_of"}).status_code == 200
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM entries WHERE id=%s;", (doomed_id,))
+        conn.commit()
+
+    listing = client.get("/entries", params={"schema_id": schema_id, "fields": "relation_counts"}, headers=auth_headers)
+    assert listing.status_code == 200
+    counts = {row["id"]: row["relation_counts"] for row in listing.json()}
+    assert counts[hub_id] == {"total": 3, "outgoing": {"parent_of": 1, "related_to": 1}, "incoming": {"contains": 1}}
+    assert counts[first_id] == {"total": 1, "outgoing": {}, "incoming": {"parent_of": 1}}
+    assert counts[second_id]["total"] == 2
+    plain = client.get("/entries", params={"schema_id": schema_id}, headers=auth_headers).json()
+    assert all("relation_counts" not in row for row in plain)
+
+    bundle = client.get(f"/entries/{hub_id}/bundle", headers=auth_headers).json()
+    assert bundle["entry"]["relation_counts"] == counts[hub_id]
+    tree = client.get(f"/entries/{hub_id}/relation-tree", headers=auth_headers).json()["tree"]
+    assert tree["entry"]["relation_counts"] == counts[hub_id]
+    assert {child["entry"]["id"]: child["entry"]["relation_counts"]["total"] for child in tree["children"]}[first_id] == 1
+
+    maintained = _snapshot()
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT rebuild_entry_relation_counts();")
+        conn.commit()
+    assert _snapshot() == maintained
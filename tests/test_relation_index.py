@@ -0,0 +1,109 @@
+import time
+
+from api.app.db import get_connection
+from api.app.services.notifications import NotificationListener
+from api.app.services.relation_index import RELATION_INDEX_CHANNEL, RelationIndex
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO NOTHING;
+            """
+        )
+        conn.commit()
+
+
+def _create_schema(client, key: str) -> int:
+    _ensure_test_actor()
+    response = client.post(
+        "/schemas",
+        json={
+            "key": key,
+            "name": "Relation Index Case",
+            "description": "Schema for relation index test",
+            "icon": "share-2",
+            "is_active": True,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_entry(client, schema_id: int, title: str) -> int:
+    response = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": "internal", "data_json": {}},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_relation(client, from_entry_id: int, to_entry_id: int, sort_order: int) -> int:
+    response = client.post(
+        f"/entries/{from_entry_id}/relations",
+        json={"to_entry_id": to_entry_id, "relation_type": "related_to", "sort_order": sort_order, "metadata_json": {}},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_relation_index_loads_both_directions_and_applies_changes(client):
+    schema_id = _create_schema(client, "relation_index_case")
+    hub_id = _create_entry(client, schema_id, "Hub")
+    first_id = _create_entry(client, schema_id, "First")
+    second_id = _create_entry(client, schema_id, "Second")
+    second_relation_id = _create_relation(client, hub_id, second_id, 2)
+    first_relation_id = _create_relation(client, first_id, hub_id, 1)
+
+    index = RelationIndex()
+    assert index.neighbors(hub_id) is None
+    index.load()
+
+    assert [link["id"] for link in index.neighbors(hub_id)] == [first_relation_id, second_relation_id]
+    assert index.neighbors(first_id) == [
+        {"id": first_relation_id, "from_entry_id": first_id, "to_entry_id": hub_id, "relation_type": "related_to", "sort_order": 1}
+    ]
+
+    index.apply({"id": second_relation_id, "from_entry_id": hub_id, "to_entry_id": second_id, "relation_type": "depends_on", "sort_order": 0})
+    assert [link["id"] for link in index.neighbors(hub_id)] == [second_relation_id, first_relation_id]
+    assert index.neighbors(second_id)[0]["relation_type"] == "depends_on"
+
+    index.remove(first_relation_id)
+    assert index.neighbors(first_id) == []
+    assert [link["id"] for link in index.neighbors(hub_id)] == [second_relation_id]
+
+
+def test_relation_index_follows_database_notifications(client):
+    schema_id = _create_schema(client, "relation_index_notify")
+    left_id = _create_entry(client, schema_id, "Left")
+    right_id = _create_entry(client, schema_id, "Right")
+
+    index = RelationIndex()
+    listener = NotificationListener(reconnect_delay_seconds=0.1)
+    listener.subscribe(RELATION_INDEX_CHANNEL, index.handle_notification, on_connect=index.load)
+    listener.start()
+    try:
+        assert listener.wait_until_connected(5)
+        relation_id = _create_relation(client, left_id, right_id, 1)
+        assert _wait_for(lambda: [link["id"] for link in index.neighbors(right_id)] == [relation_id])
+
+        assert client.patch(f"/entries/{left_id}/relations/{relation_id}", json={"sort_order": 7}).status_code == 200
+        assert _wait_for(lambda: index.neighbors(left_id)[0]["sort_order"] == 7)
+
+        assert client.delete(f"/entries/{left_id}/relations/{relation_id}").status_code == 200
+        assert _wait_for(lambda: index.neighbors(left_id) == [] and index.neighbors(right_id) == [])
+    finally:
+        listener.stop()
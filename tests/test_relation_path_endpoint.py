@@ -0,0 +1,99 @@
+from api.app.db import get_connection
+from api.app.routers import entries as entries_router
+from api.app.security import create_access_token
+from api.app.services.relation_index import RelationIndex
+
+
+def _auth_headers(user_id: int, role: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token({'id': user_id, 'role': role})}"}
+
+
+def _ensure_users() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES
+                (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb),
+                (1401, 'relation_path_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET
+                username = EXCLUDED.username,
+                password_hash = EXCLUDED.password_hash,
+                role = EXCLUDED.role,
+                is_active = EXCLUDED.is_active,
+                preferences = EXCLUDED.preferences;
+            """
+        )
+        conn.commit()
+
+
+def _create_entry(client, schema_id: int, title: str, visibility_level: str = "internal") -> int:
+    response = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": visibility_level, "data_json": {}},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_relation(client, from_entry_id: int, to_entry_id: int, relation_type: str) -> None:
+    response = client.post(
+        f"/entries/{from_entry_id}/relations",
+        json={"to_entry_id": to_entry_id, "relation_type": relation_type, "sort_order": 0, "metadata_json": {}},
+    )
+    assert response.status_code == 201
+
+
+def test_relation_path_endpoint_finds_shortest_readable_path(client, monkeypatch):
+    _ensure_users()
+    admin_headers = _auth_headers(999, "head_admin")
+    reader_headers = _auth_headers(1401, "reader")
+    schema_resp = client.post(
+        "/schemas",
+        json={"key": "relation_path_case", "name": "Relation Path Case", "description": None, "icon": "route", "is_active": True},
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    a_id = _create_entry(client, schema_id, "A")
+    b_id = _create_entry(client, schema_id, "B")
+    c_id = _create_entry(client, schema_id, "C")
+    d_id = _create_entry(client, schema_id, "D")
+    p_id = _create_entry(client, schema_id, "P", visibility_level="private")
+    _create_relation(client, a_id, b_id, "related_to")
+    _create_relation(client, b_id, c_id, "related_to")
+    _create_relation(client, d_id, c_id, "related_to")
+    _create_relation(client, a_id, p_id, "contains")
+    _create_relation(client, p_id, d_id, "contains")
+
+    admin_path = client.get(f"/entries/{a_id}/path-to/{d_id}", headers=admin_headers).json()
+    assert admin_path["found"] is True
+    assert admin_path["hops"] == 2
+    assert [entry["id"] for entry in admin_path["entries"]] == [a_id, p_id, d_id]
+
+    filtered = client.get(f"/entries/{a_id}/path-to/{d_id}", params={"relation_type": "related_to"}, headers=admin_headers).json()
+    assert [entry["id"] for entry in filtered["entries"]] == [a_id, b_id, c_id, d_id]
+
+    reader_path = client.get(f"/entries/{a_id}/path-to/{d_id}", headers=reader_headers)
+    assert reader_path.status_code == 200
+    payload = reader_path.json()
+    assert payload["hops"] == 3
+    assert [entry["id"] for entry in payload["entries"]] == [a_id, b_id, c_id, d_id]
+    assert [relation["direction"] for relation in payload["relations"]] == ["outgoing", "outgoing", "incoming"]
+    assert payload["entries"][0]["schema"]["key"] == "relation_path_case"
+
+    too_short = client.get(f"/entries/{a_id}/path-to/{d_id}", params={"max_hops": 2}, headers=reader_headers).json()
+    assert too_short["found"] is False
+    assert too_short["entries"] == []
+
+    same = client.get(f"/entries/{a_id}/path-to/{a_id}", headers=admin_headers).json()
+    assert same["found"] is True
+    assert same["hops"] == 0
+
+    index = RelationIndex()
+    index.load()
+    monkeypatch.setattr(entries_router.relation_service, "index", index)
+    indexed = client.get(f"/entries/{a_id}/path-to/{d_id}", headers=reader_headers).json()
+    assert indexed == payload
+    indexed_admin = client.get(f"/entries/{a_id}/path-to/{d_id}", headers=admin_headers).json()
+    assert indexed_admin == admin_path
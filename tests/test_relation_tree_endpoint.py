@@ -1,5 +1,8 @@
 from api.app.db import get_connection
+from api.app.repositories.metadata import RelationRepository
+from api.app.routers import entries as entries_router
 from api.app.security import create_access_token
+from api.app.services.relation_index import RelationIndex
 
 
 def _ensure_test_actor() -> None:
@@ -130,3 +133,229 @@ def test_relation_tree_endpoint_handles_cycles_without_duplicate_expansion(clien
     assert [child["entry"]["id"] for child in cycle_children] == [x_id]
     assert cycle_children[0]["is_reference"] is True
     assert cycle_children[0]["reference_reason"] == "cycle"
+
+
+def test_relation_tree_endpoint_prunes_entries_the_reader_cannot_see(client):
+    _ensure_test_actor()
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (1301, 'relation_tree_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO NOTHING;
+            """
+        )
+        conn.commit()
+    reader_headers = {"Authorization": f"Bearer {create_access_token({'id': 1301, 'role': 'reader'})}"}
+
+    schema_id = _create_schema(client, "relation_tree_access", "Relation Tree Access")
+    root_id = _create_entry(client, schema_id, "Root")
+    visible_id = _create_entry(client, schema_id, "Visible")
+    hidden_response = client.post(
+        "/entries",
+        json={
+            "schema_id": schema_id,
+            "title": "Hidden",
+            "status": "open",
+            "visibility_level": "private",
+            "data_json": {},
+        },
+    )
+    assert hidden_response.status_code == 201
+    hidden_id = hidden_response.json()["id"]
+    behind_hidden_id = _create_entry(client, schema_id, "Behind Hidden")
+
+    _create_relation(client, root_id, visible_id, 1)
+    _create_relation(client, root_id, hidden_id, 2)
+    _create_relation(client, hidden_id, behind_hidden_id, 1)
+
+    admin_tree = client.get(f"/entries/{root_id}/relation-tree", headers=_auth_headers()).json()["tree"]
+    assert [child["entry"]["id"] for child in admin_tree["children"]] == [visible_id, hidden_id]
+    assert [child["entry"]["id"] for child in admin_tree["children"][1]["children"]] == [behind_hidden_id]
+
+    response = client.get(f"/entries/{root_id}/relation-tree", headers=reader_headers)
+    assert response.status_code == 200
+    reader_tree = response.json()["tree"]
+    assert [child["entry"]["id"] for child in reader_tree["children"]] == [visible_id]
+    assert reader_tree["children"][0]["children"] == []
+
+
+def test_relation_tree_is_depth_and_node_limited_and_lazily_expandable(client):
+    _ensure_test_actor()
+    auth_headers = _auth_headers()
+
+    schema_id = _create_schema(client, "relation_tree_limits", "Relation Tree Limits")
+    root_id = _create_entry(client, schema_id, "Root")
+    a_id = _create_entry(client, schema_id, "A")
+    b_id = _create_entry(client, schema_id, "B")
+    c_id = _create_entry(client, schema_id, "C")
+    d_id = _create_entry(client, schema_id, "D")
+    e_id = _create_entry(client, schema_id, "E")
+
+    _create_relation(client, root_id, a_id, 1)
+    _create_relation(client, root_id, b_id, 2)
+    _create_relation(client, root_id, c_id, 3)
+    _create_relation(client, a_id, d_id, 1)
+    _create_relation(client, d_id, e_id, 1)
+
+    shallow = client.get(f"/entries/{root_id}/relation-tree", params={"max_depth": 1}, headers=auth_headers).json()["tree"]
+    assert shallow["child_count"] == 3
+    assert [child["entry"]["id"] for child in shallow["children"]] == [a_id, b_id, c_id]
+    a_node, b_node, _ = shallow["children"]
+    assert a_node["children"] == []
+    assert a_node["is_expandable"] is True
+    assert a_node["child_count"] == 1
+    assert b_node["is_expandable"] is False
+    assert b_node["child_count"] == 0
+
+    deeper = client.get(f"/entries/{root_id}/relation-tree", params={"max_depth": 2}, headers=auth_headers).json()["tree"]
+    d_node = deeper["children"][0]["children"][0]
+    assert d_node["entry"]["id"] == d_id
+    assert d_node["is_expandable"] is True
+    assert d_node["child_count"] == 1
+
+    capped_root = client.get(f"/entries/{root_id}/relation-tree", params={"max_nodes": 3}, headers=auth_headers).json()["tree"]
+    assert capped_root["children"] == []
+    assert capped_root["is_expandable"] is True
+    capped = client.get(f"/entries/{root_id}/relation-tree", params={"max_nodes": 4}, headers=auth_headers).json()["tree"]
+    assert len(capped["children"]) == 3
+    assert capped["children"][0]["children"] == []
+    assert capped["children"][0]["is_expandable"] is True
+
+    first_page = client.get(f"/entries/{root_id}/relation-tree/children", params={"limit": 2}, headers=auth_headers)
+    assert first_page.status_code == 200
+    first_payload = first_page.json()
+    assert [item["entry"]["id"] for item in first_payload["items"]] == [a_id, b_id]
+    assert first_payload["items"][0]["child_count"] == 1
+    assert first_payload["items"][0]["via_relation"]["direction"] == "outgoing"
+    assert first_payload["next_cursor"] is not None
+
+    second_page = client.get(
+        f"/entries/{root_id}/relation-tree/children",
+        params={"limit": 2, "cursor": first_payload["next_cursor"]},
+        headers=auth_headers,
+    ).json()
+    assert [item["entry"]["id"] for item in second_page["items"]] == [c_id]
+    assert second_page["next_cursor"] is None
+
+    expanded = client.get(
+        f"/entries/{a_id}/relation-tree/children",
+        params={"parent_entry_id": root_id},
+        headers=auth_headers,
+    ).json()
+    assert [item["entry"]["id"] for item in expanded["items"]] == [d_id]
+    assert expanded["items"][0]["is_expandable"] is True
+
+    invalid = client.get(f"/entries/{root_id}/relation-tree/children", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert invalid.status_code == 422
+
+
+def test_relation_tree_loads_at_most_max_nodes_plus_one_entries(client):
+    _ensure_test_actor()
+    auth_headers = _auth_headers()
+
+    schema_id = _create_schema(client, "relation_tree_bounded", "Relation Tree Bounded")
+    b_child_ids = [_create_entry(client, schema_id, title) for title in ("B1", "B2")]
+    a_child_id = _create_entry(client, schema_id, "A1")
+    root_id = _create_entry(client, schema_id, "Root")
+    a_id = _create_entry(client, schema_id, "A")
+    b_id = _create_entry(client, schema_id, "B")
+
+    _create_relation(client, root_id, a_id, 1)
+    _create_relation(client, root_id, b_id, 2)
+    _create_relation(client, a_id, a_child_id, 1)
+    for b_child_id in b_child_ids:
+        _create_relation(client, b_id, b_child_id, 1)
+
+    subgraph = RelationRepository().load_reachable_subgraph(
+        root_id, max_depth=3, max_nodes=4, is_admin=True, user_id=999, role="head_admin"
+    )
+    assert sorted(entry["id"] for entry in subgraph["entries"]) == sorted([root_id, a_id, b_id, *b_child_ids])
+    assert {entry["id"]: entry["readable_degree"] for entry in subgraph["entries"]}[a_id] == 2
+
+    tree = client.get(f"/entries/{root_id}/relation-tree", params={"max_nodes": 4}, headers=auth_headers).json()["tree"]
+    a_node, b_node = tree["children"]
+    assert a_node["entry"]["id"] == a_id
+    assert a_node["children"] == []
+    assert a_node["is_expandable"] is True
+    assert a_node["child_count"] == 1
+    assert b_node["children"] == []
+    assert b_node["child_count"] == 2
+
+    full = client.get(f"/entries/{root_id}/relation-tree", headers=auth_headers).json()["tree"]
+    assert [child["entry"]["id"] for child in full["children"][0]["children"]] == [a_child_id]
+
+
+def test_relation_endpoints_read_neighbors_from_a_ready_relation_index(client, monkeypatch):
+    _ensure_test_actor()
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (1302, 'relation_index_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO NOTHING;
+            """
+        )
+        conn.commit()
+    admin_headers = _auth_headers()
+    reader_headers = {"Authorization": f"Bearer {create_access_token({'id': 1302, 'role': 'reader'})}"}
+
+    schema_id = _create_schema(client, "relation_tree_indexed", "Relation Tree Indexed")
+    root_id = _create_entry(client, schema_id, "Root")
+    a_id = _create_entry(client, schema_id, "A")
+    b_id = _create_entry(client, schema_id, "B")
+    c_id = _create_entry(client, schema_id, "C")
+    d_id = _create_entry(client, schema_id, "D")
+    hidden = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": "Hidden", "status": "open", "visibility_level": "private", "data_json": {}},
+    )
+    assert hidden.status_code == 201
+    hidden_id = hidden.json()["id"]
+    _create_relation(client, root_id, a_id, 1)
+    _create_relation(client, root_id, b_id, 2)
+    _create_relation(client, c_id, root_id, 3)
+    _create_relation(client, root_id, hidden_id, 4)
+    _create_relation(client, a_id, d_id, 1)
+    _create_relation(client, b_id, d_id, 1)
+    _create_relation(client, hidden_id, d_id, 1)
+
+    requests = [
+        (f"/entries/{root_id}/relations", {}),
+        (f"/entries/{root_id}/relation-tree", {}),
+        (f"/entries/{root_id}/relation-tree", {"max_nodes": 4}),
+        (f"/entries/{root_id}/relation-tree", {"max_depth": 1}),
+        (f"/entries/{root_id}/relation-tree/children", {"limit": 2}),
+        (f"/entries/{a_id}/relation-tree/children", {"parent_entry_id": root_id}),
+    ]
+
+    def fetch_all() -> list:
+        responses = []
+        for headers in (admin_headers, reader_headers):
+            for path, params in requests:
+                response = client.get(path, params=params, headers=headers)
+                assert response.status_code == 200, response.json()
+                responses.append(response.json())
+            first_page = client.get(f"/entries/{root_id}/relation-tree/children", params={"limit": 2}, headers=headers).json()
+            second_page = client.get(
+                f"/entries/{root_id}/relation-tree/children",
+                params={"limit": 2, "cursor": first_page["next_cursor"]},
+                headers=headers,
+            )
+            responses.append(second_page.json())
+        return responses
+
+    from_sql = fetch_all()
+    reader_tree = from_sql[len(requests) + 2]["tree"]
+    assert [child["entry"]["id"] for child in reader_tree["children"]] == [a_id, b_id, c_id]
+
+    index = RelationIndex()
+    index.load()
+    monkeypatch.setattr(entries_router.relation_service, "index", index)
+
+    def no_sql(*args, **kwargs):
+        raise AssertionError("relation neighbors should come from the index")
+
+    for name in ("list_relations", "load_reachable_subgraph", "list_relation_children"):
+        monkeypatch.setattr(entries_router.relation_service.relations, name, no_sql)
+    assert fetch_all() == from_sql
@@ -0,0 +1,131 @@
+from api.app.db import get_connection
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _run(client, saved_query_id: int, **kwargs):
+    response = client.get(f"/saved-queries/{saved_query_id}/entries", **kwargs)
+    assert response.status_code == 200, response.json()
+    payload = response.json()
+    return payload["refresh"], [entry["title"] for entry in payload["entries"]], payload
+
+
+def test_saved_queries_cache_and_incrementally_refresh_results(client):
+    _ensure_test_actor()
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "saved_query_case",
+            "name": "Saved Query Case",
+            "description": "Schema for saved query test",
+            "icon": "bookmark",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    for key, data_type in (("score", "integer"), ("note", "text")):
+        response = client.post(
+            f"/schemas/{schema_id}/fields",
+            json={"key": key, "label": key.title(), "data_type": data_type},
+        )
+        assert response.status_code == 201
+
+    entry_ids = {}
+    for title, score in (("A", 5), ("B", 20), ("C", 1)):
+        response = client.post(
+            "/entries",
+            json={
+                "schema_id": schema_id,
+                "title": title,
+                "status": "open",
+                "visibility_level": "public",
+                "data_json": {"score": score, "note": title.lower()},
+            },
+        )
+        assert response.status_code == 201
+        entry_ids[title] = response.json()["id"]
+
+    created = client.post(
+        "/saved-queries",
+        json={"schema_id": schema_id, "name": "High scores", "filters": ["score:gte:5"], "sort": "-score", "fields": ["title", "score"]},
+    )
+    assert created.status_code == 201, created.json()
+    saved_query = created.json()
+    assert saved_query["owner_id"] == 999 and saved_query["role"] is None
+
+    refresh, titles, payload = _run(client, saved_query["id"])
+    assert (refresh, titles) == ("full", ["B", "A"])
+    assert payload["entries"][0] == {"id": entry_ids["B"], "title": "B", "data_json": {"score": 20}}
+    assert _run(client, saved_query["id"])[:2] == ("cache", ["B", "A"])
+
+    assert client.patch(f"/entries/{entry_ids['C']}", json={"data_json": {"score": 50}}).status_code == 200
+    assert _run(client, saved_query["id"])[:2] == ("incremental", ["C", "B", "A"])
+
+    assert client.patch(f"/entries/{entry_ids['B']}", json={"deleted_at": "2026-01-01T00:00:00Z"}).status_code == 200
+    added = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": "D", "status": "open", "visibility_level": "public", "data_json": {"score": 7}},
+    )
+    assert added.status_code == 201
+    assert _run(client, saved_query["id"])[:2] == ("incremental", ["C", "D", "A"])
+    assert _run(client, saved_query["id"])[:2] == ("cache", ["C", "D", "A"])
+
+    updated = client.patch(f"/saved-queries/{saved_query['id']}", json={"sort": "score"})
+    assert updated.status_code == 200
+    assert _run(client, saved_query["id"])[:2] == ("full", ["A", "D", "C"])
+
+    hidden = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": "E", "status": "open", "visibility_level": "private", "data_json": {"score": 9}},
+    )
+    assert hidden.status_code == 201
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute("UPDATE entries SET owner_id = NULL WHERE id = %s;", (hidden.json()["id"],))
+        conn.commit()
+    assert _run(client, saved_query["id"])[1] == ["A", "D", "E", "C"]
+    refresh, titles, payload = _run(client, saved_query["id"], params={"limit": 2, "offset": 1}, headers={"X-Test-Role": "reader"})
+    assert (refresh, titles) == ("cache", ["D", "C"])
+    assert (payload["limit"], payload["offset"], payload["total"]) == (2, 1, 3)
+    past_end = _run(client, saved_query["id"], params={"offset": 5})[2]
+    assert (past_end["entries"], past_end["total"]) == ([], 4)
+
+    shared = client.post(
+        "/saved-queries",
+        json={"schema_id": schema_id, "name": "Managers", "role": "manager", "filters": ["note:eq:a"]},
+    )
+    assert shared.status_code == 201
+    shared_id = shared.json()["id"]
+    assert _run(client, shared_id, headers={"X-Test-Role": "manager"})[1] == ["A"]
+    assert client.get(f"/saved-queries/{shared_id}", headers={"X-Test-Role": "reader"}).status_code == 403
+    listed = client.get(f"/saved-queries?schema_id={schema_id}", headers={"X-Test-Role": "reader"}).json()
+    assert [item["name"] for item in listed] == ["High scores"]
+
+    for payload in (
+        {"schema_id": schema_id, "name": "Bad filter", "filters": ["missing:eq:1"]},
+        {"schema_id": schema_id, "name": "Bad fields", "fields": ["missing"]},
+        {"schema_id": schema_id, "name": "Bad role", "role": "nobody"},
+    ):
+        assert client.post("/saved-queries", json=payload).status_code == 422, payload
+    assert (
+        client.post(
+            "/saved-queries",
+            json={"schema_id": schema_id, "name": "Other role", "role": "editor"},
+            headers={"X-Test-Role": "reader"},
+        ).status_code
+        == 403
+    )
+
+    assert client.delete(f"/saved-queries/{saved_query['id']}").status_code == 200
+    assert client.get(f"/saved-queries/{saved_query['id']}").status_code == 404
@@ -0,0 +1,110 @@
+from api.app.db import get_connection
+from api.app.security import create_access_token
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def test_schema_aggregate_groups_and_filters_in_sql(client):
+    _ensure_test_actor()
+    admin_headers = {"Authorization": f"Bearer {create_access_token({'id': 999, 'role': 'head_admin'})}"}
+
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "schema_aggregate_case",
+            "name": "Schema Aggregate Case",
+            "description": "Schema for aggregate endpoint test",
+            "icon": "bar-chart",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    for key, data_type, extra in (
+        ("stage", "select", {"validation_json": {"options": ["new", "done"]}, "settings_json": {"promoted": True}}),
+        ("amount", "decimal", {"settings_json": {"promoted": True}}),
+        ("qty", "integer", {}),
+        ("due", "date", {}),
+        ("note", "text", {}),
+    ):
+        response = client.post(
+            f"/schemas/{schema_id}/fields",
+            json={"key": key, "label": key.title(), "data_type": data_type, **extra},
+        )
+        assert response.status_code == 201
+
+    for title, visibility, data in (
+        ("A", "public", {"stage": "new", "amount": "10.5", "qty": 1, "due": "2026-01-05", "note": "x"}),
+        ("B", "public", {"stage": "new", "amount": "4.5", "qty": 3, "due": "2026-01-20", "note": "y"}),
+        ("C", "public", {"stage": "done", "amount": "100", "qty": 2, "due": "2026-02-01", "note": "z"}),
+        ("D", "private", {"stage": "done", "amount": "1", "qty": 7, "due": "2026-02-03", "note": "w"}),
+    ):
+        response = client.post(
+            "/entries",
+            json={"schema_id": schema_id, "title": title, "status": "open", "visibility_level": visibility, "data_json": data},
+        )
+        assert response.status_code == 201
+
+    url = f"/schemas/{schema_id}/aggregate?metric=count&metric=sum:amount&metric=max:qty&group_by=stage"
+    anonymous = client.get(url)
+    assert anonymous.status_code == 200
+    payload = anonymous.json()
+    assert payload["group_by"] == ["stage"]
+    assert payload["metrics"] == ["count", "sum:amount", "max:qty"]
+    groups = {group["keys"]["stage"]: group["values"] for group in payload["groups"]}
+    assert groups["new"]["count"] == 2
+    assert float(groups["new"]["sum:amount"]) == 15.0
+    assert groups["new"]["max:qty"] == "3"
+    assert groups["done"]["count"] == 1
+
+    admin = {group["keys"]["stage"]: group["values"] for group in client.get(url, headers=admin_headers).json()["groups"]}
+    assert admin["done"]["count"] == 2
+    assert admin["done"]["max:qty"] == "7"
+
+    by_month = client.get(
+        f"/schemas/{schema_id}/aggregate?metric=avg:qty&group_by=due:month&group_by=stage&filter=qty:gte:2",
+        headers=admin_headers,
+    ).json()
+    assert [(group["keys"]["due:month"], group["keys"]["stage"]) for group in by_month["groups"]] == [
+        ("2026-01-01", "new"),
+        ("2026-02-01", "done"),
+    ]
+    assert float(by_month["groups"][1]["values"]["avg:qty"]) == 4.5
+
+    total = client.get(f"/schemas/{schema_id}/aggregate?metric=min:due&metric=count", headers=admin_headers).json()
+    assert total["groups"] == [{"keys": {}, "values": {"min:due": "2026-01-05", "count": 4}}]
+    latest = client.get(f"/schemas/{schema_id}/aggregate?metric=max:due&group_by=stage", headers=admin_headers).json()
+    assert [group["values"]["max:due"] for group in latest["groups"]] == ["2026-02-03", "2026-01-20"]
+
+    for query in (
+        "metric=sum:note",
+        "metric=median:qty",
+        "group_by=note",
+        "group_by=due:hour",
+        "group_by=stage:month",
+        "group_by=missing",
+    ):
+        assert client.get(f"/schemas/{schema_id}/aggregate?{query}").status_code == 422, query
+
+    note_field = next(field for field in client.get(f"/schemas/{schema_id}").json()["fields"] if field["key"] == "note")
+    retyped = client.patch(f"/schemas/{schema_id}/fields/{note_field['id']}", json={"data_type": "boolean"})
+    assert retyped.status_code == 200
+    response = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": "E", "status": "open", "visibility_level": "public", "data_json": {"note": True}},
+    )
+    assert response.status_code == 201
+    by_note = client.get(f"/schemas/{schema_id}/aggregate?metric=count&group_by=note", headers=admin_headers)
+    assert by_note.status_code == 200
+    assert [(group["keys"]["note"], group["values"]["count"]) for group in by_note.json()["groups"]] == [(True, 1), (None, 4)]
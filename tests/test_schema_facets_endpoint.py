@@ -0,0 +1,91 @@
+from api.app.db import get_connection
+from api.app.security import create_access_token
+
+
+def _ensure_test_actor() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET role = EXCLUDED.role, is_active = EXCLUDED.is_active;
+            """
+        )
+        conn.commit()
+
+
+def _counts(facet: dict) -> dict:
+    return {value["value"]: value["count"] for value in facet["values"]}
+
+
+def test_schema_facets_count_select_and_multi_select_options(client):
+    _ensure_test_actor()
+    admin_headers = {"Authorization": f"Bearer {create_access_token({'id': 999, 'role': 'head_admin'})}"}
+
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "schema_facets_case",
+            "name": "Schema Facets Case",
+            "description": "Schema for facets endpoint test",
+            "icon": "filter",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    for key, data_type, extra in (
+        ("stage", "select", {"validation_json": {"options": ["new", "active", "done"]}}),
+        ("tags", "multi_select", {"validation_json": {"options": ["red", "blue", "green"]}}),
+        ("qty", "integer", {}),
+    ):
+        response = client.post(
+            f"/schemas/{schema_id}/fields",
+            json={"key": key, "label": key.title(), "data_type": data_type, **extra},
+        )
+        assert response.status_code == 201
+
+    for title, status, visibility, data in (
+        ("A", "active", "public", {"stage": "new", "tags": ["red", "blue"], "qty": 1}),
+        ("B", "active", "public", {"stage": "new", "tags": ["red"], "qty": 5}),
+        ("C", "draft", "public", {"stage": "active", "tags": [], "qty": 3}),
+        ("D", "active", "private", {"stage": "done", "tags": ["blue"], "qty": 9}),
+    ):
+        response = client.post(
+            "/entries",
+            json={"schema_id": schema_id, "title": title, "status": status, "visibility_level": visibility, "data_json": data},
+        )
+        assert response.status_code == 201
+
+    anonymous = client.get(f"/schemas/{schema_id}/facets")
+    assert anonymous.status_code == 200
+    payload = anonymous.json()
+    assert payload["total"] == 3
+    assert payload["status"] == [{"value": "active", "count": 2}, {"value": "draft", "count": 1}]
+    facets = {facet["field_key"]: facet for facet in payload["facets"]}
+    assert set(facets) == {"stage", "tags"}
+    assert [value["value"] for value in facets["stage"]["values"]] == ["new", "active", "done"]
+    assert _counts(facets["stage"]) == {"new": 2, "active": 1, "done": 0}
+    assert _counts(facets["tags"]) == {"red": 2, "blue": 1, "green": 0}
+
+    admin = client.get(f"/schemas/{schema_id}/facets", headers=admin_headers).json()
+    assert admin["total"] == 4
+    assert _counts({"values": admin["status"]}) == {"active": 3, "draft": 1}
+    assert _counts(admin["facets"][1]) == {"red": 2, "blue": 2, "green": 0}
+
+    filtered = client.get(f"/schemas/{schema_id}/facets?filter=qty:gte:3", headers=admin_headers).json()
+    assert filtered["total"] == 3
+    assert _counts(filtered["facets"][0]) == {"new": 1, "active": 1, "done": 1}
+
+    response = client.post(
+        "/entries",
+        json={"schema_id": schema_id, "title": "E", "status": "active", "visibility_level": "public", "data_json": {"stage": "done", "tags": ["green"]}},
+    )
+    assert response.status_code == 201
+    refreshed = client.get(f"/schemas/{schema_id}/facets").json()
+    assert refreshed["total"] == 4
+    assert _counts(refreshed["facets"][1])["green"] == 1
+
+    assert client.get(f"/schemas/{schema_id}/facets?filter=missing:eq:1").status_code == 422
+    assert client.get("/schemas/999999/facets").status_code == 404
@@ -0,0 +1,88 @@
+from api.app.db import get_connection
+from api.app.repositories.metadata import SchemaStatsRepository
+from api.app.security import create_access_token
+
+
+def _ensure_users() -> None:
+    with get_connection() as conn, conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (id, username, password_hash, role, is_active, preferences)
+            VALUES
+                (999, 'test_head_admin', 'test-hash', 'head_admin', TRUE, '{}'::jsonb),
+                (1201, 'stats_reader', 'test-hash', 'reader', TRUE, '{}'::jsonb)
+            ON CONFLICT (id) DO UPDATE SET
+                username = EXCLUDED.username,
+                password_hash = EXCLUDED.password_hash,
+                role = EXCLUDED.role,
+                is_active = EXCLUDED.is_active,
+                preferences = EXCLUDED.preferences;
+            """
+        )
+        conn.commit()
+
+
+def _create_entry(client, schema_id: int, title: str, status: str, visibility_level: str, owner_id=None) -> int:
+    payload = {
+        "schema_id": schema_id,
+        "title": title,
+        "status": status,
+        "visibility_level": visibility_level,
+        "data_json": {},
+    }
+    if owner_id is not None:
+        payload["owner_id"] = owner_id
+    response = client.post("/entries", json=payload)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_schema_stats_are_maintained_on_entry_writes_and_match_rebuild(client):
+    _ensure_users()
+
+    schema_resp = client.post(
+        "/schemas",
+        json={
+            "key": "schema_stats_case",
+            "name": "Schema Stats Case",
+            "description": "Schema for statistics test",
+            "icon": "bar-chart",
+            "is_active": True,
+        },
+    )
+    assert schema_resp.status_code == 201
+    schema_id = schema_resp.json()["id"]
+
+    first_id = _create_entry(client, schema_id, "First", "draft", "internal")
+    second_id = _create_entry(client, schema_id, "Second", "draft", "public")
+    _create_entry(client, schema_id, "Third", "active", "private")
+    _create_entry(client, schema_id, "Owned Private", "active", "private", owner_id=1201)
+
+    assert client.patch(f"/entries/{first_id}", json={"status": "active"}).status_code == 200
+    assert client.patch(f"/entries/{second_id}", json={"visibility_level": "restricted"}).status_code == 200
+    assert client.patch(f"/entries/{second_id}", json={"deleted_at": "2026-01-01T00:00:00Z"}).status_code == 200
+
+    response = client.get(f"/schemas/{schema_id}")
+    assert response.status_code == 200
+    stats = response.json()["stats"]
+    assert stats["total_entries"] == 3
+    assert stats["status_counts"] == {"active": 3}
+    assert stats["visibility_counts"] == {"internal": 1, "private": 2}
+    assert stats["last_created_at"] is not None
+    assert stats["last_updated_at"] is not None
+
+    repository = SchemaStatsRepository()
+    maintained = repository.get_stats(schema_id)
+    repository.rebuild()
+    assert repository.get_stats(schema_id) == maintained
+
+    reader_headers = {"Authorization": f"Bearer {create_access_token({'id': 1201, 'role': 'reader'})}"}
+    dashboard = client.get("/dashboard", headers=reader_headers)
+    assert dashboard.status_code == 200
+    totals = {row["schema_key"]: row for row in dashboard.json()["totals_per_schema"]}
+    assert totals["schema_stats_case"]["total_entries"] == 2
+
+    anonymous_dashboard = client.get("/dashboard")
+    assert anonymous_dashboard.status_code == 200
+    anonymous_totals = {row["schema_key"] for row in anonymous_dashboard.json()["totals_per_schema"]}
+    assert "schema_stats_case" not in anonymous_totals